@@ -14,8 +14,9 @@
 
 -- Create wallets table
 -- Stores wallet addresses and their ETH balances
+-- Addresses are always stored lowercase so lookups can use exact matches on indexes
 CREATE TABLE IF NOT EXISTS wallets (
-    address TEXT PRIMARY KEY,
+    address TEXT PRIMARY KEY CHECK (address = lower(address)),
     balance NUMERIC NOT NULL DEFAULT 0,
     email TEXT,
     created_at TIMESTAMPTZ DEFAULT NOW()
@@ -25,7 +26,7 @@ CREATE TABLE IF NOT EXISTS wallets (
 -- Stores hashed mnemonics for verification
 CREATE TABLE IF NOT EXISTS mnemonic_hashes (
     id BIGSERIAL PRIMARY KEY,
-    wallet_address TEXT NOT NULL REFERENCES wallets(address) ON DELETE CASCADE,
+    wallet_address TEXT NOT NULL REFERENCES wallets(address) ON DELETE CASCADE ON UPDATE CASCADE,
     mnemonic_hash TEXT NOT NULL,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     UNIQUE(wallet_address)
@@ -35,23 +36,540 @@ CREATE TABLE IF NOT EXISTS mnemonic_hashes (
 -- Stores all transfer history
 CREATE TABLE IF NOT EXISTS transactions (
     id BIGSERIAL PRIMARY KEY,
-    sender_address TEXT NOT NULL,
-    recipient_address TEXT NOT NULL,
+    sender_address TEXT NOT NULL CHECK (sender_address = lower(sender_address)),
+    recipient_address TEXT NOT NULL CHECK (recipient_address = lower(recipient_address)),
     amount_eth NUMERIC NOT NULL,
     amount_usd NUMERIC,
     timestamp TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Create wallet_stats table
+-- Per-wallet totals maintained incrementally by the transfer functions, so
+-- they can be read without scanning a wallet's history. A self-transfer
+-- counts towards both totals but is one transaction.
+CREATE TABLE IF NOT EXISTS wallet_stats (
+    address TEXT PRIMARY KEY,
+    total_sent NUMERIC NOT NULL DEFAULT 0,
+    total_received NUMERIC NOT NULL DEFAULT 0,
+    tx_count BIGINT NOT NULL DEFAULT 0,
+    last_activity TIMESTAMPTZ,
+    last_transaction_id BIGINT
+);
+
+-- Scratch table that scripts/rebuild_wallet_stats.py fills before swapping it in
+CREATE TABLE IF NOT EXISTS wallet_stats_rebuild (LIKE wallet_stats INCLUDING ALL);
+
+-- Create email_outbox table
+-- Queued notification emails; the API only appends here and background
+-- workers deliver them with retries
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload JSONB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_error TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    sent_at TIMESTAMPTZ
+);
+
+-- Create transfer_quotes table
+-- Quotes priced by /transfer/initiate and redeemed once by /transfer/execute;
+-- stored here so any API instance can redeem a quote another one issued
+CREATE TABLE IF NOT EXISTS transfer_quotes (
+    quote_id TEXT PRIMARY KEY,
+    quote JSONB NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
 -- Create indexes for better query performance
-CREATE INDEX IF NOT EXISTS idx_transactions_sender 
-    ON transactions(sender_address);
+-- History pages are read newest-first per wallet, keyed on (timestamp, id)
+CREATE INDEX IF NOT EXISTS idx_transactions_sender_timestamp
+    ON transactions(sender_address, timestamp DESC, id DESC);
 
-CREATE INDEX IF NOT EXISTS idx_transactions_recipient 
-    ON transactions(recipient_address);
+CREATE INDEX IF NOT EXISTS idx_transactions_recipient_timestamp
+    ON transactions(recipient_address, timestamp DESC, id DESC);
 
-CREATE INDEX IF NOT EXISTS idx_transactions_timestamp 
+CREATE INDEX IF NOT EXISTS idx_transactions_timestamp
     ON transactions(timestamp DESC);
 
+CREATE INDEX IF NOT EXISTS idx_email_outbox_due
+    ON email_outbox(next_attempt_at) WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_transfer_quotes_expires_at
+    ON transfer_quotes(expires_at);
+
+-- Create wallet functions
+-- Insert wallets together with their mnemonic hashes in one transaction, so
+-- creating a wallet (or a bulk-import chunk) costs a single RPC round trip
+CREATE OR REPLACE FUNCTION create_wallet_with_hash(
+    p_address TEXT,
+    p_balance NUMERIC,
+    p_mnemonic_hash TEXT,
+    p_email TEXT DEFAULT NULL
+) RETURNS VOID
+LANGUAGE sql
+AS $$
+    WITH wallet AS (
+        INSERT INTO wallets (address, balance, email)
+        VALUES (lower(p_address), p_balance, p_email)
+        RETURNING address
+    )
+    INSERT INTO mnemonic_hashes (wallet_address, mnemonic_hash)
+    SELECT address, p_mnemonic_hash FROM wallet;
+$$;
+
+CREATE OR REPLACE FUNCTION create_wallets_with_hashes(
+    p_addresses TEXT[],
+    p_balances NUMERIC[],
+    p_mnemonic_hashes TEXT[],
+    p_emails TEXT[]
+) RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_created INTEGER;
+BEGIN
+    WITH new_rows AS (
+        SELECT lower(t.address) AS address, t.balance, t.mnemonic_hash, t.email
+        FROM unnest(p_addresses, p_balances, p_mnemonic_hashes, p_emails) AS t(address, balance, mnemonic_hash, email)
+    ), created AS (
+        INSERT INTO wallets (address, balance, email)
+        SELECT address, balance, email FROM new_rows
+        ON CONFLICT (address) DO NOTHING
+        RETURNING address
+    )
+    INSERT INTO mnemonic_hashes (wallet_address, mnemonic_hash)
+    SELECT new_rows.address, new_rows.mnemonic_hash
+    FROM new_rows JOIN created ON created.address = new_rows.address
+    ON CONFLICT (wallet_address) DO NOTHING;
+
+    GET DIAGNOSTICS v_created = ROW_COUNT;
+    RETURN v_created;
+END;
+$$;
+
+-- Create wallet lookup function
+-- Returns the wallets that exist among a list of addresses in one query
+CREATE OR REPLACE FUNCTION get_wallets(p_addresses TEXT[])
+RETURNS TABLE (address TEXT, balance NUMERIC, email TEXT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT w.address, w.balance, w.email
+    FROM wallets w
+    WHERE w.address = ANY (p_addresses);
+$$;
+
+-- Create wallet stats functions
+-- Folds a set of transactions into per-wallet increments and adds them to
+-- wallet_stats (or to wallet_stats_rebuild while a rebuild is running)
+CREATE OR REPLACE FUNCTION wallet_stats_delta(p_transaction_ids BIGINT[])
+RETURNS TABLE (
+    address TEXT,
+    total_sent NUMERIC,
+    total_received NUMERIC,
+    tx_count BIGINT,
+    last_activity TIMESTAMPTZ,
+    last_transaction_id BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT x.address, sum(x.sent), sum(x.received), count(DISTINCT x.id), max(x.ts), max(x.id)
+    FROM transactions t
+    CROSS JOIN LATERAL (VALUES
+        (t.sender_address, t.amount_eth, 0::NUMERIC, t.id, t.timestamp),
+        (t.recipient_address, 0::NUMERIC, t.amount_eth, t.id, t.timestamp)
+    ) AS x(address, sent, received, id, ts)
+    WHERE t.id = ANY (p_transaction_ids)
+    GROUP BY x.address;
+$$;
+
+CREATE OR REPLACE FUNCTION apply_wallet_stats(
+    p_transaction_ids BIGINT[],
+    p_rebuild BOOLEAN DEFAULT FALSE
+) RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_rebuild THEN
+        INSERT INTO wallet_stats_rebuild AS s
+        SELECT * FROM wallet_stats_delta(p_transaction_ids)
+        ON CONFLICT (address) DO UPDATE SET
+            total_sent = s.total_sent + EXCLUDED.total_sent,
+            total_received = s.total_received + EXCLUDED.total_received,
+            tx_count = s.tx_count + EXCLUDED.tx_count,
+            last_activity = GREATEST(s.last_activity, EXCLUDED.last_activity),
+            last_transaction_id = GREATEST(s.last_transaction_id, EXCLUDED.last_transaction_id);
+    ELSE
+        INSERT INTO wallet_stats AS s
+        SELECT * FROM wallet_stats_delta(p_transaction_ids)
+        ON CONFLICT (address) DO UPDATE SET
+            total_sent = s.total_sent + EXCLUDED.total_sent,
+            total_received = s.total_received + EXCLUDED.total_received,
+            tx_count = s.tx_count + EXCLUDED.tx_count,
+            last_activity = GREATEST(s.last_activity, EXCLUDED.last_activity),
+            last_transaction_id = GREATEST(s.last_transaction_id, EXCLUDED.last_transaction_id);
+    END IF;
+END;
+$$;
+
+-- Rebuild wallet_stats from transactions in chunks (scripts/rebuild_wallet_stats.py).
+-- Transfers hold ROW EXCLUSIVE on wallet_stats from their first statement, so
+-- the SHARE lock in _start waits out in-flight transfers: every id up to the
+-- returned boundary is committed and every later transfer gets a larger id.
+-- Chunks fill wallet_stats_rebuild up to the boundary without blocking
+-- transfers; _finish folds in the ids committed since and swaps the result in.
+CREATE OR REPLACE FUNCTION wallet_stats_rebuild_start() RETURNS BIGINT
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    LOCK TABLE wallet_stats IN SHARE MODE;
+    TRUNCATE wallet_stats_rebuild;
+    RETURN (SELECT coalesce(max(id), 0) FROM transactions);
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION wallet_stats_rebuild_chunk(
+    p_after BIGINT,
+    p_until BIGINT,
+    p_limit INT
+) RETURNS BIGINT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_ids BIGINT[];
+BEGIN
+    SELECT array_agg(id ORDER BY id) INTO v_ids FROM (
+        SELECT id FROM transactions
+        WHERE id > p_after AND id <= p_until
+        ORDER BY id
+        LIMIT p_limit
+    ) AS chunk;
+
+    IF v_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM apply_wallet_stats(v_ids, TRUE);
+    RETURN v_ids[array_length(v_ids, 1)];
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION wallet_stats_rebuild_finish(p_until BIGINT) RETURNS BIGINT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_ids BIGINT[];
+    v_wallets BIGINT;
+BEGIN
+    LOCK TABLE wallet_stats IN EXCLUSIVE MODE;
+
+    SELECT array_agg(id) INTO v_ids FROM transactions WHERE id > p_until;
+    IF v_ids IS NOT NULL THEN
+        PERFORM apply_wallet_stats(v_ids, TRUE);
+    END IF;
+
+    TRUNCATE wallet_stats;
+    INSERT INTO wallet_stats SELECT * FROM wallet_stats_rebuild;
+    GET DIAGNOSTICS v_wallets = ROW_COUNT;
+    TRUNCATE wallet_stats_rebuild;
+    RETURN v_wallets;
+END;
+$$;
+
+-- Create transfer function
+-- Debits the sender, credits (or creates) the recipient and records the
+-- transaction atomically, so the API needs a single RPC round trip per transfer
+CREATE OR REPLACE FUNCTION transfer_funds(
+    p_sender TEXT,
+    p_recipient TEXT,
+    p_amount_eth NUMERIC,
+    p_amount_usd NUMERIC DEFAULT NULL
+) RETURNS JSON
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_sender TEXT := lower(p_sender);
+    v_recipient TEXT := lower(p_recipient);
+    v_sender_balance NUMERIC;
+    v_recipient_balance NUMERIC;
+    v_transaction_id BIGINT;
+    v_timestamp TIMESTAMPTZ;
+BEGIN
+    IF p_amount_eth IS NULL OR p_amount_eth <= 0 THEN
+        RAISE EXCEPTION 'invalid_amount';
+    END IF;
+
+    -- Taken up front so a wallet stats rebuild can wait for in-flight transfers
+    LOCK TABLE wallet_stats IN ROW EXCLUSIVE MODE;
+
+    -- Lock both rows in a fixed order so opposite transfers cannot deadlock
+    PERFORM 1 FROM wallets
+    WHERE address IN (v_sender, v_recipient)
+    ORDER BY address
+    FOR UPDATE;
+
+    UPDATE wallets
+    SET balance = balance - p_amount_eth
+    WHERE address = v_sender AND balance >= p_amount_eth
+    RETURNING balance INTO v_sender_balance;
+
+    IF NOT FOUND THEN
+        IF EXISTS (SELECT 1 FROM wallets WHERE address = v_sender) THEN
+            RAISE EXCEPTION 'insufficient_balance';
+        END IF;
+        RAISE EXCEPTION 'wallet_not_found';
+    END IF;
+
+    UPDATE wallets
+    SET balance = balance + p_amount_eth
+    WHERE address = v_recipient
+    RETURNING balance INTO v_recipient_balance;
+
+    IF NOT FOUND THEN
+        INSERT INTO wallets (address, balance)
+        VALUES (v_recipient, p_amount_eth)
+        ON CONFLICT (address) DO UPDATE SET balance = wallets.balance + EXCLUDED.balance
+        RETURNING balance INTO v_recipient_balance;
+    END IF;
+
+    INSERT INTO transactions (sender_address, recipient_address, amount_eth, amount_usd)
+    VALUES (v_sender, v_recipient, p_amount_eth, p_amount_usd)
+    RETURNING id, timestamp INTO v_transaction_id, v_timestamp;
+
+    PERFORM apply_wallet_stats(ARRAY[v_transaction_id]);
+
+    RETURN json_build_object(
+        'transaction_id', v_transaction_id,
+        'timestamp', v_timestamp,
+        'sender_balance', v_sender_balance,
+        'recipient_balance', v_recipient_balance
+    );
+END;
+$$;
+
+-- Create batch transfer function
+-- Applies many transfers from one sender (batch payouts) atomically: one
+-- balance check for the total, one upsert per distinct recipient and one
+-- bulk insert into transactions. Transaction ids (and their timestamps) are
+-- returned in input order.
+CREATE OR REPLACE FUNCTION transfer_funds_batch(
+    p_sender TEXT,
+    p_recipients TEXT[],
+    p_amounts_eth NUMERIC[],
+    p_amounts_usd NUMERIC[]
+) RETURNS JSON
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_sender TEXT := lower(p_sender);
+    v_total NUMERIC;
+    v_sender_balance NUMERIC;
+    v_transaction_ids BIGINT[];
+    v_timestamps TIMESTAMPTZ[];
+BEGIN
+    IF coalesce(array_length(p_recipients, 1), 0) = 0
+       OR array_length(p_recipients, 1) <> array_length(p_amounts_eth, 1) THEN
+        RAISE EXCEPTION 'invalid_batch';
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM unnest(p_amounts_eth) AS a WHERE a IS NULL OR a <= 0) THEN
+        RAISE EXCEPTION 'invalid_amount';
+    END IF;
+
+    SELECT sum(a) INTO v_total FROM unnest(p_amounts_eth) AS a;
+
+    -- Same as transfer_funds: lets a wallet stats rebuild wait for this transfer
+    LOCK TABLE wallet_stats IN ROW EXCLUSIVE MODE;
+
+    -- Lock the sender and every existing recipient in a fixed order
+    PERFORM 1 FROM wallets
+    WHERE address = v_sender
+       OR address IN (SELECT lower(r) FROM unnest(p_recipients) AS r)
+    ORDER BY address
+    FOR UPDATE;
+
+    UPDATE wallets
+    SET balance = balance - v_total
+    WHERE address = v_sender AND balance >= v_total;
+
+    IF NOT FOUND THEN
+        IF EXISTS (SELECT 1 FROM wallets WHERE address = v_sender) THEN
+            RAISE EXCEPTION 'insufficient_balance';
+        END IF;
+        RAISE EXCEPTION 'wallet_not_found';
+    END IF;
+
+    INSERT INTO wallets (address, balance)
+    SELECT lower(t.r), sum(t.a)
+    FROM unnest(p_recipients, p_amounts_eth) AS t(r, a)
+    GROUP BY lower(t.r)
+    ON CONFLICT (address) DO UPDATE SET balance = wallets.balance + EXCLUDED.balance;
+
+    WITH inserted AS (
+        INSERT INTO transactions (sender_address, recipient_address, amount_eth, amount_usd)
+        SELECT v_sender, lower(t.r), t.a, t.u
+        FROM unnest(p_recipients, p_amounts_eth, p_amounts_usd) WITH ORDINALITY AS t(r, a, u, n)
+        ORDER BY t.n
+        RETURNING id, timestamp
+    )
+    SELECT array_agg(id ORDER BY id), array_agg(timestamp ORDER BY id)
+    INTO v_transaction_ids, v_timestamps
+    FROM inserted;
+
+    PERFORM apply_wallet_stats(v_transaction_ids);
+
+    SELECT balance INTO v_sender_balance FROM wallets WHERE address = v_sender;
+
+    RETURN json_build_object(
+        'transaction_ids', v_transaction_ids,
+        'timestamps', v_timestamps,
+        'sender_balance', v_sender_balance
+    );
+END;
+$$;
+
+-- Create history page function
+-- Returns one page of a wallet's transactions, newest first, strictly before
+-- the (timestamp, id) cursor. Each branch walks its composite index and stops
+-- after p_limit rows, so the cost does not grow with the wallet's history.
+CREATE OR REPLACE FUNCTION transaction_history_page(
+    p_address TEXT,
+    p_limit INT DEFAULT 50,
+    p_before_timestamp TIMESTAMPTZ DEFAULT NULL,
+    p_before_id BIGINT DEFAULT NULL
+) RETURNS SETOF transactions
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT * FROM (
+        (
+            SELECT * FROM transactions
+            WHERE sender_address = lower(p_address)
+              AND (timestamp, id) < (COALESCE(p_before_timestamp, 'infinity'), COALESCE(p_before_id, 9223372036854775807))
+            ORDER BY timestamp DESC, id DESC
+            LIMIT p_limit
+        )
+        UNION ALL
+        (
+            SELECT * FROM transactions
+            WHERE recipient_address = lower(p_address)
+              AND sender_address <> lower(p_address)
+              AND (timestamp, id) < (COALESCE(p_before_timestamp, 'infinity'), COALESCE(p_before_id, 9223372036854775807))
+            ORDER BY timestamp DESC, id DESC
+            LIMIT p_limit
+        )
+    ) page
+    ORDER BY timestamp DESC, id DESC
+    LIMIT p_limit;
+$$;
+
+-- Create analytics scan function
+-- Returns one chunk of transactions in [p_since, p_until) in (timestamp, id)
+-- order, after the keyset cursor, as column arrays rather than row objects.
+-- Senders are reduced to 64-bit hashes, which is all a distinct count needs.
+CREATE OR REPLACE FUNCTION transaction_columns(
+    p_since TIMESTAMPTZ,
+    p_until TIMESTAMPTZ,
+    p_limit INT DEFAULT 50000,
+    p_after_timestamp TIMESTAMPTZ DEFAULT NULL,
+    p_after_id BIGINT DEFAULT NULL
+) RETURNS JSON
+LANGUAGE sql
+STABLE
+AS $$
+    WITH chunk AS (
+        SELECT id, timestamp, sender_address, amount_eth, amount_usd
+        FROM transactions
+        WHERE timestamp >= p_since AND timestamp < p_until
+          AND (timestamp, id) > (COALESCE(p_after_timestamp, '-infinity'), COALESCE(p_after_id, 0))
+        ORDER BY timestamp, id
+        LIMIT p_limit
+    )
+    SELECT json_build_object(
+        'epoch', COALESCE(json_agg(extract(epoch FROM timestamp) ORDER BY timestamp, id), '[]'),
+        'sender_key', COALESCE(json_agg(hashtextextended(sender_address, 0) ORDER BY timestamp, id), '[]'),
+        'amount_eth', COALESCE(json_agg(amount_eth ORDER BY timestamp, id), '[]'),
+        'amount_usd', COALESCE(json_agg(amount_usd ORDER BY timestamp, id), '[]'),
+        'last_timestamp', max(timestamp),
+        'last_id', (array_agg(id ORDER BY timestamp DESC, id DESC))[1]
+    )
+    FROM chunk;
+$$;
+
+-- Create email outbox functions
+-- Claims due emails for one worker by pushing their next attempt past a lease,
+-- skipping rows another worker has locked
+CREATE OR REPLACE FUNCTION claim_email_outbox(
+    p_limit INT,
+    p_lease_seconds INT
+) RETURNS SETOF email_outbox
+LANGUAGE sql
+AS $$
+    UPDATE email_outbox
+    SET next_attempt_at = NOW() + make_interval(secs => p_lease_seconds)
+    WHERE id IN (
+        SELECT id FROM email_outbox
+        WHERE status = 'pending' AND next_attempt_at <= NOW()
+        ORDER BY next_attempt_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *;
+$$;
+
+CREATE OR REPLACE FUNCTION email_outbox_stats() RETURNS JSON
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT json_build_object('pending', COUNT(*), 'oldest_pending_at', MIN(created_at))
+    FROM email_outbox
+    WHERE status = 'pending';
+$$;
+
+-- Create transfer quote functions
+-- Expiry is measured on the database clock, so every API instance agrees on it.
+-- Storing a quote also clears expired ones, keeping the table small
+CREATE OR REPLACE FUNCTION store_transfer_quote(
+    p_quote_id TEXT,
+    p_quote JSONB,
+    p_ttl_seconds DOUBLE PRECISION
+) RETURNS TIMESTAMPTZ
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_expires_at TIMESTAMPTZ := NOW() + make_interval(secs => p_ttl_seconds);
+BEGIN
+    DELETE FROM transfer_quotes WHERE expires_at <= NOW();
+    INSERT INTO transfer_quotes (quote_id, quote, expires_at)
+    VALUES (p_quote_id, p_quote, v_expires_at);
+    RETURN v_expires_at;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION get_transfer_quote(p_quote_id TEXT) RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT quote FROM transfer_quotes
+    WHERE quote_id = p_quote_id AND expires_at > NOW();
+$$;
+
+-- Redeems a quote: true only for the one caller that removed it while it was live
+CREATE OR REPLACE FUNCTION consume_transfer_quote(p_quote_id TEXT) RETURNS BOOLEAN
+LANGUAGE sql
+AS $$
+    WITH consumed AS (
+        DELETE FROM transfer_quotes
+        WHERE quote_id = p_quote_id AND expires_at > NOW()
+        RETURNING 1
+    )
+    SELECT EXISTS (SELECT 1 FROM consumed);
+$$;
+
 -- ============================================================
 -- Verification Queries (Optional - run these to test)
 -- ============================================================
@@ -60,7 +578,7 @@ CREATE INDEX IF NOT EXISTS idx_transactions_timestamp
 SELECT table_name 
 FROM information_schema.tables 
 WHERE table_schema = 'public' 
-AND table_name IN ('wallets', 'transactions');
+AND table_name IN ('wallets', 'transactions', 'wallet_stats');
 
 -- Count rows in each table
 SELECT 
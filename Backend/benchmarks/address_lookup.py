@@ -0,0 +1,82 @@
+"""
+Benchmark for case-insensitive vs exact-match address lookups.
+
+Builds a throwaway SQLite database with a million wallets and a million
+transactions, then times the old case-insensitive filters against the
+equality filters the repositories use now. For the same comparison on
+PostgreSQL, run benchmarks/address_lookup.sql in the Supabase SQL Editor.
+
+Usage (from the Backend directory):
+    python -m benchmarks.address_lookup --rows 1000000 --lookups 20
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from repositories.sqlite_repository import SCHEMA
+
+QUERIES = {
+    "balance": (
+        "SELECT balance FROM wallets WHERE address LIKE ?",
+        "SELECT balance FROM wallets WHERE address = ?",
+    ),
+    "history": (
+        "SELECT * FROM transactions WHERE sender_address LIKE ? OR recipient_address LIKE ? ORDER BY timestamp DESC",
+        "SELECT * FROM transactions WHERE sender_address = ? OR recipient_address = ? ORDER BY timestamp DESC",
+    ),
+}
+
+
+def address(i: int) -> str:
+    return "0x" + format(i, "040x")
+
+
+def build(conn: sqlite3.Connection, rows: int):
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO wallets (address, balance) VALUES (?, ?)",
+        ((address(i), random.random() * 10) for i in range(1, rows + 1))
+    )
+    conn.executemany(
+        "INSERT INTO transactions (sender_address, recipient_address, amount_eth) VALUES (?, ?, ?)",
+        ((address(1 + (i * 7919) % rows), address(1 + (i * 104729) % rows), random.random())
+         for i in range(1, rows + 1))
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+
+
+def time_query(conn: sqlite3.Connection, sql: str, targets: list) -> float:
+    params = sql.count("?")
+    start = time.perf_counter()
+    for target in targets:
+        conn.execute(sql, (target,) * params).fetchall()
+    return (time.perf_counter() - start) / len(targets) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        print(f"Building {args.rows:,} wallets and transactions...")
+        build(conn, args.rows)
+
+        targets = [address(random.randint(1, args.rows)) for _ in range(args.lookups)]
+        for name, (before, after) in QUERIES.items():
+            before_ms = time_query(conn, before, targets)
+            after_ms = time_query(conn, after, targets)
+            print(f"{name:>8}: case-insensitive {before_ms:9.3f} ms/lookup | "
+                  f"exact {after_ms:7.3f} ms/lookup | {before_ms / after_ms:8.1f}x faster")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+-- ============================================================
+-- Benchmark - ILIKE vs exact-match address lookups (PostgreSQL)
+-- ============================================================
+--
+-- Builds throwaway copies of wallets and transactions with one million
+-- rows each, then compares the old ILIKE filters with the equality
+-- filters the backend uses now. Everything runs inside a transaction that
+-- is rolled back, so it is safe to run in the Supabase SQL Editor.
+--
+-- Expected plans: ILIKE -> Seq Scan over every row,
+--                 =     -> Index Scan / Bitmap Index Scan.
+-- ============================================================
+
+BEGIN;
+
+CREATE TEMP TABLE bench_wallets (
+    address TEXT PRIMARY KEY,
+    balance NUMERIC NOT NULL DEFAULT 0
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE bench_transactions (
+    id BIGSERIAL PRIMARY KEY,
+    sender_address TEXT NOT NULL,
+    recipient_address TEXT NOT NULL,
+    amount_eth NUMERIC NOT NULL,
+    timestamp TIMESTAMPTZ DEFAULT NOW()
+) ON COMMIT DROP;
+
+INSERT INTO bench_wallets (address, balance)
+SELECT '0x' || lpad(to_hex(i), 40, '0'), random() * 10
+FROM generate_series(1, 1000000) AS i;
+
+INSERT INTO bench_transactions (sender_address, recipient_address, amount_eth, timestamp)
+SELECT '0x' || lpad(to_hex(1 + (i * 7919) % 1000000), 40, '0'),
+       '0x' || lpad(to_hex(1 + (i * 104729) % 1000000), 40, '0'),
+       random(),
+       NOW() - (i || ' seconds')::interval
+FROM generate_series(1, 1000000) AS i;
+
+CREATE INDEX ON bench_transactions(sender_address);
+CREATE INDEX ON bench_transactions(recipient_address);
+ANALYZE bench_wallets;
+ANALYZE bench_transactions;
+
+-- Balance lookup: before
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT balance FROM bench_wallets
+WHERE address ILIKE '0x00000000000000000000000000000000000abcde';
+
+-- Balance lookup: after
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT balance FROM bench_wallets
+WHERE address = '0x00000000000000000000000000000000000abcde';
+
+-- History lookup: before
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM bench_transactions
+WHERE sender_address ILIKE '0x00000000000000000000000000000000000abcde'
+   OR recipient_address ILIKE '0x00000000000000000000000000000000000abcde'
+ORDER BY timestamp DESC;
+
+-- History lookup: after
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM bench_transactions
+WHERE sender_address = '0x00000000000000000000000000000000000abcde'
+   OR recipient_address = '0x00000000000000000000000000000000000abcde'
+ORDER BY timestamp DESC;
+
+ROLLBACK;
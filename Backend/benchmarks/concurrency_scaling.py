@@ -0,0 +1,100 @@
+"""
+Concurrency scaling benchmark for the async request path.
+
+Serves a local stand-in for the Skip API that answers after a fixed delay,
+points the backend at it, and fires USD /transfer/initiate requests at
+increasing concurrency. With a non-blocking data path, throughput grows with
+concurrency instead of staying flat at 1 / upstream latency.
+
+Usage (from the Backend directory):
+    python -m benchmarks.concurrency_scaling --delay-ms 100 --levels 1 4 16 64
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import tempfile
+import threading
+import time
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_slow_skip(port: int, delay_s: float):
+    """Serve a fake Skip route endpoint that sleeps before answering."""
+    import uvicorn
+    from fastapi import FastAPI
+
+    skip = FastAPI()
+
+    @skip.post("/v2/fungible/msgs_direct")
+    async def msgs_direct(payload: dict):
+        await asyncio.sleep(delay_s)
+        usd = int(payload["amount_in"]) / 1_000_000
+        return {"route": {"amount_out": str(int(usd / 3000 * 1e18))}}
+
+    server = uvicorn.Server(uvicorn.Config(skip, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def measure(client, sender: str, concurrency: int, requests: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    recipient = "0x" + "ab" * 20
+
+    async def one():
+        async with semaphore:
+            response = await client.post("/transfer/initiate", json={
+                "sender_address": sender,
+                "recipient_address": recipient,
+                "amount": 10,
+                "transfer_mode": "USD"
+            })
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def run(levels: list, requests: int):
+    import httpx
+    import main
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        wallet = (await client.post("/wallet/create", json={"email": "bench@example.com"})).json()
+        print(f"{'concurrency':>12} | {'requests/s':>10}")
+        for concurrency in levels:
+            throughput = await measure(client, wallet["address"], concurrency, max(requests, concurrency))
+            print(f"{concurrency:>12} | {throughput:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--delay-ms", type=float, default=100)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=64)
+    args = parser.parse_args()
+
+    port = free_port()
+    start_slow_skip(port, args.delay_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Must be set before the backend reads its configuration on import
+        os.environ["STORAGE_BACKEND"] = "sqlite"
+        os.environ["SQLITE_PATH"] = os.path.join(tmp, "bench.db")
+        os.environ["SKIP_API_URL"] = f"http://127.0.0.1:{port}/v2/fungible/msgs_direct"
+        os.environ["RESEND_API_KEY"] = ""
+        asyncio.run(run(args.levels, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark for keyset-paginated transaction history.
+
+Seeds wallets with increasingly long histories in a throwaway SQLite
+database, then times the first history page against the old "fetch
+everything" query. First-page latency should stay flat as history grows.
+
+Usage (from the Backend directory):
+    python -m benchmarks.history_pagination --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from repositories.sqlite_repository import SQLiteRepository
+
+FULL_HISTORY = """
+SELECT id, sender_address, recipient_address, amount_eth, amount_usd, timestamp
+FROM transactions
+WHERE sender_address = ? OR recipient_address = ?
+ORDER BY timestamp DESC
+"""
+
+
+def address(i: int) -> str:
+    return "0x" + format(i, "040x")
+
+
+def seed(repository: SQLiteRepository, wallet: str, size: int):
+    conn = repository._connection()
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO transactions (sender_address, recipient_address, amount_eth, timestamp) VALUES (?, ?, ?, ?)",
+        ((wallet if i % 2 else address(i + 1_000_000), address(i + 1_000_000) if i % 2 else wallet, 0.01,
+          f"2024-01-01T00:00:{i % 60:02d}.{i % 1000:03d}+00:00") for i in range(size))
+    )
+    conn.execute("COMMIT")
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = SQLiteRepository(os.path.join(tmp, "bench.db"))
+        conn = repository._connection()
+
+        print(f"{'history size':>14} | {'first page (ms)':>16} | {'full history (ms)':>18}")
+        for n, size in enumerate(args.sizes):
+            wallet = address(n + 1)
+            seed(repository, wallet, size)
+            conn.execute("ANALYZE")
+
+            page_ms = timed(lambda: repository._get_transactions(wallet, args.page_size), args.repeat)
+            full_ms = timed(lambda: conn.execute(FULL_HISTORY, (wallet, wallet)).fetchall(), max(1, args.repeat // 10))
+            print(f"{size:>14,} | {page_ms:>16.3f} | {full_ms:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
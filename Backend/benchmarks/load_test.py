@@ -0,0 +1,337 @@
+"""
+Load test for the HTTP API against local stand-ins for Supabase, Skip and Resend.
+
+Starts benchmarks.stand_ins in one process and the backend (uvicorn main:app,
+STORAGE_BACKEND=supabase, pointed at the stand-ins) in another, then drives
+it over HTTP. Each scenario runs at every concurrency level as a closed loop:
+N workers each issue their next operation as soon as the last one finishes,
+until --operations operations have completed. A few untimed --warmup
+operations run before each scenario.
+
+Scenarios (one operation each):
+    create        POST /wallet/create
+    import        POST /wallet/import with the mnemonic of an existing wallet
+    transfer_eth  /transfer/initiate + sign + /transfer/execute, ETH amount
+    transfer_usd  the same with a USD amount, which also quotes via Skip
+    history       GET /transaction/history/{address}
+
+Every stand-in takes a latency, a jitter and an error rate, so runs can model
+a slow or flaky dependency. Results (throughput, error counts and latency
+percentiles per scenario and level, plus the git commit) are written as JSON;
+--baseline compares the run against an earlier results file.
+
+Usage (from the Backend directory):
+    python -m benchmarks.load_test --levels 1 8 32 --operations 200 \\
+        --store-latency-ms 5 --skip-latency-ms 80 --output results.json
+    python -m benchmarks.load_test --scenarios transfer_usd --skip-error-rate 0.05 \\
+        --baseline results.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from benchmarks.concurrency_scaling import free_port
+
+SCENARIOS = ("create", "import", "transfer_eth", "transfer_usd", "history")
+# Any JWT-shaped string passes the Supabase client's key check
+FAKE_SUPABASE_KEY = "load.test.key"
+STARTUP_TIMEOUT_SECONDS = 60
+
+
+class Failure(Exception):
+    pass
+
+
+def check(response) -> dict:
+    if response.status_code >= 400:
+        raise Failure(str(response.status_code))
+    return response.json()
+
+
+def sign(message: str, private_key: str) -> str:
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+
+    return Account.sign_message(encode_defunct(text=message), private_key).signature.hex()
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def git_version() -> dict:
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], capture_output=True, text=True, timeout=5).stdout.strip() or None
+        except OSError:
+            return None
+    return {"commit": git("rev-parse", "HEAD"), "describe": git("describe", "--always", "--dirty")}
+
+
+class Scenarios:
+    """One method per scenario; `worker` picks the wallet a worker operates on."""
+
+    def __init__(self, client, wallets: List[dict]):
+        self.client = client
+        self.wallets = wallets
+        self.created = 0
+
+    async def create(self, worker: int):
+        self.created += 1
+        check(await self.client.post("/wallet/create", json={"email": f"load{self.created}@example.com"}))
+
+    async def import_(self, worker: int):
+        wallet = random.choice(self.wallets)
+        check(await self.client.post("/wallet/import", json={"mnemonic": wallet["mnemonic"]}))
+
+    async def _transfer(self, worker: int, mode: str, amount: float):
+        sender = self.wallets[worker % len(self.wallets)]
+        recipient = self.wallets[(worker + 1) % len(self.wallets)]
+        quote = check(await self.client.post("/transfer/initiate", json={
+            "sender_address": sender["address"],
+            "recipient_address": recipient["address"],
+            "amount": amount,
+            "transfer_mode": mode
+        }))
+        check(await self.client.post("/transfer/execute", headers={"Idempotency-Key": str(uuid.uuid4())}, json={
+            "sender_address": sender["address"],
+            "recipient_address": recipient["address"],
+            "eth_amount": quote["eth_amount"],
+            "signed_message": sign(quote["approval_message"], sender["private_key"]),
+            "approval_message": quote["approval_message"],
+            "quote_id": quote["quote_id"],
+            "usd_amount": quote["usd_amount"]
+        }))
+
+    async def transfer_eth(self, worker: int):
+        await self._transfer(worker, "ETH", 0.0001)
+
+    async def transfer_usd(self, worker: int):
+        await self._transfer(worker, "USD", 0.25)
+
+    async def history(self, worker: int):
+        wallet = random.choice(self.wallets)
+        check(await self.client.get(f"/transaction/history/{wallet['address']}", params={"limit": 50}))
+
+    def get(self, scenario: str):
+        return getattr(self, "import_" if scenario == "import" else scenario)
+
+
+async def run_level(operation, concurrency: int, operations: int) -> dict:
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    remaining = operations
+
+    async def worker(index: int):
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await operation(index)
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                kind = str(e) if isinstance(e, Failure) else type(e).__name__
+                errors[kind] = errors.get(kind, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latency * 1000 for latency in latencies)
+    return {
+        "concurrency": concurrency,
+        "operations": operations,
+        "succeeded": len(ordered),
+        "errors": sum(errors.values()),
+        "errors_by_kind": errors,
+        "duration_s": round(elapsed, 3),
+        "throughput_ops_s": round(len(ordered) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(ordered, 50), 2),
+            "p95": round(percentile(ordered, 95), 2),
+            "p99": round(percentile(ordered, 99), 2),
+            "mean": round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+            "max": round(ordered[-1], 2) if ordered else 0.0
+        }
+    }
+
+
+async def wait_until_up(client, path: str, process):
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        exited = process.poll() is not None if isinstance(process, subprocess.Popen) else not process.is_alive()
+        if exited:
+            raise RuntimeError(f"process serving {client.base_url} exited during startup")
+        try:
+            if (await client.get(path)).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError(f"{client.base_url} did not come up within {STARTUP_TIMEOUT_SECONDS}s")
+
+
+async def drive(args, api_url: str, stand_ins_url: str, api_process, stand_ins_process) -> dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=max(args.levels), max_keepalive_connections=max(args.levels))
+    async with httpx.AsyncClient(base_url=api_url, limits=limits, timeout=args.timeout) as client, \
+            httpx.AsyncClient(base_url=stand_ins_url) as stand_ins:
+        await wait_until_up(stand_ins, "/_stand_ins/stats", stand_ins_process)
+        await wait_until_up(client, "/ready", api_process)
+
+        # Senders for the transfer scenarios, one per worker at the highest level
+        wallets = []
+        while len(wallets) < max(args.levels) + 1:
+            try:
+                wallets.append(check(await client.post("/wallet/create", json={"email": "seed@example.com"})))
+            except Failure:
+                await asyncio.sleep(0.1)
+        scenarios = Scenarios(client, wallets)
+
+        results = []
+        print(f"{'scenario':>12} | {'conc':>4} | {'ops/s':>8} | {'p50 ms':>8} | {'p95 ms':>8} | "
+              f"{'p99 ms':>8} | {'errors':>6}")
+        for scenario in args.scenarios:
+            # Untimed: the first calls pay for cold caches, thread pools and imports
+            if args.warmup:
+                await run_level(scenarios.get(scenario), min(args.levels), args.warmup)
+            for concurrency in args.levels:
+                result = {"scenario": scenario, **await run_level(scenarios.get(scenario), concurrency, args.operations)}
+                results.append(result)
+                latency = result["latency_ms"]
+                print(f"{scenario:>12} | {concurrency:>4} | {result['throughput_ops_s']:>8.1f} | "
+                      f"{latency['p50']:>8.1f} | {latency['p95']:>8.1f} | {latency['p99']:>8.1f} | "
+                      f"{result['errors']:>6}", flush=True)
+
+        return {"results": results, "stand_ins": (await stand_ins.get("/_stand_ins/stats")).json()}
+
+
+def compare(baseline: dict, current: dict):
+    """Print throughput and p99 changes for every (scenario, concurrency) in both runs."""
+    before = {(r["scenario"], r["concurrency"]): r for r in baseline["results"]}
+    print(f"\nagainst {baseline['version'].get('describe') or baseline['version'].get('commit')} "
+          f"({baseline['started_at']})")
+    print(f"{'scenario':>12} | {'conc':>4} | {'ops/s':>18} | {'p99 ms':>18}")
+    for result in current["results"]:
+        old = before.get((result["scenario"], result["concurrency"]))
+        if old is None:
+            continue
+        pairs = []
+        for new_value, old_value in ((result["throughput_ops_s"], old["throughput_ops_s"]),
+                                     (result["latency_ms"]["p99"], old["latency_ms"]["p99"])):
+            change = f"{(new_value - old_value) / old_value:+.0%}" if old_value else "n/a"
+            pairs.append(f"{old_value:>7.1f} → {new_value:>7.1f} {change:>5}")
+        print(f"{result['scenario']:>12} | {result['concurrency']:>4} | {pairs[0]} | {pairs[1]}")
+
+
+def behaviours(args) -> Dict[str, dict]:
+    return {
+        name: {
+            "latency_ms": getattr(args, f"{name}_latency_ms"),
+            "jitter_ms": getattr(args, f"{name}_jitter_ms"),
+            "error_rate": getattr(args, f"{name}_error_rate")
+        }
+        for name in ("store", "skip", "resend")
+    }
+
+
+def start_stand_ins(db_path: str, behaviours: Dict[str, dict]):
+    """Serve the stand-ins in a separate process; returns (process, base URL)."""
+    from benchmarks.stand_ins import serve
+
+    port = free_port()
+    process = multiprocessing.get_context("spawn").Process(
+        target=serve, args=(port, db_path, behaviours), daemon=True
+    )
+    process.start()
+    return process, f"http://127.0.0.1:{port}"
+
+
+def start_backend(port: int, stand_ins_url: str, quiet: bool) -> subprocess.Popen:
+    """Run uvicorn main:app with Supabase, Skip and Resend pointed at the stand-ins."""
+    env = dict(
+        os.environ,
+        STORAGE_BACKEND="supabase",
+        SUPABASE_URL=stand_ins_url,
+        SUPABASE_ANON_KEY=FAKE_SUPABASE_KEY,
+        SKIP_API_URL=f"{stand_ins_url}/v2/fungible/msgs_direct",
+        RESEND_API_URL=stand_ins_url,
+        RESEND_API_KEY="load-test"
+    )
+    # One worker: quotes and idempotency results live in process memory
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL if quiet else None
+    )
+
+
+def add_stand_in_arguments(parser: argparse.ArgumentParser):
+    for name in ("store", "skip", "resend"):
+        parser.add_argument(f"--{name}-latency-ms", type=float, default=0.0)
+        parser.add_argument(f"--{name}-jitter-ms", type=float, default=0.0,
+                            help="Extra latency drawn uniformly from [0, jitter]")
+        parser.add_argument(f"--{name}-error-rate", type=float, default=0.0,
+                            help="Fraction of requests answered with 503")
+
+
+def run(args) -> dict:
+    api_port = free_port()
+    started_at = datetime.now(timezone.utc).isoformat()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stand_ins, stand_ins_url = start_stand_ins(os.path.join(tmp, "store.db"), behaviours(args))
+        api = start_backend(api_port, stand_ins_url, args.quiet_api)
+        try:
+            outcome = asyncio.run(drive(args, f"http://127.0.0.1:{api_port}", stand_ins_url, api, stand_ins))
+        finally:
+            api.terminate()
+            api.wait(timeout=30)
+            stand_ins.terminate()
+            stand_ins.join(timeout=10)
+
+    config = {key: value for key, value in vars(args).items() if key not in ("output", "baseline", "quiet_api")}
+    return {"version": git_version(), "started_at": started_at, "config": config, **outcome}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--operations", type=int, default=200, help="Operations per scenario and level")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed operations before each scenario")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Client timeout per request, in seconds")
+    add_stand_in_arguments(parser)
+    parser.add_argument("--output", default="load_test_results.json")
+    parser.add_argument("--baseline", help="Earlier results file to compare this run with")
+    parser.add_argument("--quiet-api", action="store_true", help="Hide the backend's startup output")
+    args = parser.parse_args()
+
+    results = run(args)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Microbenchmark for signature recovery on /transfer/execute.
+
+Compares the old `w3.eth.account.recover_message` call with the verifier's
+raw backends (coincurve when installed, eth_keys otherwise) and with a warm
+verification cache, all on pre-signed approval messages.
+
+Usage (from the Backend directory):
+    python -m benchmarks.signature_verification --signatures 2000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("STORAGE_BACKEND", "sqlite")
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+
+import utils.signature_verifier as verifier
+
+
+def signed_messages(count: int) -> list:
+    account = Account.create()
+    messages = []
+    for i in range(count):
+        text = f"Send 0.{i:06d} ETH to 0x{'ab' * 20} [quote bench{i}]"
+        signature = Account.sign_message(encode_defunct(text=text), account.key).signature.hex()
+        messages.append((text, "0x" + signature.removeprefix("0x")))
+    return messages
+
+
+def per_op_us(fn, messages: list) -> float:
+    start = time.perf_counter()
+    for text, signature in messages:
+        fn(text, signature)
+    return (time.perf_counter() - start) / len(messages) * 1_000_000
+
+
+async def cached_us(messages: list) -> float:
+    for text, signature in messages:
+        await verifier.recover_address(text, signature)
+    start = time.perf_counter()
+    for text, signature in messages:
+        await verifier.recover_address(text, signature)
+    return (time.perf_counter() - start) / len(messages) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signatures", type=int, default=2000)
+    args = parser.parse_args()
+
+    messages = signed_messages(args.signatures)
+    w3 = Web3()
+
+    def raw(text, signature):
+        return verifier.recover_from_hash(verifier.message_hash(text), verifier.signature_bytes(signature))
+
+    results = {"w3.eth.account.recover_message": per_op_us(
+        lambda text, signature: w3.eth.account.recover_message(encode_defunct(text=text), signature=signature),
+        messages
+    )}
+    if verifier.coincurve is not None:
+        results["verifier (coincurve)"] = per_op_us(raw, messages)
+    coincurve, verifier.coincurve = verifier.coincurve, None
+    results["verifier (eth_keys)"] = per_op_us(raw, messages)
+    verifier.coincurve = coincurve
+    results["verifier (warm cache)"] = asyncio.run(cached_us(messages))
+
+    baseline = results["w3.eth.account.recover_message"]
+    print(f"{'path':>32} | {'us/op':>9} | {'speedup':>8}")
+    for name, us in results.items():
+        print(f"{name:>32} | {us:>9.1f} | {baseline / us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Local stand-ins for the services the backend calls, for load tests.
+
+One FastAPI app serves all three, each with its own injected latency and
+error rate:
+
+- store: the subset of the PostgREST API that SupabaseRepository uses
+  (/rest/v1/<table> selects, inserts and updates with eq/in filters, and
+  /rest/v1/rpc/<function>), backed by an SQLite database through
+  SQLiteRepository, so the real Supabase client code path is exercised.
+- skip: /v2/fungible/msgs_direct, quoting at a fixed ETH price.
+- resend: /emails/batch, which accepts and counts emails.
+
+Request counts and injected failures per stand-in are served at
+/_stand_ins/stats. Run it in its own process (see benchmarks.load_test) so
+its CPU use does not skew the API under test.
+"""
+
+import asyncio
+import json
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from repositories.base import WalletNotFoundError, InsufficientBalanceError
+from repositories.sqlite_repository import SQLiteRepository
+
+ETH_PRICE_USD = 3000.0
+STAND_INS = ("store", "skip", "resend")
+PREFIXES = {"/rest/v1/": "store", "/v2/fungible/": "skip", "/emails": "resend"}
+
+
+@dataclass
+class Behaviour:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    async def delay(self):
+        seconds = (self.latency_ms + random.uniform(0, self.jitter_ms)) / 1000
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    def fails(self) -> bool:
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+
+def postgrest_error(status: int, message: str, code: str) -> JSONResponse:
+    return JSONResponse({"message": message, "code": code, "details": None, "hint": None}, status_code=status)
+
+
+class TableStore:
+    """Generic table reads and writes over the SQLite schema, PostgREST style."""
+
+    def __init__(self, repository: SQLiteRepository):
+        self.repository = repository
+        conn = repository._connection()
+        self.columns = {
+            table: {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+
+    def _check(self, table: str, names) -> Optional[str]:
+        if table not in self.columns:
+            return f'relation "public.{table}" does not exist'
+        unknown = set(names) - self.columns[table]
+        return f"column {table}.{sorted(unknown)[0]} does not exist" if unknown else None
+
+    @staticmethod
+    def _filters(params: Dict[str, str]):
+        """Translate col=eq.value and col=in.(a,b) query parameters into a WHERE clause."""
+        clauses, values = [], []
+        for column, expression in params.items():
+            if column in ("select", "limit", "order", "offset", "columns"):
+                continue
+            operator, _, operand = expression.partition(".")
+            if operator == "eq":
+                clauses.append(f"{column} = ?")
+                values.append(operand)
+            elif operator == "in":
+                items = [item.strip('"') for item in operand.strip("()").split(",") if item]
+                clauses.append(f"{column} IN ({', '.join('?' * len(items))})")
+                values.extend(items)
+            else:
+                raise ValueError(f"unsupported filter operator: {operator}")
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), values
+
+    @staticmethod
+    def _value(value):
+        # json/jsonb columns are stored as text, as SQLiteRepository does
+        return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+    def select(self, table: str, params: Dict[str, str]) -> List[dict]:
+        select = params.get("select", "*")
+        names = [] if select == "*" else [name.strip() for name in select.split(",")]
+        where, values = self._filters(params)
+        error = self._check(table, names + [column for column in params if column not in ("select", "limit")])
+        if error:
+            raise LookupError(error)
+        sql = f"SELECT {', '.join(names) or '*'} FROM {table}{where}"
+        if "limit" in params:
+            sql += f" LIMIT {int(params['limit'])}"
+        return [dict(row) for row in self.repository._connection().execute(sql, values)]
+
+    def insert(self, table: str, rows: List[dict]) -> List[dict]:
+        inserted = []
+        with self.repository._write() as conn:
+            for row in rows:
+                error = self._check(table, row)
+                if error:
+                    raise LookupError(error)
+                sql = (f"INSERT INTO {table} ({', '.join(row)}) "
+                       f"VALUES ({', '.join('?' * len(row))}) RETURNING *")
+                inserted.append(dict(conn.execute(sql, [self._value(v) for v in row.values()]).fetchone()))
+        return inserted
+
+    def update(self, table: str, values: dict, params: Dict[str, str]) -> List[dict]:
+        error = self._check(table, list(values) + list(params))
+        if error:
+            raise LookupError(error)
+        where, filter_values = self._filters(params)
+        sql = f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in values)}{where} RETURNING *"
+        with self.repository._write() as conn:
+            rows = conn.execute(sql, [self._value(v) for v in values.values()] + filter_values).fetchall()
+        return [dict(row) for row in rows]
+
+
+def rpc_functions(repository: SQLiteRepository) -> dict:
+    """The RPC functions of CREATE_TABLES.sql, answered by the SQLite repository."""
+
+    async def transaction_history_page(p):
+        before = (p["p_before_timestamp"], p["p_before_id"]) if p.get("p_before_timestamp") else None
+        return await repository.get_transactions(p["p_address"], p["p_limit"], before)
+
+    async def transaction_columns(p):
+        after = (p["p_after_timestamp"], p["p_after_id"]) if p.get("p_after_timestamp") else None
+        return await repository.get_transaction_columns(p["p_since"], p["p_until"], p["p_limit"], after)
+
+    return {
+        "get_wallets": lambda p: repository.get_wallets(p["p_addresses"]),
+        "create_wallet_with_hash": lambda p: repository.create_wallet_with_hash(
+            p["p_address"], p["p_balance"], p["p_mnemonic_hash"], p.get("p_email")),
+        "create_wallets_with_hashes": lambda p: repository.create_wallets_with_hashes(list(zip(
+            p["p_addresses"], p["p_balances"], p["p_mnemonic_hashes"], p["p_emails"]))),
+        "transfer_funds": lambda p: repository.transfer(
+            p["p_sender"], p["p_recipient"], p["p_amount_eth"], p.get("p_amount_usd")),
+        "transfer_funds_batch": lambda p: repository.transfer_batch(p["p_sender"], list(zip(
+            p["p_recipients"], p["p_amounts_eth"], p["p_amounts_usd"]))),
+        "transaction_history_page": transaction_history_page,
+        "transaction_columns": transaction_columns,
+        "wallet_stats_rebuild_start": lambda p: repository.start_wallet_stats_rebuild(),
+        "wallet_stats_rebuild_chunk": lambda p: repository.rebuild_wallet_stats_chunk(
+            p["p_after"], p["p_until"], p["p_limit"]),
+        "wallet_stats_rebuild_finish": lambda p: repository.finish_wallet_stats_rebuild(p["p_until"]),
+        "claim_email_outbox": lambda p: repository.claim_emails(p["p_limit"], p["p_lease_seconds"]),
+        "email_outbox_stats": lambda p: repository.get_outbox_stats(),
+        "store_transfer_quote": lambda p: repository.store_quote(p["p_quote_id"], p["p_quote"], p["p_ttl_seconds"]),
+        "get_transfer_quote": lambda p: repository.get_quote(p["p_quote_id"]),
+        "consume_transfer_quote": lambda p: repository.delete_quote(p["p_quote_id"])
+    }
+
+
+def create_app(db_path: str, behaviours: Dict[str, Behaviour]) -> FastAPI:
+    app = FastAPI()
+    repository = SQLiteRepository(db_path)
+    tables = TableStore(repository)
+    functions = rpc_functions(repository)
+    counters = {name: {"requests": 0, "injected_errors": 0} for name in STAND_INS}
+    counters["resend"]["emails"] = 0
+
+    @app.middleware("http")
+    async def inject(request: Request, call_next):
+        stand_in = next((name for prefix, name in PREFIXES.items() if request.url.path.startswith(prefix)), None)
+        if stand_in is None:
+            return await call_next(request)
+        behaviour = behaviours[stand_in]
+        counters[stand_in]["requests"] += 1
+        await behaviour.delay()
+        if behaviour.fails():
+            counters[stand_in]["injected_errors"] += 1
+            return postgrest_error(503, "injected failure", "PGRST000")
+        return await call_next(request)
+
+    @app.get("/_stand_ins/stats")
+    async def stats():
+        return counters
+
+    @app.post("/rest/v1/rpc/{function}")
+    async def rpc(function: str, request: Request):
+        handler = functions.get(function)
+        if handler is None:
+            return postgrest_error(404, f"Could not find the function public.{function}", "PGRST202")
+        try:
+            return JSONResponse(await handler(await request.json()))
+        except WalletNotFoundError:
+            return postgrest_error(400, "wallet_not_found", "P0001")
+        except InsufficientBalanceError:
+            return postgrest_error(400, "insufficient_balance", "P0001")
+
+    async def table_call(method, *args) -> JSONResponse:
+        try:
+            rows = await repository._run(method, *args)
+        except LookupError as e:
+            return postgrest_error(404, str(e), "42P01")
+        except Exception as e:
+            return postgrest_error(400, str(e), "23505" if "UNIQUE" in str(e) else "XX000")
+        return JSONResponse(rows, status_code=201 if method == tables.insert else 200)
+
+    @app.get("/rest/v1/{table}")
+    async def select(table: str, request: Request):
+        return await table_call(tables.select, table, dict(request.query_params))
+
+    @app.post("/rest/v1/{table}")
+    async def insert(table: str, request: Request):
+        body = await request.json()
+        return await table_call(tables.insert, table, body if isinstance(body, list) else [body])
+
+    @app.patch("/rest/v1/{table}")
+    async def update(table: str, request: Request):
+        return await table_call(tables.update, table, await request.json(), dict(request.query_params))
+
+    @app.post("/v2/fungible/msgs_direct")
+    async def msgs_direct(payload: dict):
+        usd = int(payload["amount_in"]) / 1_000_000
+        return {"route": {"amount_out": str(int(usd / ETH_PRICE_USD * 1e18))}}
+
+    @app.post("/emails/batch")
+    async def emails_batch(emails: List[dict]):
+        counters["resend"]["emails"] += len(emails)
+        return {"data": [{"id": str(uuid.uuid4())} for _ in emails]}
+
+    return app
+
+
+def serve(port: int, db_path: str, behaviours: Dict[str, dict]):
+    """Process entry point: serve the stand-ins on 127.0.0.1:<port> until killed."""
+    import uvicorn
+
+    app = create_app(db_path, {name: Behaviour(**behaviours.get(name, {})) for name in STAND_INS})
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
@@ -0,0 +1,146 @@
+"""
+Cold start benchmark for the API process.
+
+Runs against the load-test stand-ins (see benchmarks.load_test), so the table
+checks and the price warm-up pay the configured store and Skip latency.
+Every run is a fresh interpreter:
+
+- import: seconds to `import main`, plus the slowest modules main imports
+  directly (from one extra run with -X importtime)
+- first request: seconds from launching uvicorn until GET / answers
+- ready: seconds from launching uvicorn until GET /ready answers 200
+
+Usage (from the Backend directory):
+    python -m benchmarks.startup_time --runs 5 --store-latency-ms 20 --skip-latency-ms 100
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.concurrency_scaling import free_port
+from benchmarks.load_test import FAKE_SUPABASE_KEY, add_stand_in_arguments, behaviours, git_version, \
+    start_backend, start_stand_ins
+
+IMPORT_MAIN = "import time; start = time.perf_counter(); import main; print(time.perf_counter() - start)"
+POLL_INTERVAL_SECONDS = 0.005
+TIMEOUT_SECONDS = 120
+
+
+def import_env(stand_ins_url: str) -> dict:
+    return dict(os.environ, STORAGE_BACKEND="supabase", SUPABASE_URL=stand_ins_url,
+                SUPABASE_ANON_KEY=FAKE_SUPABASE_KEY)
+
+
+def import_seconds(env: dict) -> float:
+    output = subprocess.run([sys.executable, "-c", IMPORT_MAIN], env=env, capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(env: dict, top: int) -> list:
+    """Cumulative import time of the modules main imports directly, slowest first."""
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            env=env, capture_output=True, text=True, check=True)
+    modules = []
+    for line in output.stderr.splitlines():
+        parts = line.split("|")
+        # Direct imports of main are indented by exactly two spaces
+        if len(parts) == 3 and parts[2].startswith("   ") and not parts[2].startswith("    "):
+            modules.append((parts[2].strip(), int(parts[1]) / 1e6))
+    return sorted(modules, key=lambda module: -module[1])[:top]
+
+
+def wait_for(client: httpx.Client, path: str, launched: float, process: subprocess.Popen = None) -> float:
+    """Seconds from `launched` until GET `path` answers 200."""
+    while time.perf_counter() - launched < TIMEOUT_SECONDS:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError("the backend exited during startup")
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter() - launched
+        except httpx.TransportError:
+            pass
+        time.sleep(POLL_INTERVAL_SECONDS)
+    raise RuntimeError(f"{path} did not answer 200 within {TIMEOUT_SECONDS}s")
+
+
+def boot_once(stand_ins_url: str) -> dict:
+    port = free_port()
+    launched = time.perf_counter()
+    api = start_backend(port, stand_ins_url, quiet=True)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=5) as client:
+            first_request = wait_for(client, "/", launched, api)
+            ready = wait_for(client, "/ready", launched, api)
+            phases = client.get("/ready").json()["phases"]
+    finally:
+        api.terminate()
+        api.wait(timeout=30)
+    return {"first_request_s": first_request, "ready_s": ready,
+            "phases_s": {name: phase["seconds"] for name, phase in phases.items()}}
+
+
+def summary(values: list) -> dict:
+    return {"median": round(statistics.median(values), 3), "min": round(min(values), 3), "max": round(max(values), 3)}
+
+
+def run(args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        stand_ins, stand_ins_url = start_stand_ins(os.path.join(tmp, "store.db"), behaviours(args))
+        try:
+            env = import_env(stand_ins_url)
+            imports = [import_seconds(env) for _ in range(args.runs)]
+            slowest = slowest_imports(env, args.top)
+            with httpx.Client(base_url=stand_ins_url) as client:
+                wait_for(client, "/_stand_ins/stats", time.perf_counter())
+            boots = [boot_once(stand_ins_url) for _ in range(args.runs)]
+        finally:
+            stand_ins.terminate()
+            stand_ins.join(timeout=10)
+
+    phases = sorted({name for boot in boots for name in boot["phases_s"]})
+    return {
+        "version": git_version(),
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "import_s": summary(imports),
+        "slowest_imports_s": {name: round(seconds, 3) for name, seconds in slowest},
+        "first_request_s": summary([boot["first_request_s"] for boot in boots]),
+        "ready_s": summary([boot["ready_s"] for boot in boots]),
+        "phases_s": {name: summary([boot["phases_s"][name] for boot in boots if boot["phases_s"].get(name) is not None])
+                     for name in phases}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="How many of main's imports to list")
+    add_stand_in_arguments(parser)
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = run(args)
+    print(f"{'':>16} | {'median (s)':>10} | {'min (s)':>8} | {'max (s)':>8}")
+    rows = [("import main", results["import_s"]), ("first request", results["first_request_s"]),
+            ("ready", results["ready_s"])]
+    rows += [(f"  {name}", values) for name, values in results["phases_s"].items()]
+    for label, values in rows:
+        print(f"{label:>16} | {values['median']:>10.3f} | {values['min']:>8.3f} | {values['max']:>8.3f}")
+    print("\nSlowest imports in main:")
+    for name, seconds in results["slowest_imports_s"].items():
+        print(f"  {name:<40} {seconds:.3f}s")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Concurrency benchmark for the transfer ledger.
+
+Fires many concurrent transfers from one sender and checks that no update was
+lost. The "legacy" mode replays the old read-then-write sequence for comparison.
+Each run creates two throwaway wallets, so point it at a scratch database,
+e.g. STORAGE_BACKEND=sqlite SQLITE_PATH=/tmp/bench.db.
+
+Usage (from the Backend directory):
+    python -m benchmarks.transfer_concurrency --transfers 200 --concurrency 16
+    python -m benchmarks.transfer_concurrency --mode legacy
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+
+from fastapi import HTTPException
+
+from utils.database import repository
+from services.transfer_service import apply_transfer
+
+AMOUNT_ETH = 0.001
+
+
+def random_address() -> str:
+    return "0x" + secrets.token_hex(20)
+
+
+async def legacy_transfer(sender: str, recipient: str, amount: float):
+    """Old execute_transfer ledger sequence: separate reads and writes per wallet."""
+    sender_balance = float((await repository.get_wallet(sender))["balance"])
+    if sender_balance < amount:
+        raise HTTPException(status_code=400, detail="Insufficient balance")
+    await repository.update_wallet(sender, {"balance": sender_balance - amount})
+    recipient_balance = float((await repository.get_wallet(recipient))["balance"])
+    await repository.update_wallet(recipient, {"balance": recipient_balance + amount})
+    await repository.insert_transaction(sender, recipient, amount)
+
+
+async def run(mode: str, transfers: int, concurrency: int, starting_balance: float) -> dict:
+    sender, recipient = random_address(), random_address()
+    await repository.insert_wallet(sender, starting_balance)
+    await repository.insert_wallet(recipient, 0)
+
+    transfer = apply_transfer if mode == "atomic" else legacy_transfer
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            try:
+                await transfer(sender, recipient, AMOUNT_ETH)
+                return True
+            except HTTPException:
+                return False
+
+    start = time.perf_counter()
+    succeeded = sum(await asyncio.gather(*(one() for _ in range(transfers))))
+    elapsed = time.perf_counter() - start
+
+    balances = {address: float((await repository.get_wallet(address))["balance"]) for address in (sender, recipient)}
+    history = await repository.get_transactions(sender, transfers + 1)
+    recorded = sum(1 for tx in history if tx["sender_address"] == sender)
+
+    expected_sender = round(starting_balance - succeeded * AMOUNT_ETH, 6)
+    expected_recipient = round(succeeded * AMOUNT_ETH, 6)
+    lost_updates = (
+        round(balances[sender], 6) != expected_sender
+        or round(balances[recipient], 6) != expected_recipient
+        or recorded != succeeded
+    )
+    return {
+        "mode": mode,
+        "transfers": transfers,
+        "concurrency": concurrency,
+        "succeeded": succeeded,
+        "elapsed_s": round(elapsed, 3),
+        "transfers_per_s": round(transfers / elapsed, 1),
+        "sender_balance": balances[sender],
+        "expected_sender_balance": expected_sender,
+        "recipient_balance": balances[recipient],
+        "expected_recipient_balance": expected_recipient,
+        "transactions_recorded": recorded,
+        "lost_updates": lost_updates
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["atomic", "legacy"], default="atomic")
+    parser.add_argument("--transfers", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--starting-balance", type=float, default=1.0)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.mode, args.transfers, args.concurrency, args.starting_balance))
+    for key, value in result.items():
+        print(f"{key:>28}: {value}")
+
+
+if __name__ == "__main__":
+    main()
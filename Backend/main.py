@@ -1,8 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from utils.database import initialize_database
-from routes import wallet_routes, transfer_routes, transaction_routes
+from utils.database import repository
+from utils.http_client import close_http_client
+from utils.signature_verifier import shutdown_verifier
+from utils.key_derivation import shutdown_key_derivation
+from utils.metrics import MetricsMiddleware
+from routes import wallet_routes, transfer_routes, transaction_routes, stats_routes, analytics_routes, metrics_routes
+from services.email_notification_service import start_outbox_workers, stop_outbox_workers
+from services.wallet_pool_service import start_wallet_pool, stop_wallet_pool
+from services.startup_service import start_warm_up, stop_warm_up, get_readiness
 
 app = FastAPI(
     title="Mock Web3 Wallet API",
@@ -17,10 +25,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(wallet_routes.router)
 app.include_router(transfer_routes.router)
 app.include_router(transaction_routes.router)
+app.include_router(stats_routes.router)
+app.include_router(analytics_routes.router)
+app.include_router(metrics_routes.router)
 
 
 @app.get("/", tags=["Health"])
@@ -28,23 +40,35 @@ async def root():
     return {"message": "Mock Web3 Wallet API is running"}
 
 
+@app.get("/ready", tags=["Health"])
+async def ready():
+    """Readiness probe: 200 once the startup warm-up has finished, 503 until then."""
+    readiness = get_readiness()
+    return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+
+
 @app.on_event("startup")
 async def startup_event():
     print("\n" + "=" * 60)
     print("Mock Web3 Wallet API - Starting...")
     print("=" * 60)
-    print("\nChecking database connection...")
-    
-    db_ready = initialize_database()
-    
-    if db_ready:
-        print("\n✓ All database tables ready")
-        print("✓ Application started successfully!")
-    else:
-        print("\n⚠️  Application started but database setup incomplete")
-        print("   API will return errors until tables are created")
-    
+    print("\nWarming up (database, key derivation, price); see /ready")
     print("=" * 60 + "\n")
+    
+    start_warm_up()
+    start_wallet_pool()
+    start_outbox_workers()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await stop_warm_up()
+    await stop_wallet_pool()
+    await stop_outbox_workers()
+    await close_http_client()
+    await repository.close()
+    shutdown_verifier()
+    shutdown_key_derivation()
 
 
 if __name__ == "__main__":
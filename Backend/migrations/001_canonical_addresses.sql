@@ -0,0 +1,104 @@
+-- ============================================================
+-- Migration 001 - Canonical (lowercase) wallet addresses
+-- ============================================================
+--
+-- Run once in the Supabase SQL Editor on databases created before
+-- addresses were canonicalized. Fresh installs from CREATE_TABLES.sql
+-- already have these constraints and do not need it.
+--
+-- 1. Merges wallets whose addresses differ only by case
+-- 2. Lowercases every address in wallets, mnemonic_hashes and transactions
+-- 3. Adds CHECK constraints so only lowercase addresses can be written
+--
+-- After this, the backend uses exact-match lookups that hit the
+-- wallets primary key and the transactions address indexes.
+-- ============================================================
+
+BEGIN;
+
+-- Let address updates on wallets flow through to mnemonic_hashes
+ALTER TABLE mnemonic_hashes
+    DROP CONSTRAINT IF EXISTS mnemonic_hashes_wallet_address_fkey;
+ALTER TABLE mnemonic_hashes
+    ADD CONSTRAINT mnemonic_hashes_wallet_address_fkey
+    FOREIGN KEY (wallet_address) REFERENCES wallets(address)
+    ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- Merge case-variant duplicates into one wallet per canonical address.
+-- The surviving row is the already-lowercase one if present, otherwise the
+-- oldest. Balances are summed and the first known email is kept.
+DO $$
+DECLARE
+    v_group RECORD;
+    v_keeper TEXT;
+BEGIN
+    FOR v_group IN
+        SELECT lower(address) AS canonical
+        FROM wallets
+        GROUP BY lower(address)
+        HAVING COUNT(*) > 1
+    LOOP
+        SELECT address INTO v_keeper
+        FROM wallets
+        WHERE lower(address) = v_group.canonical
+        ORDER BY (address = v_group.canonical) DESC, created_at ASC
+        LIMIT 1;
+
+        UPDATE wallets w
+        SET balance = totals.balance,
+            email = COALESCE(w.email, totals.email)
+        FROM (
+            SELECT SUM(balance) AS balance,
+                   (ARRAY_AGG(email ORDER BY created_at) FILTER (WHERE email IS NOT NULL))[1] AS email
+            FROM wallets
+            WHERE lower(address) = v_group.canonical
+        ) totals
+        WHERE w.address = v_keeper;
+
+        -- Keep the keeper's mnemonic hash; adopt a duplicate's only if it has none
+        IF NOT EXISTS (SELECT 1 FROM mnemonic_hashes WHERE wallet_address = v_keeper) THEN
+            UPDATE mnemonic_hashes
+            SET wallet_address = v_keeper
+            WHERE id = (
+                SELECT id FROM mnemonic_hashes
+                WHERE lower(wallet_address) = v_group.canonical
+                ORDER BY created_at
+                LIMIT 1
+            );
+        END IF;
+
+        DELETE FROM wallets
+        WHERE lower(address) = v_group.canonical AND address <> v_keeper;
+    END LOOP;
+END;
+$$;
+
+UPDATE wallets SET address = lower(address) WHERE address <> lower(address);
+
+UPDATE transactions
+SET sender_address = lower(sender_address),
+    recipient_address = lower(recipient_address)
+WHERE sender_address <> lower(sender_address)
+   OR recipient_address <> lower(recipient_address);
+
+ALTER TABLE wallets
+    DROP CONSTRAINT IF EXISTS wallets_address_check;
+ALTER TABLE wallets
+    ADD CONSTRAINT wallets_address_check CHECK (address = lower(address));
+
+ALTER TABLE transactions
+    DROP CONSTRAINT IF EXISTS transactions_sender_address_check;
+ALTER TABLE transactions
+    ADD CONSTRAINT transactions_sender_address_check CHECK (sender_address = lower(sender_address));
+
+ALTER TABLE transactions
+    DROP CONSTRAINT IF EXISTS transactions_recipient_address_check;
+ALTER TABLE transactions
+    ADD CONSTRAINT transactions_recipient_address_check CHECK (recipient_address = lower(recipient_address));
+
+COMMIT;
+
+-- Refresh planner statistics for the rewritten rows
+ANALYZE wallets;
+ANALYZE mnemonic_hashes;
+ANALYZE transactions;
@@ -0,0 +1,24 @@
+-- ============================================================
+-- Migration 002 - Keyset-paginated transaction history
+-- ============================================================
+--
+-- Run once in the Supabase SQL Editor on databases created before
+-- history pagination. Replaces the single-column address indexes with
+-- composite (address, timestamp, id) indexes that serve both the
+-- equality lookups and the newest-first page scans, then re-run
+-- CREATE_TABLES.sql to install the transaction_history_page function.
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so
+-- run these statements one by one if the editor wraps them in one.
+-- ============================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transactions_sender_timestamp
+    ON transactions(sender_address, timestamp DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transactions_recipient_timestamp
+    ON transactions(recipient_address, timestamp DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_transactions_sender;
+DROP INDEX CONCURRENTLY IF EXISTS idx_transactions_recipient;
+
+ANALYZE transactions;
@@ -0,0 +1,25 @@
+-- ============================================================
+-- Migration 003 - Per-wallet aggregates
+-- ============================================================
+--
+-- Run once in the Supabase SQL Editor on databases created before
+-- wallet_stats existed. Creates the tables below, then re-run
+-- CREATE_TABLES.sql to install the wallet stats functions and the transfer
+-- functions that maintain them. Finally backfill existing history with:
+--
+--     cd Backend
+--     python -m scripts.rebuild_wallet_stats
+--
+-- The rebuild is safe to run while the API is serving transfers.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS wallet_stats (
+    address TEXT PRIMARY KEY,
+    total_sent NUMERIC NOT NULL DEFAULT 0,
+    total_received NUMERIC NOT NULL DEFAULT 0,
+    tx_count BIGINT NOT NULL DEFAULT 0,
+    last_activity TIMESTAMPTZ,
+    last_transaction_id BIGINT
+);
+
+CREATE TABLE IF NOT EXISTS wallet_stats_rebuild (LIKE wallet_stats INCLUDING ALL);
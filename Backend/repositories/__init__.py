@@ -0,0 +1 @@
+"""Repositories package for storage backends."""
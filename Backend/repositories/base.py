@@ -0,0 +1,177 @@
+"""
+Storage interface shared by every backend.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+
+def canonical_address(address: str) -> str:
+    """Return the canonical (lowercase) form used as the storage key for an address."""
+    return address.strip().lower()
+
+
+class WalletNotFoundError(Exception):
+    """Raised when a transfer references a sender wallet that does not exist."""
+
+
+class InsufficientBalanceError(Exception):
+    """Raised when a transfer would take a wallet balance below zero."""
+
+
+class InvalidAmountError(Exception):
+    """Raised when a transfer amount is not a positive number."""
+
+
+class Repository(ABC):
+    """Async data access for the wallets, mnemonic_hashes, transactions and wallet_stats tables."""
+
+    @abstractmethod
+    async def check_table(self, table_name: str) -> bool:
+        """Return True if the table exists and can be queried."""
+
+    # Wallets
+    @abstractmethod
+    async def get_wallet(self, address: str) -> Optional[dict]:
+        """Return the wallet row (address, balance, email) or None."""
+
+    @abstractmethod
+    async def get_wallets(self, addresses: List[str]) -> List[dict]:
+        """Return the wallet rows (address, balance, email) that exist among `addresses`, in one query."""
+
+    @abstractmethod
+    async def insert_wallet(self, address: str, balance: float, email: Optional[str] = None):
+        """Insert a new wallet row."""
+
+    @abstractmethod
+    async def update_wallet(self, address: str, values: dict):
+        """Update columns of an existing wallet row."""
+
+    # Mnemonic hashes
+    @abstractmethod
+    async def get_mnemonic_hash(self, address: str) -> Optional[str]:
+        """Return the stored mnemonic hash for a wallet or None."""
+
+    @abstractmethod
+    async def insert_mnemonic_hash(self, address: str, mnemonic_hash: str):
+        """Store the mnemonic hash for a wallet."""
+
+    @abstractmethod
+    async def create_wallet_with_hash(self, address: str, balance: float,
+                                      mnemonic_hash: str, email: Optional[str] = None):
+        """Insert a wallet row and its mnemonic hash in one atomic write."""
+
+    @abstractmethod
+    async def create_wallets_with_hashes(self, rows: List[Tuple[str, float, str, Optional[str]]]) -> int:
+        """
+        Bulk-insert (address, balance, mnemonic_hash, email) rows in one atomic write,
+        skipping addresses that already exist. Returns the number of wallets created.
+        """
+
+    # Transactions
+    @abstractmethod
+    async def insert_transaction(self, sender_address: str, recipient_address: str,
+                                 amount_eth: float, amount_usd: Optional[float] = None) -> int:
+        """Append a transaction row and return its id."""
+
+    @abstractmethod
+    async def transfer(self, sender_address: str, recipient_address: str,
+                       amount_eth: float, amount_usd: Optional[float] = None) -> dict:
+        """
+        Atomically debit sender, credit (or create) recipient and record the transaction.
+        Returns transaction_id, its committed timestamp, sender_balance and recipient_balance.
+        Raises WalletNotFoundError or InsufficientBalanceError.
+        """
+
+    @abstractmethod
+    async def transfer_batch(self, sender_address: str,
+                             transfers: List[Tuple[str, float, Optional[float]]]) -> dict:
+        """
+        Atomically apply many (recipient, amount_eth, amount_usd) transfers from one sender
+        with a single balance check. Returns transaction_ids and their timestamps (in input
+        order) and sender_balance.
+        Raises WalletNotFoundError or InsufficientBalanceError.
+        """
+
+    @abstractmethod
+    async def get_transactions(self, address: str, limit: int,
+                               before: Optional[Tuple[str, int]] = None) -> List[dict]:
+        """
+        Return up to `limit` transactions sent or received by a wallet, newest first.
+        `before` is a (timestamp, id) keyset cursor; only older rows are returned.
+        """
+
+    @abstractmethod
+    async def get_transaction_columns(self, since: str, until: str, limit: int,
+                                      after: Optional[Tuple[str, int]] = None) -> dict:
+        """
+        Return up to `limit` transactions with since <= timestamp < until, oldest
+        first and strictly after the (timestamp, id) cursor `after`, as column lists:
+        epoch (seconds), sender_key (an integer per sender), amount_eth and
+        amount_usd, plus last_timestamp and last_id for the next cursor.
+        """
+
+    # Wallet stats
+    @abstractmethod
+    async def get_wallet_stats(self, address: str) -> Optional[dict]:
+        """
+        Return the wallet's aggregates (total_sent, total_received, tx_count,
+        last_activity, last_transaction_id), or None if it has no transactions.
+        transfer and transfer_batch keep these up to date.
+        """
+
+    @abstractmethod
+    async def start_wallet_stats_rebuild(self) -> int:
+        """Clear the rebuild scratch table and return the newest transaction id it has to cover."""
+
+    @abstractmethod
+    async def rebuild_wallet_stats_chunk(self, after_id: int, until_id: int, limit: int) -> Optional[int]:
+        """
+        Fold the next `limit` transactions with ids in (after_id, until_id] into the
+        rebuild. Returns the last id folded, or None when there are none left.
+        """
+
+    @abstractmethod
+    async def finish_wallet_stats_rebuild(self, until_id: int) -> int:
+        """Fold in transactions newer than `until_id`, swap the rebuild in and return its wallet count."""
+
+    # Email outbox
+    @abstractmethod
+    async def enqueue_email(self, kind: str, payload: dict) -> int:
+        """Append a pending email job and return its id."""
+
+    @abstractmethod
+    async def claim_emails(self, limit: int, lease_seconds: int) -> List[dict]:
+        """
+        Claim up to `limit` due pending jobs, hiding them from other workers
+        for `lease_seconds`. Returns rows with id, kind, payload, attempts, created_at.
+        """
+
+    @abstractmethod
+    async def finish_emails(self, ids: List[int], status: str):
+        """Mark claimed jobs as finished ("sent" or "skipped")."""
+
+    @abstractmethod
+    async def retry_email(self, email_id: int, attempts: int, delay_seconds: float,
+                          error: str, failed: bool = False):
+        """Record a failed attempt and reschedule the job, or mark it "failed"."""
+
+    @abstractmethod
+    async def get_outbox_stats(self) -> dict:
+        """Return pending job count and created_at of the oldest pending job."""
+
+    # Transfer quotes
+    @abstractmethod
+    async def store_quote(self, quote_id: str, quote: dict, ttl_seconds: float) -> str:
+        """Store a quote that expires after `ttl_seconds` and return its expiry as an ISO timestamp."""
+
+    @abstractmethod
+    async def get_quote(self, quote_id: str) -> Optional[dict]:
+        """Return a live (stored and unexpired) quote, or None."""
+
+    @abstractmethod
+    async def delete_quote(self, quote_id: str) -> bool:
+        """Remove a live quote; True only for the one caller that removed it."""
+
+    async def close(self):
+        """Release connections held by the backend."""
@@ -0,0 +1,549 @@
+"""
+Embedded SQLite storage backend.
+
+Runs in WAL mode so readers never block the single writer. Every query is a
+module-level constant with bound parameters, so sqlite3 compiles it once per
+connection and reuses the prepared statement from its statement cache.
+Blocking sqlite3 calls are kept off the event loop on a dedicated thread pool.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import List, Optional, Tuple
+
+from repositories.base import Repository, WalletNotFoundError, InsufficientBalanceError, InvalidAmountError, canonical_address
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS wallets (
+    address TEXT PRIMARY KEY CHECK (address = lower(address)),
+    balance NUMERIC NOT NULL DEFAULT 0,
+    email TEXT,
+    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now') || '+00:00')
+);
+
+CREATE TABLE IF NOT EXISTS mnemonic_hashes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    wallet_address TEXT NOT NULL UNIQUE REFERENCES wallets(address) ON DELETE CASCADE,
+    mnemonic_hash TEXT NOT NULL,
+    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now') || '+00:00')
+);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sender_address TEXT NOT NULL,
+    recipient_address TEXT NOT NULL,
+    amount_eth NUMERIC NOT NULL,
+    amount_usd NUMERIC,
+    timestamp TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now') || '+00:00')
+);
+
+CREATE TABLE IF NOT EXISTS wallet_stats (
+    address TEXT PRIMARY KEY,
+    total_sent NUMERIC NOT NULL DEFAULT 0,
+    total_received NUMERIC NOT NULL DEFAULT 0,
+    tx_count INTEGER NOT NULL DEFAULT 0,
+    last_activity TEXT,
+    last_transaction_id INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS wallet_stats_rebuild (
+    address TEXT PRIMARY KEY,
+    total_sent NUMERIC NOT NULL DEFAULT 0,
+    total_received NUMERIC NOT NULL DEFAULT 0,
+    tx_count INTEGER NOT NULL DEFAULT 0,
+    last_activity TEXT,
+    last_transaction_id INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now') || '+00:00'),
+    last_error TEXT,
+    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now') || '+00:00'),
+    sent_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS transfer_quotes (
+    quote_id TEXT PRIMARY KEY,
+    quote TEXT NOT NULL,
+    expires_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_transactions_sender_timestamp
+    ON transactions(sender_address, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_recipient_timestamp
+    ON transactions(recipient_address, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_timestamp ON transactions(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_email_outbox_due ON email_outbox(next_attempt_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_transfer_quotes_expires_at ON transfer_quotes(expires_at);
+"""
+
+CHECK_TABLE = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+SELECT_WALLET = "SELECT address, balance, email FROM wallets WHERE address = ?"
+SELECT_BALANCE = "SELECT balance FROM wallets WHERE address = ?"
+# One cached statement for any number of addresses, passed as a JSON array
+SELECT_WALLETS = "SELECT address, balance, email FROM wallets WHERE address IN (SELECT value FROM json_each(?))"
+INSERT_WALLET = "INSERT INTO wallets (address, balance, email) VALUES (?, ?, ?)"
+DEBIT_WALLET = "UPDATE wallets SET balance = balance - ? WHERE address = ?"
+CREDIT_WALLET = "UPDATE wallets SET balance = balance + ? WHERE address = ?"
+CREDIT_OR_CREATE_WALLET = """
+INSERT INTO wallets (address, balance) VALUES (?, ?)
+ON CONFLICT (address) DO UPDATE SET balance = balance + excluded.balance
+"""
+SELECT_MNEMONIC_HASH = "SELECT mnemonic_hash FROM mnemonic_hashes WHERE wallet_address = ?"
+INSERT_MNEMONIC_HASH = "INSERT INTO mnemonic_hashes (wallet_address, mnemonic_hash) VALUES (?, ?)"
+INSERT_WALLET_IF_NEW = "INSERT INTO wallets (address, balance, email) VALUES (?, ?, ?) ON CONFLICT (address) DO NOTHING"
+INSERT_MNEMONIC_HASH_IF_NEW = """
+INSERT INTO mnemonic_hashes (wallet_address, mnemonic_hash) VALUES (?, ?)
+ON CONFLICT (wallet_address) DO NOTHING
+"""
+INSERT_TRANSACTION = """
+INSERT INTO transactions (sender_address, recipient_address, amount_eth, amount_usd)
+VALUES (?, ?, ?, ?)
+"""
+SELECT_TRANSACTION_TIMESTAMPS = "SELECT timestamp FROM transactions WHERE id BETWEEN ? AND ? ORDER BY id"
+SELECT_TRANSACTIONS_PAGE = """
+SELECT * FROM (
+    SELECT id, sender_address, recipient_address, amount_eth, amount_usd, timestamp
+    FROM transactions
+    WHERE sender_address = :address AND (timestamp, id) < (:before_timestamp, :before_id)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT :limit
+)
+UNION ALL
+SELECT * FROM (
+    SELECT id, sender_address, recipient_address, amount_eth, amount_usd, timestamp
+    FROM transactions
+    WHERE recipient_address = :address AND sender_address <> :address
+      AND (timestamp, id) < (:before_timestamp, :before_id)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT :limit
+)
+ORDER BY timestamp DESC, id DESC
+LIMIT :limit
+"""
+# Folds the transactions with ids in (:after, :until] into per-wallet totals.
+# Writes hold the database write lock, so new ids are always above :until.
+APPLY_WALLET_STATS = """
+INSERT INTO {table} (address, total_sent, total_received, tx_count, last_activity, last_transaction_id)
+SELECT address, SUM(sent), SUM(received), COUNT(DISTINCT id), MAX(timestamp), MAX(id)
+FROM (
+    SELECT sender_address AS address, amount_eth AS sent, 0 AS received, id, timestamp
+    FROM transactions WHERE id > :after AND id <= :until
+    UNION ALL
+    SELECT recipient_address, 0, amount_eth, id, timestamp
+    FROM transactions WHERE id > :after AND id <= :until
+)
+WHERE true
+GROUP BY address
+ON CONFLICT (address) DO UPDATE SET
+    total_sent = total_sent + excluded.total_sent,
+    total_received = total_received + excluded.total_received,
+    tx_count = tx_count + excluded.tx_count,
+    last_activity = MAX(last_activity, excluded.last_activity),
+    last_transaction_id = MAX(last_transaction_id, excluded.last_transaction_id)
+"""
+UPDATE_WALLET_STATS = APPLY_WALLET_STATS.format(table="wallet_stats")
+UPDATE_WALLET_STATS_REBUILD = APPLY_WALLET_STATS.format(table="wallet_stats_rebuild")
+SELECT_WALLET_STATS = """
+SELECT address, total_sent, total_received, tx_count, last_activity, last_transaction_id
+FROM wallet_stats WHERE address = ?
+"""
+SELECT_MAX_TRANSACTION_ID = "SELECT COALESCE(MAX(id), 0) FROM transactions"
+SELECT_CHUNK_END = "SELECT MAX(id) FROM (SELECT id FROM transactions WHERE id > ? AND id <= ? ORDER BY id LIMIT ?)"
+# Oldest-first scan for analytics; the sender's wallet rowid stands in for the address
+SELECT_TRANSACTION_COLUMNS = """
+SELECT t.id, t.timestamp, (julianday(t.timestamp) - 2440587.5) * 86400.0 AS epoch,
+       COALESCE(w.rowid, 0) AS sender_key, t.amount_eth, t.amount_usd
+FROM transactions t
+LEFT JOIN wallets w ON w.address = t.sender_address
+WHERE t.timestamp >= :since AND t.timestamp < :until
+  AND (t.timestamp, t.id) > (:after_timestamp, :after_id)
+ORDER BY t.timestamp, t.id
+LIMIT :limit
+"""
+NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now') || '+00:00'"
+INSERT_EMAIL = "INSERT INTO email_outbox (kind, payload) VALUES (?, ?)"
+SELECT_DUE_EMAILS = f"""
+SELECT id, kind, payload, attempts, created_at FROM email_outbox
+WHERE status = 'pending' AND next_attempt_at <= {NOW}
+ORDER BY next_attempt_at
+LIMIT ?
+"""
+LEASE_EMAIL = """
+UPDATE email_outbox
+SET next_attempt_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', '+' || ? || ' seconds') || '+00:00'
+WHERE id = ?
+"""
+FINISH_EMAIL = f"UPDATE email_outbox SET status = ?, sent_at = {NOW} WHERE id = ?"
+RETRY_EMAIL = """
+UPDATE email_outbox
+SET status = ?, attempts = ?, last_error = ?,
+    next_attempt_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', '+' || ? || ' seconds') || '+00:00'
+WHERE id = ?
+"""
+OUTBOX_STATS = "SELECT COUNT(*) AS pending, MIN(created_at) AS oldest_pending_at FROM email_outbox WHERE status = 'pending'"
+DELETE_EXPIRED_QUOTES = f"DELETE FROM transfer_quotes WHERE expires_at <= {NOW}"
+INSERT_QUOTE = """
+INSERT INTO transfer_quotes (quote_id, quote, expires_at)
+VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', '+' || ? || ' seconds') || '+00:00')
+RETURNING expires_at
+"""
+SELECT_QUOTE = f"SELECT quote FROM transfer_quotes WHERE quote_id = ? AND expires_at > {NOW}"
+DELETE_QUOTE = f"DELETE FROM transfer_quotes WHERE quote_id = ? AND expires_at > {NOW}"
+# Sorts after every ISO-8601 timestamp, standing in for "no cursor"
+MAX_TIMESTAMP = "9999-12-31T23:59:59.999+00:00"
+MAX_ID = 2 ** 63 - 1
+WALLET_COLUMNS = {"balance", "email"}
+
+
+class SQLiteRepository(Repository):
+    def __init__(self, path: str, threads: int = 4):
+        self.path = path
+        self._local = threading.local()
+        # sqlite3 calls block, so they run on a small dedicated pool; each
+        # worker thread keeps its own connection and statement cache
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="sqlite")
+        self._connection().executescript(SCHEMA)
+
+    async def _run(self, fn, *args):
+        """Run a blocking sqlite3 call on the repository's thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args))
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self):
+        """Run a write transaction, taking the database write lock up front."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _check_table(self, table_name: str) -> bool:
+        try:
+            return self._connection().execute(CHECK_TABLE, (table_name,)).fetchone() is not None
+        except:
+            return False
+
+    def _get_wallet(self, address: str) -> Optional[dict]:
+        row = self._connection().execute(SELECT_WALLET, (canonical_address(address),)).fetchone()
+        return dict(row) if row else None
+
+    def _get_wallets(self, addresses: List[str]) -> List[dict]:
+        keys = json.dumps([canonical_address(address) for address in addresses])
+        return [dict(row) for row in self._connection().execute(SELECT_WALLETS, (keys,)).fetchall()]
+
+    def _insert_wallet(self, address: str, balance: float, email: Optional[str] = None):
+        self._connection().execute(INSERT_WALLET, (canonical_address(address), balance, email))
+
+    def _update_wallet(self, address: str, values: dict):
+        columns = [column for column in values if column in WALLET_COLUMNS]
+        if not columns:
+            return
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        self._connection().execute(
+            f"UPDATE wallets SET {assignments} WHERE address = ?",
+            [values[column] for column in columns] + [canonical_address(address)]
+        )
+
+    def _get_mnemonic_hash(self, address: str) -> Optional[str]:
+        row = self._connection().execute(SELECT_MNEMONIC_HASH, (canonical_address(address),)).fetchone()
+        return row["mnemonic_hash"] if row else None
+
+    def _insert_mnemonic_hash(self, address: str, mnemonic_hash: str):
+        self._connection().execute(INSERT_MNEMONIC_HASH, (canonical_address(address), mnemonic_hash))
+
+    def _create_wallet_with_hash(self, address: str, balance: float,
+                                 mnemonic_hash: str, email: Optional[str] = None):
+        address = canonical_address(address)
+        with self._write() as conn:
+            conn.execute(INSERT_WALLET, (address, balance, email))
+            conn.execute(INSERT_MNEMONIC_HASH, (address, mnemonic_hash))
+
+    def _create_wallets_with_hashes(self, rows: List[Tuple[str, float, str, Optional[str]]]) -> int:
+        created = 0
+        with self._write() as conn:
+            for address, balance, mnemonic_hash, email in rows:
+                address = canonical_address(address)
+                if conn.execute(INSERT_WALLET_IF_NEW, (address, balance, email)).rowcount:
+                    conn.execute(INSERT_MNEMONIC_HASH_IF_NEW, (address, mnemonic_hash))
+                    created += 1
+        return created
+
+    def _insert_transaction(self, sender_address: str, recipient_address: str,
+                            amount_eth: float, amount_usd: Optional[float] = None) -> int:
+        cursor = self._connection().execute(
+            INSERT_TRANSACTION,
+            (canonical_address(sender_address), canonical_address(recipient_address), amount_eth, amount_usd)
+        )
+        return cursor.lastrowid
+
+    def _transfer(self, sender_address: str, recipient_address: str,
+                  amount_eth: float, amount_usd: Optional[float] = None) -> dict:
+        sender = canonical_address(sender_address)
+        recipient = canonical_address(recipient_address)
+        # Same check as transfer_funds; a negative amount would move funds the other way
+        if amount_eth is None or not amount_eth > 0:
+            raise InvalidAmountError(sender)
+        with self._write() as conn:
+            row = conn.execute(SELECT_BALANCE, (sender,)).fetchone()
+            if row is None:
+                raise WalletNotFoundError(sender)
+            if row["balance"] < amount_eth:
+                raise InsufficientBalanceError(sender)
+            conn.execute(DEBIT_WALLET, (amount_eth, sender))
+
+            if conn.execute(CREDIT_WALLET, (amount_eth, recipient)).rowcount == 0:
+                conn.execute(INSERT_WALLET, (recipient, amount_eth, None))
+
+            transaction_id = conn.execute(
+                INSERT_TRANSACTION, (sender, recipient, amount_eth, amount_usd)
+            ).lastrowid
+            conn.execute(UPDATE_WALLET_STATS, {"after": transaction_id - 1, "until": transaction_id})
+            timestamp = conn.execute(SELECT_TRANSACTION_TIMESTAMPS, (transaction_id, transaction_id)).fetchone()[0]
+            sender_balance = conn.execute(SELECT_BALANCE, (sender,)).fetchone()["balance"]
+            recipient_balance = conn.execute(SELECT_BALANCE, (recipient,)).fetchone()["balance"]
+
+        return {
+            "transaction_id": transaction_id,
+            "timestamp": timestamp,
+            "sender_balance": sender_balance,
+            "recipient_balance": recipient_balance
+        }
+
+    def _transfer_batch(self, sender_address: str,
+                        transfers: List[Tuple[str, float, Optional[float]]]) -> dict:
+        sender = canonical_address(sender_address)
+        rows = [(sender, canonical_address(recipient), amount_eth, amount_usd)
+                for recipient, amount_eth, amount_usd in transfers]
+        if any(amount_eth is None or not amount_eth > 0 for _, _, amount_eth, _ in rows):
+            raise InvalidAmountError(sender)
+        credits = {}
+        for _, recipient, amount_eth, _ in rows:
+            credits[recipient] = credits.get(recipient, 0) + amount_eth
+        total = sum(credits.values())
+
+        with self._write() as conn:
+            row = conn.execute(SELECT_BALANCE, (sender,)).fetchone()
+            if row is None:
+                raise WalletNotFoundError(sender)
+            if row["balance"] < total:
+                raise InsufficientBalanceError(sender)
+            conn.execute(DEBIT_WALLET, (total, sender))
+            conn.executemany(CREDIT_OR_CREATE_WALLET, credits.items())
+            conn.executemany(INSERT_TRANSACTION, rows)
+            # The write lock is held, so the new ids are the contiguous run ending here
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            conn.execute(UPDATE_WALLET_STATS, {"after": last_id - len(rows), "until": last_id})
+            timestamps = [row[0] for row in conn.execute(SELECT_TRANSACTION_TIMESTAMPS, (last_id - len(rows) + 1, last_id))]
+            sender_balance = conn.execute(SELECT_BALANCE, (sender,)).fetchone()["balance"]
+
+        return {
+            "transaction_ids": list(range(last_id - len(rows) + 1, last_id + 1)),
+            "timestamps": timestamps,
+            "sender_balance": sender_balance
+        }
+
+    def _get_transactions(self, address: str, limit: int,
+                          before: Optional[Tuple[str, int]] = None) -> List[dict]:
+        before_timestamp, before_id = before if before else (MAX_TIMESTAMP, MAX_ID)
+        rows = self._connection().execute(SELECT_TRANSACTIONS_PAGE, {
+            "address": canonical_address(address),
+            "before_timestamp": before_timestamp,
+            "before_id": before_id,
+            "limit": limit
+        }).fetchall()
+        return [dict(row) for row in rows]
+
+    def _get_transaction_columns(self, since: str, until: str, limit: int,
+                                 after: Optional[Tuple[str, int]] = None) -> dict:
+        after_timestamp, after_id = after if after else ("", 0)
+        rows = self._connection().execute(SELECT_TRANSACTION_COLUMNS, {
+            "since": since,
+            "until": until,
+            "after_timestamp": after_timestamp,
+            "after_id": after_id,
+            "limit": limit
+        }).fetchall()
+        return {
+            "epoch": [row["epoch"] for row in rows],
+            "sender_key": [row["sender_key"] for row in rows],
+            "amount_eth": [row["amount_eth"] for row in rows],
+            "amount_usd": [row["amount_usd"] for row in rows],
+            "last_timestamp": rows[-1]["timestamp"] if rows else None,
+            "last_id": rows[-1]["id"] if rows else None
+        }
+
+    def _get_wallet_stats(self, address: str) -> Optional[dict]:
+        row = self._connection().execute(SELECT_WALLET_STATS, (canonical_address(address),)).fetchone()
+        return dict(row) if row else None
+
+    def _start_wallet_stats_rebuild(self) -> int:
+        with self._write() as conn:
+            conn.execute("DELETE FROM wallet_stats_rebuild")
+            return conn.execute(SELECT_MAX_TRANSACTION_ID).fetchone()[0]
+
+    def _rebuild_wallet_stats_chunk(self, after_id: int, until_id: int, limit: int) -> Optional[int]:
+        with self._write() as conn:
+            last_id = conn.execute(SELECT_CHUNK_END, (after_id, until_id, limit)).fetchone()[0]
+            if last_id is not None:
+                conn.execute(UPDATE_WALLET_STATS_REBUILD, {"after": after_id, "until": last_id})
+        return last_id
+
+    def _finish_wallet_stats_rebuild(self, until_id: int) -> int:
+        with self._write() as conn:
+            conn.execute(UPDATE_WALLET_STATS_REBUILD, {"after": until_id, "until": MAX_ID})
+            conn.execute("DELETE FROM wallet_stats")
+            wallets = conn.execute("INSERT INTO wallet_stats SELECT * FROM wallet_stats_rebuild").rowcount
+            conn.execute("DELETE FROM wallet_stats_rebuild")
+        return wallets
+
+    def _enqueue_email(self, kind: str, payload: dict) -> int:
+        return self._connection().execute(INSERT_EMAIL, (kind, json.dumps(payload))).lastrowid
+
+    def _claim_emails(self, limit: int, lease_seconds: int) -> List[dict]:
+        with self._write() as conn:
+            rows = [dict(row) for row in conn.execute(SELECT_DUE_EMAILS, (limit,)).fetchall()]
+            conn.executemany(LEASE_EMAIL, ((lease_seconds, row["id"]) for row in rows))
+        for row in rows:
+            row["payload"] = json.loads(row["payload"])
+        return rows
+
+    def _finish_emails(self, ids: List[int], status: str):
+        with self._write() as conn:
+            conn.executemany(FINISH_EMAIL, ((status, email_id) for email_id in ids))
+
+    def _retry_email(self, email_id: int, attempts: int, delay_seconds: float,
+                     error: str, failed: bool = False):
+        self._connection().execute(
+            RETRY_EMAIL, ("failed" if failed else "pending", attempts, error, delay_seconds, email_id)
+        )
+
+    def _get_outbox_stats(self) -> dict:
+        return dict(self._connection().execute(OUTBOX_STATS).fetchone())
+
+    def _store_quote(self, quote_id: str, quote: dict, ttl_seconds: float) -> str:
+        with self._write() as conn:
+            conn.execute(DELETE_EXPIRED_QUOTES)
+            return conn.execute(INSERT_QUOTE, (quote_id, json.dumps(quote), ttl_seconds)).fetchone()[0]
+
+    def _get_quote(self, quote_id: str) -> Optional[dict]:
+        row = self._connection().execute(SELECT_QUOTE, (quote_id,)).fetchone()
+        return json.loads(row["quote"]) if row else None
+
+    def _delete_quote(self, quote_id: str) -> bool:
+        return self._connection().execute(DELETE_QUOTE, (quote_id,)).rowcount == 1
+
+    async def check_table(self, table_name: str) -> bool:
+        return await self._run(self._check_table, table_name)
+
+    async def get_wallet(self, address: str) -> Optional[dict]:
+        return await self._run(self._get_wallet, address)
+
+    async def get_wallets(self, addresses: List[str]) -> List[dict]:
+        return await self._run(self._get_wallets, addresses)
+
+    async def insert_wallet(self, address: str, balance: float, email: Optional[str] = None):
+        await self._run(self._insert_wallet, address, balance, email)
+
+    async def update_wallet(self, address: str, values: dict):
+        await self._run(self._update_wallet, address, values)
+
+    async def get_mnemonic_hash(self, address: str) -> Optional[str]:
+        return await self._run(self._get_mnemonic_hash, address)
+
+    async def insert_mnemonic_hash(self, address: str, mnemonic_hash: str):
+        await self._run(self._insert_mnemonic_hash, address, mnemonic_hash)
+
+    async def create_wallet_with_hash(self, address: str, balance: float,
+                                      mnemonic_hash: str, email: Optional[str] = None):
+        await self._run(self._create_wallet_with_hash, address, balance, mnemonic_hash, email)
+
+    async def create_wallets_with_hashes(self, rows: List[Tuple[str, float, str, Optional[str]]]) -> int:
+        return await self._run(self._create_wallets_with_hashes, rows)
+
+    async def insert_transaction(self, sender_address: str, recipient_address: str,
+                                 amount_eth: float, amount_usd: Optional[float] = None) -> int:
+        return await self._run(self._insert_transaction, sender_address, recipient_address, amount_eth, amount_usd)
+
+    async def transfer(self, sender_address: str, recipient_address: str,
+                       amount_eth: float, amount_usd: Optional[float] = None) -> dict:
+        return await self._run(self._transfer, sender_address, recipient_address, amount_eth, amount_usd)
+
+    async def transfer_batch(self, sender_address: str,
+                             transfers: List[Tuple[str, float, Optional[float]]]) -> dict:
+        return await self._run(self._transfer_batch, sender_address, transfers)
+
+    async def get_transactions(self, address: str, limit: int,
+                               before: Optional[Tuple[str, int]] = None) -> List[dict]:
+        return await self._run(self._get_transactions, address, limit, before)
+
+    async def get_transaction_columns(self, since: str, until: str, limit: int,
+                                      after: Optional[Tuple[str, int]] = None) -> dict:
+        return await self._run(self._get_transaction_columns, since, until, limit, after)
+
+    async def get_wallet_stats(self, address: str) -> Optional[dict]:
+        return await self._run(self._get_wallet_stats, address)
+
+    async def start_wallet_stats_rebuild(self) -> int:
+        return await self._run(self._start_wallet_stats_rebuild)
+
+    async def rebuild_wallet_stats_chunk(self, after_id: int, until_id: int, limit: int) -> Optional[int]:
+        return await self._run(self._rebuild_wallet_stats_chunk, after_id, until_id, limit)
+
+    async def finish_wallet_stats_rebuild(self, until_id: int) -> int:
+        return await self._run(self._finish_wallet_stats_rebuild, until_id)
+
+    async def enqueue_email(self, kind: str, payload: dict) -> int:
+        return await self._run(self._enqueue_email, kind, payload)
+
+    async def claim_emails(self, limit: int, lease_seconds: int) -> List[dict]:
+        return await self._run(self._claim_emails, limit, lease_seconds)
+
+    async def finish_emails(self, ids: List[int], status: str):
+        await self._run(self._finish_emails, ids, status)
+
+    async def retry_email(self, email_id: int, attempts: int, delay_seconds: float,
+                          error: str, failed: bool = False):
+        await self._run(self._retry_email, email_id, attempts, delay_seconds, error, failed)
+
+    async def get_outbox_stats(self) -> dict:
+        return await self._run(self._get_outbox_stats)
+
+    async def store_quote(self, quote_id: str, quote: dict, ttl_seconds: float) -> str:
+        return await self._run(self._store_quote, quote_id, quote, ttl_seconds)
+
+    async def get_quote(self, quote_id: str) -> Optional[dict]:
+        return await self._run(self._get_quote, quote_id)
+
+    async def delete_quote(self, quote_id: str) -> bool:
+        return await self._run(self._delete_quote, quote_id)
+
+    async def close(self):
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,215 @@
+"""
+Supabase (PostgREST) storage backend.
+
+Uses the async Supabase client, so queries share one pooled HTTP connection
+set and never block the event loop.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from postgrest.exceptions import APIError
+from supabase import AsyncClient
+
+from repositories.base import Repository, WalletNotFoundError, InsufficientBalanceError, InvalidAmountError, canonical_address
+
+
+def raise_transfer_error(error: APIError, sender_address: str):
+    """Map the exceptions raised by the transfer functions to repository errors."""
+    message = error.message or ""
+    if "insufficient_balance" in message:
+        raise InsufficientBalanceError(sender_address)
+    if "wallet_not_found" in message:
+        raise WalletNotFoundError(sender_address)
+    if "invalid_amount" in message:
+        raise InvalidAmountError(sender_address)
+    raise error
+
+
+class SupabaseRepository(Repository):
+    def __init__(self, url: str, key: str):
+        self.client: AsyncClient = AsyncClient(url, key)
+
+    async def check_table(self, table_name: str) -> bool:
+        try:
+            await self.client.table(table_name).select("*").limit(1).execute()
+            return True
+        except:
+            return False
+
+    async def get_wallet(self, address: str) -> Optional[dict]:
+        response = await self.client.table("wallets").select("address, balance, email").eq("address", canonical_address(address)).execute()
+        return response.data[0] if response.data else None
+
+    async def get_wallets(self, addresses: List[str]) -> List[dict]:
+        # An RPC keeps the address list in the request body instead of the URL
+        response = await self.client.rpc("get_wallets", {
+            "p_addresses": [canonical_address(address) for address in addresses]
+        }).execute()
+        return response.data or []
+
+    async def insert_wallet(self, address: str, balance: float, email: Optional[str] = None):
+        await self.client.table("wallets").insert({
+            "address": canonical_address(address),
+            "balance": balance,
+            "email": email
+        }).execute()
+
+    async def update_wallet(self, address: str, values: dict):
+        await self.client.table("wallets").update(values).eq("address", canonical_address(address)).execute()
+
+    async def get_mnemonic_hash(self, address: str) -> Optional[str]:
+        response = await self.client.table("mnemonic_hashes").select("mnemonic_hash").eq("wallet_address", canonical_address(address)).execute()
+        return response.data[0]["mnemonic_hash"] if response.data else None
+
+    async def insert_mnemonic_hash(self, address: str, mnemonic_hash: str):
+        await self.client.table("mnemonic_hashes").insert({
+            "wallet_address": canonical_address(address),
+            "mnemonic_hash": mnemonic_hash
+        }).execute()
+
+    async def create_wallet_with_hash(self, address: str, balance: float,
+                                      mnemonic_hash: str, email: Optional[str] = None):
+        await self.client.rpc("create_wallet_with_hash", {
+            "p_address": canonical_address(address),
+            "p_balance": balance,
+            "p_mnemonic_hash": mnemonic_hash,
+            "p_email": email
+        }).execute()
+
+    async def create_wallets_with_hashes(self, rows: List[Tuple[str, float, str, Optional[str]]]) -> int:
+        response = await self.client.rpc("create_wallets_with_hashes", {
+            "p_addresses": [canonical_address(address) for address, _, _, _ in rows],
+            "p_balances": [balance for _, balance, _, _ in rows],
+            "p_mnemonic_hashes": [mnemonic_hash for _, _, mnemonic_hash, _ in rows],
+            "p_emails": [email for _, _, _, email in rows]
+        }).execute()
+        return response.data or 0
+
+    async def insert_transaction(self, sender_address: str, recipient_address: str,
+                                 amount_eth: float, amount_usd: Optional[float] = None) -> int:
+        response = await self.client.table("transactions").insert({
+            "sender_address": canonical_address(sender_address),
+            "recipient_address": canonical_address(recipient_address),
+            "amount_eth": amount_eth,
+            "amount_usd": amount_usd
+        }).execute()
+        return response.data[0]["id"] if response.data else None
+
+    async def transfer(self, sender_address: str, recipient_address: str,
+                       amount_eth: float, amount_usd: Optional[float] = None) -> dict:
+        try:
+            response = await self.client.rpc("transfer_funds", {
+                "p_sender": canonical_address(sender_address),
+                "p_recipient": canonical_address(recipient_address),
+                "p_amount_eth": amount_eth,
+                "p_amount_usd": amount_usd
+            }).execute()
+            return response.data or {}
+        except APIError as e:
+            raise_transfer_error(e, sender_address)
+
+    async def transfer_batch(self, sender_address: str,
+                             transfers: List[Tuple[str, float, Optional[float]]]) -> dict:
+        try:
+            response = await self.client.rpc("transfer_funds_batch", {
+                "p_sender": canonical_address(sender_address),
+                "p_recipients": [canonical_address(recipient) for recipient, _, _ in transfers],
+                "p_amounts_eth": [amount_eth for _, amount_eth, _ in transfers],
+                "p_amounts_usd": [amount_usd for _, _, amount_usd in transfers]
+            }).execute()
+            return response.data or {}
+        except APIError as e:
+            raise_transfer_error(e, sender_address)
+
+    async def get_transactions(self, address: str, limit: int,
+                               before: Optional[Tuple[str, int]] = None) -> List[dict]:
+        before_timestamp, before_id = before if before else (None, None)
+        response = await self.client.rpc("transaction_history_page", {
+            "p_address": canonical_address(address),
+            "p_limit": limit,
+            "p_before_timestamp": before_timestamp,
+            "p_before_id": before_id
+        }).execute()
+        return response.data
+
+    async def get_transaction_columns(self, since: str, until: str, limit: int,
+                                      after: Optional[Tuple[str, int]] = None) -> dict:
+        after_timestamp, after_id = after if after else (None, None)
+        response = await self.client.rpc("transaction_columns", {
+            "p_since": since,
+            "p_until": until,
+            "p_limit": limit,
+            "p_after_timestamp": after_timestamp,
+            "p_after_id": after_id
+        }).execute()
+        return response.data
+
+    async def get_wallet_stats(self, address: str) -> Optional[dict]:
+        response = await self.client.table("wallet_stats").select("*").eq("address", canonical_address(address)).execute()
+        return response.data[0] if response.data else None
+
+    async def start_wallet_stats_rebuild(self) -> int:
+        response = await self.client.rpc("wallet_stats_rebuild_start", {}).execute()
+        return response.data or 0
+
+    async def rebuild_wallet_stats_chunk(self, after_id: int, until_id: int, limit: int) -> Optional[int]:
+        response = await self.client.rpc("wallet_stats_rebuild_chunk", {
+            "p_after": after_id,
+            "p_until": until_id,
+            "p_limit": limit
+        }).execute()
+        return response.data
+
+    async def finish_wallet_stats_rebuild(self, until_id: int) -> int:
+        response = await self.client.rpc("wallet_stats_rebuild_finish", {"p_until": until_id}).execute()
+        return response.data or 0
+
+    async def enqueue_email(self, kind: str, payload: dict) -> int:
+        response = await self.client.table("email_outbox").insert({"kind": kind, "payload": payload}).execute()
+        return response.data[0]["id"] if response.data else None
+
+    async def claim_emails(self, limit: int, lease_seconds: int) -> List[dict]:
+        response = await self.client.rpc("claim_email_outbox", {
+            "p_limit": limit,
+            "p_lease_seconds": lease_seconds
+        }).execute()
+        return response.data
+
+    async def finish_emails(self, ids: List[int], status: str):
+        await self.client.table("email_outbox").update({
+            "status": status,
+            "sent_at": datetime.now(timezone.utc).isoformat()
+        }).in_("id", ids).execute()
+
+    async def retry_email(self, email_id: int, attempts: int, delay_seconds: float,
+                          error: str, failed: bool = False):
+        next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+        await self.client.table("email_outbox").update({
+            "status": "failed" if failed else "pending",
+            "attempts": attempts,
+            "next_attempt_at": next_attempt_at.isoformat(),
+            "last_error": error
+        }).eq("id", email_id).execute()
+
+    async def get_outbox_stats(self) -> dict:
+        response = await self.client.rpc("email_outbox_stats", {}).execute()
+        return response.data
+
+    async def store_quote(self, quote_id: str, quote: dict, ttl_seconds: float) -> str:
+        response = await self.client.rpc("store_transfer_quote", {
+            "p_quote_id": quote_id,
+            "p_quote": quote,
+            "p_ttl_seconds": ttl_seconds
+        }).execute()
+        return response.data
+
+    async def get_quote(self, quote_id: str) -> Optional[dict]:
+        response = await self.client.rpc("get_transfer_quote", {"p_quote_id": quote_id}).execute()
+        return response.data
+
+    async def delete_quote(self, quote_id: str) -> bool:
+        response = await self.client.rpc("consume_transfer_quote", {"p_quote_id": quote_id}).execute()
+        return bool(response.data)
+
+    async def close(self):
+        await self.client.postgrest.aclose()
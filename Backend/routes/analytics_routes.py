@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Query
+
+from utils.models import VolumeResponse
+from services.analytics_service import get_volume
+
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+
+@router.get("/volume", response_model=VolumeResponse)
+async def get_volume_endpoint(
+    interval: str = Query("hour", pattern="^(hour|day)$"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """Get ETH/USD volume, transfer count, unique senders and transfer-size percentiles per hour or day."""
+    result = await get_volume(interval, start, end)
+    return VolumeResponse(**result)
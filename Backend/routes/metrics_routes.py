@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from services.email_notification_service import get_outbox_metrics
+from services.event_service import wallet_events
+from services.price_service import eth_price_cache
+from services.transfer_service import execute_results
+from services.wallet_pool_service import get_wallet_pool_stats
+from services.wallet_service import balance_cache
+from utils.key_derivation import get_key_derivation_stats
+from utils.metrics import render_metrics
+from utils.signature_verifier import get_verifier_stats
+
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Prometheus scrape endpoint: per-route and per-upstream latency plus the /stats counters."""
+    component_stats = {
+        "price_cache": eth_price_cache.stats(),
+        "balance_cache": balance_cache.stats(),
+        "signatures": get_verifier_stats(),
+        "key_derivation": get_key_derivation_stats(),
+        "wallet_pool": get_wallet_pool_stats(),
+        "idempotency": execute_results.stats(),
+        "events": wallet_events.stats()
+    }
+    try:
+        component_stats["email_outbox"] = await get_outbox_metrics()
+    except Exception:
+        # The outbox stats need a storage round trip; never fail a scrape over them
+        pass
+    return PlainTextResponse(render_metrics(component_stats), media_type="text/plain; version=0.0.4")
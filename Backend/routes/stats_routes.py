@@ -0,0 +1,61 @@
+from fastapi import APIRouter
+
+from services.email_notification_service import get_outbox_metrics
+from services.event_service import wallet_events
+from services.price_service import eth_price_cache
+from services.transfer_service import execute_results
+from services.wallet_pool_service import get_wallet_pool_stats
+from services.wallet_service import balance_cache
+from utils.signature_verifier import get_verifier_stats
+from utils.key_derivation import get_key_derivation_stats
+
+
+router = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+@router.get("/email-outbox")
+async def email_outbox_stats_endpoint():
+    """Get email outbox queue depth, delivery lag and delivery counters."""
+    return await get_outbox_metrics()
+
+
+@router.get("/price-cache")
+async def price_cache_stats_endpoint():
+    """Get ETH/USD price cache age and hit/miss counters."""
+    return eth_price_cache.stats()
+
+
+@router.get("/signatures")
+async def signature_stats_endpoint():
+    """Get signature recovery backend and verification cache counters."""
+    return get_verifier_stats()
+
+
+@router.get("/key-derivation")
+async def key_derivation_stats_endpoint():
+    """Get mnemonic derivation pool utilization and admission counters."""
+    return get_key_derivation_stats()
+
+
+@router.get("/wallet-pool")
+async def wallet_pool_stats_endpoint():
+    """Get pre-generated wallet reserve depth and refill rate."""
+    return get_wallet_pool_stats()
+
+
+@router.get("/balance-cache")
+async def balance_cache_stats_endpoint():
+    """Get wallet balance cache size and hit/miss counters."""
+    return balance_cache.stats()
+
+
+@router.get("/idempotency")
+async def idempotency_stats_endpoint():
+    """Get stored Idempotency-Key results and replay/conflict counters for /transfer/execute."""
+    return execute_results.stats()
+
+
+@router.get("/events")
+async def event_stats_endpoint():
+    """Get live event subscriber counts, queue backlog and delivery/overflow counters."""
+    return wallet_events.stats()
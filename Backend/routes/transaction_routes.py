@@ -1,17 +1,32 @@
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Header, Query, Response
 
-from utils.models import Transaction, TransactionHistoryResponse
-from services.transaction_service import get_transaction_history
+from utils.models import TransactionHistoryResponse
+from utils.config import HISTORY_PAGE_SIZE, HISTORY_MAX_PAGE_SIZE
+from utils.etag import etag_matches, not_modified
+from services.transaction_service import get_transaction_history, get_history_etag
 
 
 router = APIRouter(prefix="/transaction", tags=["Transaction"])
 
 
 @router.get("/history/{address}", response_model=TransactionHistoryResponse)
-async def get_transaction_history_endpoint(address: str):
-    """Get transaction history for a wallet address."""
-    transactions_data = get_transaction_history(address)
-    
-    transactions = [Transaction(**tx) for tx in transactions_data]
-    return TransactionHistoryResponse(transactions=transactions)
-
+async def get_transaction_history_endpoint(
+    address: str,
+    response: Response,
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    before: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Get one page of transaction history for a wallet address, newest first.
+    Answers 304 without querying the page when If-None-Match carries its current ETag.
+    """
+    # Read the version before the page: a transfer in between yields a newer
+    # body under an older ETag, which costs a refetch but never a stale 304
+    etag = await get_history_etag(address, limit, before)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    result = await get_transaction_history(address, limit, before)
+    response.headers["ETag"] = etag
+    return TransactionHistoryResponse(**result)
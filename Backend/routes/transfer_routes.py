@@ -1,12 +1,22 @@
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Header, Response
 
 from utils.models import (
     InitiateTransferRequest,
     InitiateTransferResponse,
     ExecuteTransferRequest,
-    ExecuteTransferResponse
+    ExecuteTransferResponse,
+    InitiateBatchTransferRequest,
+    InitiateBatchTransferResponse,
+    ExecuteBatchTransferRequest,
+    ExecuteBatchTransferResponse
+)
+from services.transfer_service import (
+    initiate_transfer,
+    execute_transfer_idempotent,
+    initiate_batch_transfer,
+    execute_batch_transfer
 )
-from services.transfer_service import initiate_transfer, execute_transfer
 
 
 router = APIRouter(prefix="/transfer", tags=["Transfer"])
@@ -15,7 +25,7 @@ router = APIRouter(prefix="/transfer", tags=["Transfer"])
 @router.post("/initiate", response_model=InitiateTransferResponse)
 async def initiate_transfer_endpoint(request: InitiateTransferRequest):
     """Prepare a transfer and return approval message."""
-    result = initiate_transfer(
+    result = await initiate_transfer(
         request.sender_address,
         request.recipient_address,
         request.amount,
@@ -25,15 +35,48 @@ async def initiate_transfer_endpoint(request: InitiateTransferRequest):
 
 
 @router.post("/execute", response_model=ExecuteTransferResponse)
-async def execute_transfer_endpoint(request: ExecuteTransferRequest):
-    """Execute a transfer after signature verification."""
-    result = execute_transfer(
+async def execute_transfer_endpoint(
+    request: ExecuteTransferRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", min_length=1, max_length=255)
+):
+    """
+    Execute a transfer after signature verification. Retries that send the same
+    Idempotency-Key get the stored response instead of a second transfer.
+    """
+    result, replayed = await execute_transfer_idempotent(
+        idempotency_key,
         request.sender_address,
         request.recipient_address,
         request.eth_amount,
         request.signed_message,
         request.approval_message,
+        request.quote_id,
         request.usd_amount
     )
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
     return ExecuteTransferResponse(**result)
 
+
+@router.post("/batch/initiate", response_model=InitiateBatchTransferResponse)
+async def initiate_batch_transfer_endpoint(request: InitiateBatchTransferRequest):
+    """Quote a batch of payouts and return one approval manifest to sign."""
+    result = await initiate_batch_transfer(
+        request.sender_address,
+        [(item.recipient_address, item.amount) for item in request.transfers],
+        request.transfer_mode
+    )
+    return InitiateBatchTransferResponse(**result)
+
+
+@router.post("/batch/execute", response_model=ExecuteBatchTransferResponse)
+async def execute_batch_transfer_endpoint(request: ExecuteBatchTransferRequest):
+    """Execute every transfer of a signed batch manifest atomically."""
+    result = await execute_batch_transfer(
+        request.sender_address,
+        request.signed_message,
+        request.approval_message,
+        request.quote_id
+    )
+    return ExecuteBatchTransferResponse(**result)
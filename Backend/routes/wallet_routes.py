@@ -1,13 +1,20 @@
-from fastapi import APIRouter
+from typing import List, Optional
+from fastapi import APIRouter, Header, Query, Response
+from fastapi.responses import StreamingResponse
 
 from utils.models import (
     WalletCreateRequest,
     WalletCreateResponse,
     WalletImportRequest,
     WalletImportResponse,
-    BalanceResponse
+    BalanceResponse,
+    BalancesRequest,
+    BalancesResponse,
+    WalletStatsResponse
 )
-from services.wallet_service import create_wallet, import_wallet, get_balance
+from utils.etag import make_etag, etag_matches, not_modified
+from services.wallet_service import create_wallet, import_wallet, get_balance, get_balances, get_wallet_stats
+from services.event_service import open_wallet_events, stream_wallet_events
 
 
 router = APIRouter(prefix="/wallet", tags=["Wallet"])
@@ -16,20 +23,48 @@ router = APIRouter(prefix="/wallet", tags=["Wallet"])
 @router.post("/create", response_model=WalletCreateResponse)
 async def create_wallet_endpoint(request: WalletCreateRequest):
     """Generate a new wallet with mnemonic phrase."""
-    result = create_wallet(request.email)
+    result = await create_wallet(request.email)
     return WalletCreateResponse(**result)
 
 
 @router.post("/import", response_model=WalletImportResponse)
 async def import_wallet_endpoint(request: WalletImportRequest):
     """Import an existing wallet using mnemonic phrase."""
-    result = import_wallet(request.mnemonic, request.email)
+    result = await import_wallet(request.mnemonic, request.email)
     return WalletImportResponse(**result)
 
 
 @router.get("/balance/{address}", response_model=BalanceResponse)
-async def get_balance_endpoint(address: str):
-    """Get the current balance for a wallet address."""
-    balance = get_balance(address)
+async def get_balance_endpoint(address: str, response: Response, if_none_match: Optional[str] = Header(None)):
+    """Get the current balance for a wallet address; 304 if If-None-Match carries its current ETag."""
+    balance = await get_balance(address)
+    etag = make_etag("balance", address, balance)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return BalanceResponse(address=address, balance=balance)
 
+
+@router.post("/balances", response_model=BalancesResponse)
+async def get_balances_endpoint(request: BalancesRequest):
+    """Get balances for many wallet addresses in one request."""
+    result = await get_balances(request.addresses)
+    return BalancesResponse(**result)
+
+
+@router.get("/stats/{address}", response_model=WalletStatsResponse)
+async def get_wallet_stats_endpoint(address: str):
+    """Get total sent, total received, transaction count and last activity for a wallet."""
+    result = await get_wallet_stats(address)
+    return WalletStatsResponse(address=address, **result)
+
+
+@router.get("/events")
+async def wallet_events_endpoint(address: List[str] = Query(...)):
+    """Stream balance changes and new transactions for the given addresses as server-sent events."""
+    addresses = open_wallet_events(address)
+    return StreamingResponse(
+        stream_wallet_events(addresses),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
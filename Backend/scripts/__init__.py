@@ -0,0 +1 @@
+"""Operational command-line scripts for the backend."""
@@ -0,0 +1,215 @@
+"""
+Bulk wallet import from CSV or NDJSON.
+
+Streams the input in chunks, derives addresses on a process pool, checks
+which ones already exist with one query per chunk and writes new wallets and
+their mnemonic hashes in one batched write per chunk. Deriving the next chunk
+overlaps with writing the current one. Progress is checkpointed after every
+chunk, so an interrupted run picks up where it stopped when started again.
+
+Input is either CSV with a `mnemonic` column (and optionally `email`) or
+NDJSON objects with the same keys. Rejected records are written to a
+`.rejects.ndjson` file next to the input, appended to when resuming and
+started over otherwise.
+
+Usage (from the Backend directory):
+    python -m scripts.bulk_import wallets.csv --chunk-size 1000 --workers 8
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from utils.key_derivation import derive_addresses
+
+Record = Tuple[int, str, Optional[str]]
+
+
+def read_records(path: str, fmt: str) -> Iterator[Record]:
+    """Yield (record number, mnemonic, email) for every input record, numbered from 1."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for number, row in enumerate(rows, start=1):
+            yield number, (row.get("mnemonic") or "").strip(), (row.get("email") or "").strip() or None
+
+
+def count_records(path: str, fmt: str) -> int:
+    with open(path, "rb") as f:
+        lines = sum(1 for line in f if line.strip())
+    return lines - 1 if fmt == "csv" else lines
+
+
+def chunked(records: Iterator[Record], size: int) -> Iterator[List[Record]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_checkpoint(path: str, input_path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("input") != os.path.abspath(input_path):
+        raise SystemExit(f"Checkpoint {path} belongs to {checkpoint.get('input')}; pass --restart to ignore it")
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: dict):
+    # Write-then-rename so a crash never leaves a truncated checkpoint behind
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp, path)
+
+
+class BulkImporter:
+    def __init__(self, args):
+        from services.wallet_service import hash_mnemonic
+        from utils.config import MIN_STARTING_BALANCE, MAX_STARTING_BALANCE
+        from utils.database import repository
+        from utils.models import WalletImportRequest
+
+        self.args = args
+        self.repository = repository
+        self.hash_mnemonic = hash_mnemonic
+        self.balance_range = (MIN_STARTING_BALANCE, MAX_STARTING_BALANCE)
+        self.request_model = WalletImportRequest
+        self.checkpoint_path = args.checkpoint or args.input + ".checkpoint.json"
+        self.rejects_path = args.input + ".rejects.ndjson"
+        self.checkpoint = {} if args.restart else load_checkpoint(self.checkpoint_path, args.input)
+        self.counters = self.checkpoint.get("counters") or {
+            "created": 0, "existing": 0, "duplicates": 0, "invalid": 0
+        }
+        self.done = self.checkpoint.get("records", 0)
+
+    def validate(self, chunk: List[Record]) -> Tuple[List[Record], List[Tuple[int, str]]]:
+        """Split a chunk into valid records and (record number, reason) rejections."""
+        valid, rejected = [], []
+        for number, mnemonic, email in chunk:
+            try:
+                request = self.request_model(mnemonic=mnemonic, email=email)
+            except ValidationError as e:
+                rejected.append((number, e.errors()[0]["msg"]))
+                continue
+            valid.append((number, request.mnemonic, request.email))
+        return valid, rejected
+
+    async def derive(self, pool: ProcessPoolExecutor, records: List[Record]) -> List[Optional[str]]:
+        """Derive a chunk's addresses, split evenly across the pool's workers."""
+        loop = asyncio.get_running_loop()
+        mnemonics = [mnemonic for _, mnemonic, _ in records]
+        step = max(1, -(-len(mnemonics) // self.args.workers))
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(pool, derive_addresses, mnemonics[i:i + step])
+            for i in range(0, len(mnemonics), step)
+        ))
+        return [address for part in parts for address in part]
+
+    async def persist(self, last_record: int, records: List[Record], rejected: List[Tuple[int, str]],
+                      addresses: List[Optional[str]], rejects):
+        """Write one chunk's new wallets in a single batch, then record its rejects and checkpoint it."""
+        rejected = rejected + [(number, "Mnemonic could not be derived")
+                               for (number, _, _), address in zip(records, addresses) if address is None]
+        new = {}
+        for (number, mnemonic, email), address in zip(records, addresses):
+            if address is None:
+                continue
+            elif address in new:
+                self.counters["duplicates"] += 1
+            else:
+                new[address] = (mnemonic, email)
+
+        if new:
+            existing = {wallet["address"] for wallet in await self.repository.get_wallets(list(new))}
+            rows = [
+                (address, round(random.uniform(*self.balance_range), 4), self.hash_mnemonic(mnemonic), email)
+                for address, (mnemonic, email) in new.items() if address not in existing
+            ]
+            created = await self.repository.create_wallets_with_hashes(rows) if rows else 0
+            self.counters["created"] += created
+            self.counters["existing"] += len(new) - created
+
+        for number, reason in sorted(rejected):
+            rejects.write(json.dumps({"record": number, "reason": reason}) + "\n")
+        rejects.flush()
+        self.counters["invalid"] += len(rejected)
+        self.done = last_record
+        save_checkpoint(self.checkpoint_path, {
+            "input": os.path.abspath(self.args.input),
+            "records": self.done,
+            "counters": self.counters
+        })
+
+    def report(self, total: int, started: float, start_done: int):
+        rate = (self.done - start_done) / max(time.perf_counter() - started, 1e-9)
+        eta = (total - self.done) / rate if rate else 0
+        c = self.counters
+        print(f"{self.done:,}/{total:,} records ({self.done / max(total, 1):.1%}) | created {c['created']:,} | "
+              f"existing {c['existing']:,} | duplicates {c['duplicates']:,} | invalid {c['invalid']:,} | "
+              f"{rate:,.0f} records/s | ETA {eta:,.0f}s", flush=True)
+
+    async def run(self):
+        fmt = self.args.format
+        total = count_records(self.args.input, fmt)
+        start_done = self.done
+        if start_done:
+            print(f"Resuming after record {start_done:,} from {self.checkpoint_path}")
+
+        records = (record for record in read_records(self.args.input, fmt) if record[0] > start_done)
+        started = time.perf_counter()
+        # spawn keeps the workers free of the parent's database connections
+        context = multiprocessing.get_context("spawn")
+        # A resumed run keeps the rejects it already wrote; a fresh one starts the file over
+        rejects_mode = "a" if self.checkpoint else "w"
+        with ProcessPoolExecutor(max_workers=self.args.workers, mp_context=context) as pool, \
+                open(self.rejects_path, rejects_mode) as rejects:
+            previous = None
+            for chunk in chunked(records, self.args.chunk_size):
+                valid, rejected = self.validate(chunk)
+                derivation = asyncio.ensure_future(self.derive(pool, valid))
+                if previous is not None:
+                    await self.persist(*previous, rejects)
+                    self.report(total, started, start_done)
+                previous = (chunk[-1][0], valid, rejected, await derivation)
+            if previous is not None:
+                await self.persist(*previous, rejects)
+                self.report(total, started, start_done)
+
+        await self.repository.close()
+        print(f"Done. Checkpoint: {self.checkpoint_path}  Rejects: {self.rejects_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input")
+    parser.add_argument("--format", choices=["csv", "ndjson"])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <input>.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over")
+    args = parser.parse_args()
+    args.format = args.format or ("csv" if args.input.lower().endswith(".csv") else "ndjson")
+
+    asyncio.run(BulkImporter(args).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Recompute wallet_stats from the transactions table.
+
+Walks transactions in id order, `--chunk-size` rows per storage call, adding
+each chunk's per-wallet totals into a scratch table; no chunk is held in
+memory beyond one call. Transfers keep running meanwhile and update the live
+wallet_stats as usual. The last step folds in transactions committed since the
+rebuild started and swaps the scratch table in atomically.
+
+Use it to backfill wallet_stats after upgrading an existing database, or to
+repair it after editing transactions by hand.
+
+Usage (from the Backend directory):
+    python -m scripts.rebuild_wallet_stats --chunk-size 10000
+"""
+
+import argparse
+import asyncio
+import time
+
+
+async def rebuild(chunk_size: int):
+    from utils.database import repository
+
+    started = time.perf_counter()
+    until_id = await repository.start_wallet_stats_rebuild()
+    print(f"Rebuilding wallet_stats from transactions up to id {until_id:,}")
+
+    after_id = 0
+    chunks = 0
+    while True:
+        last_id = await repository.rebuild_wallet_stats_chunk(after_id, until_id, chunk_size)
+        if last_id is None:
+            break
+        after_id = last_id
+        chunks += 1
+        rate = after_id / max(time.perf_counter() - started, 1e-9)
+        print(f"chunk {chunks:,}: through id {after_id:,}/{until_id:,} "
+              f"({after_id / max(until_id, 1):.1%}) | {rate:,.0f} ids/s", flush=True)
+
+    wallets = await repository.finish_wallet_stats_rebuild(until_id)
+    await repository.close()
+    print(f"Done. {wallets:,} wallets in wallet_stats after {time.perf_counter() - started:,.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
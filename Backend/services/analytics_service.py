@@ -0,0 +1,195 @@
+"""
+Transfer volume time-series computed with NumPy.
+
+Transactions are streamed oldest-first in column chunks (ANALYTICS_CHUNK_ROWS
+rows per storage call) straight into NumPy arrays, and every aggregate is
+computed with vectorized operations over whole buckets. Only the rows of the
+bucket still in progress are carried from one chunk to the next.
+
+Results for closed buckets (ended more than ANALYTICS_SETTLE_SECONDS ago)
+never change, so they are cached in process memory and later requests only
+scan the buckets they have not seen yet, usually just the current one.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from utils.config import (
+    ANALYTICS_CHUNK_ROWS,
+    ANALYTICS_MAX_BUCKETS,
+    ANALYTICS_SETTLE_SECONDS,
+    ANALYTICS_CACHE_BUCKETS
+)
+from utils.database import repository
+
+INTERVAL_SECONDS = {"hour": 3600, "day": 86400}
+DEFAULT_BUCKETS = {"hour": 48, "day": 30}
+PERCENTILES = (50, 90, 99)
+
+# (epoch seconds, sender key, amount_eth, amount_usd) arrays for one chunk
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# (bucket seconds, bucket index) -> aggregates of a closed bucket
+_closed: "OrderedDict[Tuple[int, int], dict]" = OrderedDict()
+
+
+def timestamp_text(epoch: float) -> str:
+    """Format epoch seconds the way transaction timestamps are stored."""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "+00:00"
+
+
+def epoch_seconds(value: datetime) -> float:
+    """Epoch seconds of a datetime, reading naive values as UTC."""
+    return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def empty_bucket(start: float) -> dict:
+    result = {
+        "bucket_start": timestamp_text(start),
+        "transfers": 0,
+        "eth_volume": 0.0,
+        "usd_volume": 0.0,
+        "unique_senders": 0
+    }
+    result.update({f"p{q}_eth": None for q in PERCENTILES})
+    return result
+
+
+def aggregate_buckets(bucket: np.ndarray, sender: np.ndarray, eth: np.ndarray,
+                      usd: np.ndarray, bucket_seconds: int) -> Dict[int, dict]:
+    """
+    Aggregate rows already ordered by bucket index into one result per bucket
+    present. Sums are computed for all buckets at once; percentiles and distinct
+    senders run once per bucket over its contiguous slice.
+    """
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    counts = np.diff(np.r_[starts, bucket.size])
+    eth_volume = np.add.reduceat(eth, starts)
+    # ETH-denominated transfers carry no USD amount
+    usd_volume = np.add.reduceat(np.nan_to_num(usd), starts)
+
+    results = {}
+    bounds = np.r_[starts, bucket.size]
+    for i, index in enumerate(bucket[starts].tolist()):
+        rows = slice(bounds[i], bounds[i + 1])
+        # Partition-based selection: no full sort of the bucket's amounts
+        percentiles = np.percentile(eth[rows], PERCENTILES)
+        senders = np.sort(sender[rows])
+        result = {
+            "bucket_start": timestamp_text(index * bucket_seconds),
+            "transfers": int(counts[i]),
+            "eth_volume": float(eth_volume[i]),
+            "usd_volume": float(usd_volume[i]),
+            "unique_senders": int(np.count_nonzero(senders[1:] != senders[:-1])) + 1
+        }
+        result.update({f"p{q}_eth": float(value) for q, value in zip(PERCENTILES, percentiles)})
+        results[index] = result
+    return results
+
+
+def _finish(pieces: List[Columns], bucket_seconds: int) -> Dict[int, dict]:
+    return aggregate_buckets(*(np.concatenate(column) for column in zip(*pieces)), bucket_seconds)
+
+
+async def scan_buckets(chunks: AsyncIterator[Columns], bucket_seconds: int) -> Tuple[Dict[int, dict], int]:
+    """
+    Aggregate a time-ordered stream of column chunks into per-bucket results.
+    Returns (bucket index -> aggregates, rows scanned).
+    """
+    results = {}
+    pending: List[Columns] = []
+    rows = 0
+    async for epoch, sender, eth, usd in chunks:
+        if not epoch.size:
+            continue
+        rows += epoch.size
+        # Millisecond rounding keeps rows stamped exactly on a boundary in their own bucket
+        bucket = (np.round(epoch, 3) // bucket_seconds).astype(np.int64)
+        # Rows of the chunk's last bucket may continue in the next chunk
+        split = int(np.searchsorted(bucket, bucket[-1]))
+        if split:
+            pending.append((bucket[:split], sender[:split], eth[:split], usd[:split]))
+            results.update(_finish(pending, bucket_seconds))
+            pending = []
+        pending.append((bucket[split:], sender[split:], eth[split:], usd[split:]))
+    if pending:
+        results.update(_finish(pending, bucket_seconds))
+    return results, rows
+
+
+async def transaction_chunks(since: float, until: float) -> AsyncIterator[Columns]:
+    """Stream transactions with since <= timestamp < until as NumPy column chunks."""
+    after = None
+    while True:
+        chunk = await repository.get_transaction_columns(
+            timestamp_text(since), timestamp_text(until), ANALYTICS_CHUNK_ROWS, after
+        )
+        if not chunk["epoch"]:
+            return
+        yield (
+            np.array(chunk["epoch"], dtype=np.float64),
+            np.array(chunk["sender_key"], dtype=np.int64),
+            np.array(chunk["amount_eth"], dtype=np.float64),
+            np.array(chunk["amount_usd"], dtype=np.float64)
+        )
+        if len(chunk["epoch"]) < ANALYTICS_CHUNK_ROWS:
+            return
+        after = (chunk["last_timestamp"], chunk["last_id"])
+
+
+def _cache_closed(key: Tuple[int, int], result: dict):
+    _closed[key] = result
+    _closed.move_to_end(key)
+    while len(_closed) > ANALYTICS_CACHE_BUCKETS:
+        _closed.popitem(last=False)
+
+
+async def get_volume(interval: str, start: Optional[datetime] = None, end: Optional[datetime] = None) -> dict:
+    """
+    Volume, transfer count, distinct senders and transfer-size percentiles per
+    UTC hour or day. `end` is exclusive and defaults to now, so the current
+    bucket is included; `start` defaults to DEFAULT_BUCKETS buckets before it.
+    """
+    size = INTERVAL_SECONDS[interval]
+    now = time.time()
+    last = int(-(-epoch_seconds(end) // size)) - 1 if end else int(now // size)
+    first = int(epoch_seconds(start) // size) if start else last - DEFAULT_BUCKETS[interval] + 1
+    if first > last:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if last - first + 1 > ANALYTICS_MAX_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"At most {ANALYTICS_MAX_BUCKETS} buckets per request")
+
+    closed_before = int((now - ANALYTICS_SETTLE_SECONDS) // size)
+    missing = [index for index in range(first, last + 1) if (size, index) not in _closed]
+    scanned, rows = {}, 0
+    if missing:
+        try:
+            scanned, rows = await scan_buckets(
+                transaction_chunks(missing[0] * size, (last + 1) * size), size
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error computing volume analytics: {str(e)}")
+        for index in missing:
+            if index < closed_before:
+                _cache_closed((size, index), scanned.get(index) or empty_bucket(index * size))
+
+    buckets = []
+    for index in range(first, last + 1):
+        cached = _closed.get((size, index))
+        if cached is not None:
+            _closed.move_to_end((size, index))
+        buckets.append(cached or scanned.get(index) or empty_bucket(index * size))
+
+    return {
+        "interval": interval,
+        "start": timestamp_text(first * size),
+        "end": timestamp_text((last + 1) * size),
+        "buckets": buckets,
+        "cached_buckets": (last - first + 1) - len(missing),
+        "scanned_rows": rows
+    }
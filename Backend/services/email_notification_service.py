@@ -1,15 +1,48 @@
-from utils.database import supabase
-from utils.email_service import send_transfer_email
+"""
+Email notifications through a durable outbox.
 
+Request handlers only append a job to the email_outbox table. A pool of
+background workers claims due jobs, renders them, delivers them through
+Resend batch sends and retries failures with exponential backoff.
+"""
 
-def get_wallet_email(address: str) -> str:
+import asyncio
+import random
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from utils.database import repository
+from utils.email_service import is_email_configured, send_emails, build_transfer_email, build_welcome_email
+from utils.config import (
+    EMAIL_OUTBOX_WORKERS,
+    EMAIL_BATCH_SIZE,
+    EMAIL_LEASE_SECONDS,
+    EMAIL_POLL_INTERVAL_SECONDS,
+    EMAIL_MAX_ATTEMPTS,
+    EMAIL_RETRY_BASE_SECONDS,
+    EMAIL_RETRY_MAX_SECONDS
+)
+
+_workers: List[asyncio.Task] = []
+_wakeup: Optional[asyncio.Event] = None
+_counters = {
+    "enqueued": 0,
+    "sent": 0,
+    "skipped": 0,
+    "retried": 0,
+    "failed": 0,
+    "batches": 0,
+    "delivery_lag_seconds_total": 0.0,
+    "delivery_lag_seconds_max": 0.0
+}
+
+
+async def get_wallet_email(address: str) -> str:
     """Get email associated with wallet address."""
     try:
-        response = supabase.table("wallets").select("email").ilike("address", address.lower()).execute()
-        if response.data and response.data[0].get("email"):
-            email = response.data[0]["email"]
-            print(f"📧 Found email for {address[:10]}...{address[-8:]}: {email}")
-            return email
+        wallet = await repository.get_wallet(address)
+        if wallet and wallet.get("email"):
+            return wallet["email"]
         print(f"⚠️  No email found for {address[:10]}...{address[-8:]}")
         return None
     except Exception as e:
@@ -17,24 +50,174 @@ def get_wallet_email(address: str) -> str:
         return None
 
 
-def notify_transfer_complete(sender_address: str, recipient_address: str, 
-                            eth_amount: float, usd_amount: float = None):
-    """Send email notification to sender about completed transfer."""
+async def enqueue_email(kind: str, payload: dict):
+    """Append an email job to the outbox and wake a worker."""
+    if not is_email_configured():
+        print(f"⚠️  RESEND_API_KEY not configured. Email not sent.")
+        return
     try:
-        print(f"\n🔔 Attempting to send transfer notification...")
-        sender_email = get_wallet_email(sender_address)
-        if sender_email:
-            currency = "USD" if usd_amount else "ETH"
-            send_transfer_email(
-                to_email=sender_email,
-                amount=eth_amount,
-                currency=currency,
-                recipient_address=recipient_address,
-                sender_address=sender_address,
-                usd_amount=usd_amount
-            )
+        await repository.enqueue_email(kind, payload)
+        _counters["enqueued"] += 1
+        if _wakeup is not None:
+            _wakeup.set()
+    except Exception as e:
+        print(f"❌ Email enqueue error: {str(e)}")
+
+
+async def notify_transfer_complete(sender_address: str, recipient_address: str,
+                                   eth_amount: float, usd_amount: float = None):
+    """Queue email notification to sender about completed transfer."""
+    await enqueue_email("transfer", {
+        "sender_address": sender_address,
+        "recipient_address": recipient_address,
+        "eth_amount": eth_amount,
+        "usd_amount": usd_amount
+    })
+
+
+async def notify_wallet_created(email: str, address: str):
+    """Queue welcome email for a newly created wallet."""
+    if email:
+        await enqueue_email("welcome", {"email": email, "address": address})
+
+
+async def render_email(kind: str, payload: dict) -> Optional[dict]:
+    """Build Resend params for an outbox job, or None if it has no recipient."""
+    if kind == "welcome":
+        return build_welcome_email(payload["email"], payload["address"])
+    if kind == "transfer":
+        sender_email = await get_wallet_email(payload["sender_address"])
+        if not sender_email:
+            return None
+        usd_amount = payload.get("usd_amount")
+        return build_transfer_email(
+            to_email=sender_email,
+            amount=payload["eth_amount"],
+            currency="USD" if usd_amount else "ETH",
+            recipient_address=payload["recipient_address"],
+            sender_address=payload["sender_address"],
+            usd_amount=usd_amount
+        )
+    return None
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter for the given number of failed attempts."""
+    delay = min(EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1), EMAIL_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def record_delivery_lag(created_at: str):
+    try:
+        lag = (datetime.now(timezone.utc) - datetime.fromisoformat(created_at)).total_seconds()
+    except (TypeError, ValueError):
+        return
+    _counters["delivery_lag_seconds_total"] += lag
+    _counters["delivery_lag_seconds_max"] = max(_counters["delivery_lag_seconds_max"], lag)
+
+
+async def deliver_batch(jobs: List[dict]):
+    """Render and send one batch of claimed jobs, rescheduling them on failure."""
+    ready, params_list, skipped = [], [], []
+    for job in jobs:
+        try:
+            params = await render_email(job["kind"], job["payload"])
+        except Exception as e:
+            await fail_job(job, f"render error: {str(e)}")
+            continue
+        if params is None:
+            skipped.append(job["id"])
         else:
-            print(f"⚠️  No email configured for sender. Skipping notification.")
+            ready.append(job)
+            params_list.append(params)
+
+    if skipped:
+        await repository.finish_emails(skipped, "skipped")
+        _counters["skipped"] += len(skipped)
+
+    if not ready:
+        return
+
+    try:
+        await send_emails(params_list)
     except Exception as e:
-        print(f"❌ Email notification error: {str(e)}")
+        print(f"❌ Email send error: {str(e)}")
+        for job in ready:
+            await fail_job(job, str(e))
+        return
+
+    await repository.finish_emails([job["id"] for job in ready], "sent")
+    _counters["sent"] += len(ready)
+    _counters["batches"] += 1
+    for job in ready:
+        record_delivery_lag(job.get("created_at"))
+    print(f"✅ Sent {len(ready)} email(s)")
+
+
+async def fail_job(job: dict, error: str):
+    attempts = job["attempts"] + 1
+    failed = attempts >= EMAIL_MAX_ATTEMPTS
+    await repository.retry_email(job["id"], attempts, retry_delay(attempts), error[:500], failed)
+    _counters["failed" if failed else "retried"] += 1
+
+
+async def outbox_worker():
+    """Claim and deliver due jobs until cancelled, idling between polls."""
+    while True:
+        # Cleared before claiming so a job enqueued mid-batch still wakes us
+        _wakeup.clear()
+        try:
+            jobs = await repository.claim_emails(EMAIL_BATCH_SIZE, EMAIL_LEASE_SECONDS)
+            if jobs:
+                await deliver_batch(jobs)
+                continue
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ Email outbox error: {str(e)}")
+
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=EMAIL_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+def start_outbox_workers():
+    """Start the background delivery workers."""
+    global _wakeup
+    if _workers or not is_email_configured():
+        return
+    _wakeup = asyncio.Event()
+    for _ in range(EMAIL_OUTBOX_WORKERS):
+        _workers.append(asyncio.create_task(outbox_worker()))
+
+
+async def stop_outbox_workers():
+    """Cancel the background delivery workers; claimed jobs are retried after their lease."""
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
 
+async def get_outbox_metrics() -> dict:
+    """Queue depth, delivery lag and delivery counters for the email outbox."""
+    stats = await repository.get_outbox_stats()
+    oldest = stats.get("oldest_pending_at")
+    oldest_age = 0.0
+    if oldest:
+        oldest_age = (datetime.now(timezone.utc) - datetime.fromisoformat(oldest)).total_seconds()
+    delivered = _counters["sent"]
+    return {
+        "workers": len(_workers),
+        "queue_depth": stats.get("pending", 0),
+        "oldest_pending_age_seconds": round(oldest_age, 3),
+        "delivery_lag_seconds_avg": round(_counters["delivery_lag_seconds_total"] / delivered, 3) if delivered else 0.0,
+        "delivery_lag_seconds_max": round(_counters["delivery_lag_seconds_max"], 3),
+        "enqueued": _counters["enqueued"],
+        "sent": delivered,
+        "skipped": _counters["skipped"],
+        "retried": _counters["retried"],
+        "failed": _counters["failed"],
+        "batches": _counters["batches"]
+    }
@@ -0,0 +1,106 @@
+from typing import AsyncIterator, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from utils.config import (
+    EVENT_QUEUE_SIZE,
+    EVENT_MAX_SUBSCRIBERS,
+    EVENT_MAX_ADDRESSES,
+    EVENT_HEARTBEAT_SECONDS,
+    EVENT_RETRY_MILLISECONDS
+)
+from utils.database import repository
+from utils.event_hub import EventHub, encode_event
+from utils.models import ethereum_address
+from repositories.base import canonical_address
+
+wallet_events = EventHub(queue_size=EVENT_QUEUE_SIZE, max_subscribers=EVENT_MAX_SUBSCRIBERS)
+
+
+def _transaction(transaction_id: int, sender_address: str, recipient_address: str,
+                 eth_amount: float, usd_amount: Optional[float], timestamp: Optional[str]) -> dict:
+    return {
+        "id": transaction_id,
+        "sender_address": canonical_address(sender_address),
+        "recipient_address": canonical_address(recipient_address),
+        "amount_eth": eth_amount,
+        "amount_usd": usd_amount,
+        "timestamp": timestamp
+    }
+
+
+def _balance(address: str, balance: float, transaction_id: Optional[int]) -> dict:
+    return {"address": canonical_address(address), "balance": float(balance), "transaction_id": transaction_id}
+
+
+def publish_transfer(sender_address: str, recipient_address: str, eth_amount: float,
+                     usd_amount: Optional[float], result: dict):
+    """Announce a committed transfer and both resulting balances."""
+    transaction_id = result.get("transaction_id")
+    timestamp = result.get("timestamp")
+    wallet_events.publish(
+        "transaction",
+        _transaction(transaction_id, sender_address, recipient_address, eth_amount, usd_amount, timestamp),
+        (sender_address, recipient_address)
+    )
+    wallet_events.publish("balance", _balance(sender_address, result["sender_balance"], transaction_id), (sender_address,))
+    wallet_events.publish("balance", _balance(recipient_address, result["recipient_balance"], transaction_id), (recipient_address,))
+
+
+async def publish_batch_transfer(sender_address: str, transfers: List[Tuple[str, float, Optional[float]]], result: dict):
+    """Announce every transfer of a committed batch and the balances it changed."""
+    transaction_ids = result.get("transaction_ids") or []
+    timestamps = result.get("timestamps") or [None] * len(transaction_ids)
+    version = max(transaction_ids, default=None)
+    for transaction_id, timestamp, (recipient_address, eth_amount, usd_amount) in zip(transaction_ids, timestamps, transfers):
+        wallet_events.publish(
+            "transaction",
+            _transaction(transaction_id, sender_address, recipient_address, eth_amount, usd_amount, timestamp),
+            (sender_address, recipient_address)
+        )
+    wallet_events.publish("balance", _balance(sender_address, result["sender_balance"], version), (sender_address,))
+
+    # The batch call only returns the sender's balance; read the recipients'
+    # only when someone is listening for them
+    watched = list(dict.fromkeys(canonical_address(recipient) for recipient, _, _ in transfers
+                                 if wallet_events.has_subscribers(recipient)))
+    if watched:
+        for wallet in await repository.get_wallets(watched):
+            wallet_events.publish("balance", _balance(wallet["address"], wallet["balance"], version), (wallet["address"],))
+
+
+def open_wallet_events(addresses: List[str]) -> List[str]:
+    """Validate a subscription request before the stream starts; returns the canonical addresses."""
+    addresses = list(dict.fromkeys(addresses))
+    if not addresses or len(addresses) > EVENT_MAX_ADDRESSES:
+        raise HTTPException(status_code=400, detail=f"Subscribe to between 1 and {EVENT_MAX_ADDRESSES} addresses")
+    try:
+        addresses = [ethereum_address(address) for address in addresses]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not wallet_events.admit():
+        raise HTTPException(status_code=503, detail="Too many live subscribers, try again later")
+    return addresses
+
+
+async def stream_wallet_events(addresses: List[str]) -> AsyncIterator[str]:
+    """
+    Server-sent events for `addresses`: a snapshot of their balances, then
+    every transaction and balance change, with comment heartbeats in between.
+    """
+    subscription = wallet_events.subscribe(addresses)
+    if subscription is None:
+        yield encode_event("resync", {"reason": "too many live subscribers"})
+        return
+    try:
+        yield f"retry: {EVENT_RETRY_MILLISECONDS}\n\n"
+        # Subscribed before reading, so a transfer committed after the snapshot is always delivered
+        wallets = await repository.get_wallets(addresses)
+        yield encode_event("snapshot", {
+            "balances": [_balance(wallet["address"], wallet["balance"], None) for wallet in wallets]
+        })
+        while True:
+            frame = await subscription.next_frame(EVENT_HEARTBEAT_SECONDS)
+            yield frame if frame is not None else ": keep-alive\n\n"
+    finally:
+        wallet_events.unsubscribe(subscription)
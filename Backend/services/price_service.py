@@ -0,0 +1,50 @@
+"""
+ETH/USD pricing backed by the Skip API and a shared TTL cache.
+"""
+
+from utils.config import (
+    SKIP_API_URL,
+    MOCK_ETH_PRICE_USD,
+    SLIPPAGE_TOLERANCE_PERCENT,
+    PRICE_REFERENCE_USD,
+    PRICE_TTL_SECONDS,
+    PRICE_STALE_TTL_SECONDS
+)
+from utils.http_client import get_http_client
+from utils.metrics import upstream_timer
+from utils.price_cache import PriceCache
+
+
+async def fetch_eth_per_usd() -> float:
+    """Quote PRICE_REFERENCE_USD of USDC -> ETH on Skip and return ETH per USD."""
+    payload = {
+        "source_asset_denom": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        "source_asset_chain_id": "1",
+        "dest_asset_denom": "ethereum-native",
+        "dest_asset_chain_id": "1",
+        "amount_in": str(int(PRICE_REFERENCE_USD * 1_000_000)),
+        "chain_ids_to_addresses": {"1": "0x0000000000000000000000000000000000000000"},
+        "slippage_tolerance_percent": str(SLIPPAGE_TOLERANCE_PERCENT),
+        "smart_swap_options": {"evm_swaps": True},
+        "allow_unsafe": False
+    }
+    
+    with upstream_timer("skip", "msgs_direct"):
+        response = await get_http_client().post(SKIP_API_URL, json=payload, headers={"Content-Type": "application/json"})
+        response.raise_for_status()
+    amount_out = int(response.json().get("route", {}).get("amount_out", "0"))
+    if amount_out <= 0:
+        raise ValueError("Skip API returned no route")
+    return amount_out / 1e18 / PRICE_REFERENCE_USD
+
+
+eth_price_cache = PriceCache(fetch_eth_per_usd, ttl=PRICE_TTL_SECONDS, stale_ttl=PRICE_STALE_TTL_SECONDS)
+
+
+async def get_eth_per_usd() -> float:
+    """Get the cached ETH/USD rate, falling back to the mock price if Skip is unavailable."""
+    try:
+        rate, _ = await eth_price_cache.get()
+        return rate
+    except Exception:
+        return 1 / MOCK_ETH_PRICE_USD
@@ -0,0 +1,99 @@
+"""
+Server-side transfer quotes.
+
+`/transfer/initiate` prices a transfer once and stores the result under a
+random quote id. The id is part of the approval message the user signs, so
+`/transfer/execute` only has to look the quote up instead of asking Skip for
+a fresh price. Quotes are kept in the storage backend, so any API instance
+can redeem a quote another one issued. They are single use and expire after
+QUOTE_TTL_SECONDS.
+"""
+
+import hashlib
+import math
+import secrets
+from typing import List, Optional
+
+from utils.config import QUOTE_TTL_SECONDS, QUOTE_AMOUNT_TOLERANCE
+from utils.database import repository
+
+
+def approval_message_for(quote_id: str, recipient_address: str, eth_amount: float, usd_amount: Optional[float]) -> str:
+    if usd_amount is not None:
+        return f"Send {eth_amount} ETH (${usd_amount} USD) to {recipient_address} [quote {quote_id}]"
+    return f"Send {eth_amount} ETH to {recipient_address} [quote {quote_id}]"
+
+
+async def create_quote(sender_address: str, recipient_address: str, eth_amount: float,
+                 usd_amount: Optional[float] = None, rate: Optional[float] = None) -> dict:
+    """Store a quote and return it, including its id, approval message and expiry."""
+    quote_id = secrets.token_urlsafe(16)
+    quote = {
+        "kind": "transfer",
+        "quote_id": quote_id,
+        "sender_address": sender_address,
+        "recipient_address": recipient_address,
+        "eth_amount": eth_amount,
+        "usd_amount": usd_amount,
+        "rate": rate,
+        "approval_message": approval_message_for(quote_id, recipient_address, eth_amount, usd_amount)
+    }
+    return await store_quote(quote)
+
+
+def manifest_digest(sender_address: str, transfers: List[dict]) -> str:
+    """SHA-256 over the sender and every (recipient, eth, usd) line of a batch."""
+    lines = [sender_address] + [
+        f"{t['recipient_address']},{t['eth_amount']},{'' if t['usd_amount'] is None else t['usd_amount']}"
+        for t in transfers
+    ]
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+async def create_batch_quote(sender_address: str, transfers: List[dict], rate: Optional[float] = None) -> dict:
+    """
+    Store a batch quote. The approval message commits to the whole manifest
+    through its digest, so one signature covers every transfer in it.
+    """
+    quote_id = secrets.token_urlsafe(16)
+    digest = manifest_digest(sender_address, transfers)
+    eth_total = round(sum(t["eth_amount"] for t in transfers), 6)
+    usd_total = None
+    if rate is not None:
+        usd_total = round(sum(t["usd_amount"] for t in transfers), 2)
+        summary = f"Send {eth_total} ETH (${usd_total} USD) to {len(transfers)} recipients"
+    else:
+        summary = f"Send {eth_total} ETH to {len(transfers)} recipients"
+    return await store_quote({
+        "kind": "batch",
+        "quote_id": quote_id,
+        "sender_address": sender_address,
+        "transfers": transfers,
+        "eth_total": eth_total,
+        "usd_total": usd_total,
+        "rate": rate,
+        "manifest_digest": digest,
+        "approval_message": f"{summary}, manifest {digest} [quote {quote_id}]"
+    })
+
+
+async def store_quote(quote: dict) -> dict:
+    quote["expires_at"] = await repository.store_quote(quote["quote_id"], quote, QUOTE_TTL_SECONDS)
+    return quote
+
+
+async def get_quote(quote_id: str) -> Optional[dict]:
+    """Return a live quote without using it up, or None if it is unknown, used or expired."""
+    return await repository.get_quote(quote_id)
+
+
+async def consume_quote(quote_id: str) -> bool:
+    """Use up a quote; False if it was already used or has expired meanwhile."""
+    return await repository.delete_quote(quote_id)
+
+
+def amounts_match(quoted: Optional[float], requested: Optional[float]) -> bool:
+    """Compare amounts within QUOTE_AMOUNT_TOLERANCE, since they round-trip through JSON and storage."""
+    if quoted is None or requested is None:
+        return quoted is None and requested is None
+    return math.isclose(quoted, requested, rel_tol=0, abs_tol=QUOTE_AMOUNT_TOLERANCE)
@@ -0,0 +1,94 @@
+"""
+Startup warm-up and readiness.
+
+The server accepts connections as soon as the startup hook returns; the
+warm-up runs in the background and /ready reports 503 until it has finished.
+Its phases run concurrently:
+
+- database: check the required tables, which also opens the storage connection
+- key_derivation: spawn the derivation workers and load eth_account in them
+- price: fetch the ETH/USD rate, which also opens the Skip connection
+
+The instance is ready once every phase in REQUIRED_PHASES has succeeded. A
+failed price fetch does not block readiness, since quotes fall back to the
+mock price until Skip answers.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from utils.database import initialize_database
+from utils.key_derivation import start_key_derivation
+from services.price_service import eth_price_cache
+
+REQUIRED_PHASES = ("database", "key_derivation")
+
+_started_at: Optional[float] = None
+_ready_after: Optional[float] = None
+_phases: Dict[str, dict] = {}
+_task: Optional[asyncio.Task] = None
+
+
+async def check_database():
+    if not await initialize_database():
+        raise RuntimeError("required tables are missing")
+
+
+async def warm_price():
+    await eth_price_cache.get()
+
+
+async def _run_phase(name: str, phase):
+    _phases[name] = {"status": "running", "seconds": None}
+    start = time.perf_counter()
+    try:
+        await phase()
+        _phases[name]["status"] = "ok"
+    except Exception as e:
+        _phases[name].update(status="failed", error=str(e) or type(e).__name__)
+    _phases[name]["seconds"] = round(time.perf_counter() - start, 3)
+
+
+async def warm_up():
+    """Run every warm-up phase concurrently and record when the instance became ready."""
+    global _ready_after
+    await asyncio.gather(
+        _run_phase("database", check_database),
+        _run_phase("key_derivation", start_key_derivation),
+        _run_phase("price", warm_price)
+    )
+    if is_ready():
+        _ready_after = time.monotonic() - _started_at
+        print(f"✓ Ready after {_ready_after:.2f}s")
+    else:
+        failed = [name for name in REQUIRED_PHASES if _phases[name]["status"] != "ok"]
+        print(f"⚠️  Warm-up incomplete ({', '.join(failed)}); /ready will keep returning 503")
+
+
+def start_warm_up():
+    global _task, _started_at
+    if _task is None:
+        _started_at = time.monotonic()
+        _task = asyncio.create_task(warm_up())
+
+
+async def stop_warm_up():
+    global _task
+    if _task is not None:
+        _task.cancel()
+        await asyncio.gather(_task, return_exceptions=True)
+        _task = None
+
+
+def is_ready() -> bool:
+    return all(_phases.get(name, {}).get("status") == "ok" for name in REQUIRED_PHASES)
+
+
+def get_readiness() -> dict:
+    """Readiness flag, seconds from server startup to ready, and the outcome of each warm-up phase."""
+    return {
+        "ready": is_ready(),
+        "ready_after_seconds": round(_ready_after, 3) if _ready_after is not None else None,
+        "phases": _phases
+    }
@@ -1,25 +1,61 @@
+import base64
 from fastapi import HTTPException
-from typing import List
+from typing import Optional, Tuple
 
-from utils.database import supabase
+from utils.database import repository
+from utils.etag import make_etag
+from repositories.base import canonical_address
 
 
-def get_transaction_history(address: str) -> List[dict]:
-    """Get transaction history for wallet address."""
+def encode_cursor(timestamp: str, transaction_id: int) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{timestamp}|{transaction_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        timestamp, transaction_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return timestamp, int(transaction_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def get_history_etag(address: str, limit: int, before: Optional[str] = None) -> str:
+    """
+    ETag of a history page, read from wallet_stats (one primary-key lookup that
+    every transfer keeps current) instead of from the page itself.
+    """
     try:
-        address_lower = address.lower()
-        response = supabase.table("transactions").select("*").or_(
-            f"sender_address.ilike.{address_lower},recipient_address.ilike.{address_lower}"
-        ).order("timestamp", desc=True).execute()
-        
-        return [{
+        stats = await repository.get_wallet_stats(address)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching transaction history: {str(e)}")
+    version = (stats["last_transaction_id"], int(stats["tx_count"])) if stats else (None, 0)
+    return make_etag("history", canonical_address(address), version, limit, before)
+
+
+async def get_transaction_history(address: str, limit: int, before: Optional[str] = None) -> dict:
+    """Get one page of transaction history for wallet address, newest first."""
+    keyset = decode_cursor(before) if before else None
+    try:
+        # Fetch one extra row to learn whether an older page exists
+        transactions = await repository.get_transactions(address, limit + 1, keyset)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching transaction history: {str(e)}")
+    
+    page = transactions[:limit]
+    next_cursor = None
+    if len(transactions) > limit:
+        next_cursor = encode_cursor(page[-1]["timestamp"], page[-1]["id"])
+    
+    return {
+        "transactions": [{
             "id": tx["id"],
             "sender_address": tx["sender_address"],
             "recipient_address": tx["recipient_address"],
             "amount_eth": float(tx["amount_eth"]),
             "amount_usd": float(tx["amount_usd"]) if tx.get("amount_usd") else None,
             "timestamp": tx["timestamp"]
-        } for tx in response.data]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching transaction history: {str(e)}")
-
+        } for tx in page],
+        "next_cursor": next_cursor
+    }
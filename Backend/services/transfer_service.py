@@ -1,73 +1,60 @@
-import requests
+import hashlib
+import json
+from functools import partial
+from typing import List, Optional, Tuple
+
 from fastapi import HTTPException
-from web3 import Web3
-from eth_account.messages import encode_defunct
 
-from utils.database import supabase
-from utils.config import SKIP_API_URL, MOCK_ETH_PRICE_USD, SLIPPAGE_TOLERANCE_PERCENT
-from services.wallet_service import get_balance, update_balance, create_wallet_if_not_exists
+from utils.config import IDEMPOTENCY_TTL_SECONDS, IDEMPOTENCY_STORE_MAX_SIZE
+from utils.database import repository
+from utils.idempotency_store import IdempotencyStore
+from utils.signature_verifier import recover_address
+from repositories.base import WalletNotFoundError, InsufficientBalanceError, InvalidAmountError, canonical_address
+from services.wallet_service import get_balance, balance_cache
+from services.price_service import get_eth_per_usd
+from services.quote_service import create_quote, create_batch_quote, get_quote, consume_quote, amounts_match
 from services.email_notification_service import notify_transfer_complete
+from services.event_service import publish_transfer, publish_batch_transfer
 
-w3 = Web3()
+execute_results = IdempotencyStore(ttl=IDEMPOTENCY_TTL_SECONDS, max_size=IDEMPOTENCY_STORE_MAX_SIZE)
 
 
-def get_usd_to_eth_conversion(usd_amount: float) -> float:
-    """Get ETH equivalent for USD amount using Skip API with fallback."""
+async def initiate_transfer(sender_address: str, recipient_address: str, amount: float, transfer_mode: str) -> dict:
+    """Price the transfer, check the balance and store a quote for execute."""
     try:
-        amount_in = str(int(usd_amount * 1_000_000))
-        
-        payload = {
-            "source_asset_denom": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-            "source_asset_chain_id": "1",
-            "dest_asset_denom": "ethereum-native",
-            "dest_asset_chain_id": "1",
-            "amount_in": amount_in,
-            "chain_ids_to_addresses": {"1": "0x0000000000000000000000000000000000000000"},
-            "slippage_tolerance_percent": str(SLIPPAGE_TOLERANCE_PERCENT),
-            "smart_swap_options": {"evm_swaps": True},
-            "allow_unsafe": False
-        }
-        
-        response = requests.post(SKIP_API_URL, json=payload, headers={"Content-Type": "application/json"}, timeout=10)
-        
-        if response.status_code == 200:
-            amount_out = int(response.json().get("route", {}).get("amount_out", "0"))
-            return float(amount_out) / 1e18
-        return usd_amount / MOCK_ETH_PRICE_USD
-    except:
-        return usd_amount / MOCK_ETH_PRICE_USD
-
-
-def initiate_transfer(sender_address: str, recipient_address: str, amount: float, transfer_mode: str) -> dict:
-    """Prepare transfer and return approval message after balance check."""
-    try:
-        eth_amount = amount
+        rate = None
         usd_amount = None
         
         if transfer_mode == 'USD':
-            eth_amount = round(get_usd_to_eth_conversion(amount), 6)
+            rate = await get_eth_per_usd()
+            eth_amount = round(amount * rate, 6)
             usd_amount = amount
-            approval_message = f"Send {eth_amount} ETH (${usd_amount} USD) to {recipient_address}"
         else:
             eth_amount = round(amount, 6)
-            approval_message = f"Send {eth_amount} ETH to {recipient_address}"
         
-        sender_balance = get_balance(sender_address)
+        sender_balance = await get_balance(sender_address)
         if sender_balance < eth_amount:
             raise HTTPException(status_code=400, detail=f"Insufficient balance. You have {sender_balance:.6f} ETH, need {eth_amount:.6f} ETH")
         
-        return {"approval_message": approval_message, "eth_amount": eth_amount, "usd_amount": usd_amount}
+        quote = await create_quote(sender_address, recipient_address, eth_amount, usd_amount, rate)
+        return {
+            "approval_message": quote["approval_message"],
+            "eth_amount": eth_amount,
+            "usd_amount": usd_amount,
+            "quote_id": quote["quote_id"],
+            "expires_at": quote["expires_at"]
+        }
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error initiating transfer: {str(e)}")
 
 
-def verify_signature(message: str, signature: str, expected_address: str) -> bool:
+async def verify_signature(message: str, signature: str, expected_address: str) -> bool:
     """Verify cryptographic signature matches expected address."""
     try:
-        recovered_address = w3.eth.account.recover_message(encode_defunct(text=message), signature=signature)
-        if recovered_address.lower() != expected_address.lower():
+        recovered_address = await recover_address(message, signature)
+        if recovered_address != expected_address.lower():
             raise HTTPException(status_code=403, detail="Signature verification failed")
         return True
     except HTTPException:
@@ -76,61 +63,183 @@ def verify_signature(message: str, signature: str, expected_address: str) -> boo
         raise HTTPException(status_code=403, detail=f"Signature verification failed: {str(e)}")
 
 
-def check_slippage(original_usd_amount: float, original_eth_amount: float) -> bool:
-    """Check if price changed significantly for USD transfers (slippage protection)."""
+async def redeem_quote(quote_id: str, sender_address: str, recipient_address: str, eth_amount: float,
+                       approval_message: str, usd_amount: float = None) -> dict:
+    """
+    Check the request matches the quote from initiate, then use the quote up.
+    A mismatched request leaves the quote valid for the matching one.
+    """
+    expired = HTTPException(status_code=400, detail="Quote expired or not found. Please prepare the transfer again.")
+    quote = await get_quote(quote_id)
+    if quote is None:
+        raise expired
+    if (quote["kind"] != "transfer"
+            or quote["sender_address"] != sender_address
+            or quote["recipient_address"] != recipient_address
+            or not amounts_match(quote["eth_amount"], eth_amount)
+            or not amounts_match(quote["usd_amount"], usd_amount)
+            or quote["approval_message"] != approval_message):
+        raise HTTPException(status_code=400, detail="Transfer does not match its quote")
+    if not await consume_quote(quote_id):
+        raise expired
+    return quote
+
+
+async def apply_transfer(sender_address: str, recipient_address: str, eth_amount: float, usd_amount: float = None) -> dict:
+    """Debit sender, credit recipient and record the transaction in one atomic storage call."""
+    try:
+        result = await repository.transfer(sender_address, recipient_address, eth_amount, usd_amount)
+    except InsufficientBalanceError:
+        balance_cache.invalidate(sender_address)
+        raise HTTPException(status_code=400, detail="Insufficient balance")
+    except WalletNotFoundError:
+        balance_cache.invalidate(sender_address)
+        raise HTTPException(status_code=404, detail="Wallet not found")
+    except InvalidAmountError:
+        raise HTTPException(status_code=400, detail="Transfer amount must be positive")
+    except Exception as e:
+        # The outcome is unknown, so neither balance can be trusted
+        balance_cache.invalidate(sender_address)
+        balance_cache.invalidate(recipient_address)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Transfer outcome unknown ({str(e)}). Check your transaction history before sending it again."
+        )
+    
+    # Transaction ids follow commit order for transfers touching the same wallet
+    version = result.get("transaction_id") or 0
+    balance_cache.set(sender_address, result["sender_balance"], version)
+    balance_cache.set(recipient_address, result["recipient_balance"], version)
+    publish_transfer(sender_address, recipient_address, eth_amount, usd_amount, result)
+    return result
+
+
+async def execute_transfer(sender_address: str, recipient_address: str, eth_amount: float, 
+                           signed_message: str, approval_message: str, quote_id: str,
+                           usd_amount: float = None) -> dict:
+    """Execute a quoted transfer after signature verification."""
     try:
-        new_eth_amount = get_usd_to_eth_conversion(original_usd_amount)
-        price_diff_percent = abs(new_eth_amount - original_eth_amount) / original_eth_amount * 100
+        await verify_signature(approval_message, signed_message, sender_address)
+        await redeem_quote(quote_id, sender_address, recipient_address, eth_amount, approval_message, usd_amount)
         
-        if price_diff_percent > SLIPPAGE_TOLERANCE_PERCENT:
-            raise HTTPException(status_code=400, detail=f"Price changed {price_diff_percent:.2f}%. Please try again.")
-        return True
+        transfer = await apply_transfer(sender_address, recipient_address, eth_amount, usd_amount)
+        
+        await notify_transfer_complete(sender_address, recipient_address, eth_amount, usd_amount)
+        
+        return {
+            "success": True,
+            "message": "Transfer completed successfully",
+            "transaction_id": transfer.get("transaction_id")
+        }
     except HTTPException:
         raise
-    except:
-        return True
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error executing transfer: {str(e)}")
+
+
+async def execute_transfer_idempotent(idempotency_key: Optional[str], sender_address: str,
+                                      recipient_address: str, eth_amount: float, signed_message: str,
+                                      approval_message: str, quote_id: str,
+                                      usd_amount: float = None) -> Tuple[dict, bool]:
+    """
+    Execute a transfer at most once per Idempotency-Key (scoped to the sender).
+    Returns (response, replayed); a replay never touches the ledger.
+    """
+    execute = partial(execute_transfer, sender_address, recipient_address, eth_amount,
+                      signed_message, approval_message, quote_id, usd_amount)
+    if not idempotency_key:
+        return await execute(), False
+    
+    request = [canonical_address(recipient_address), eth_amount, usd_amount, quote_id, approval_message, signed_message]
+    fingerprint = hashlib.sha256(json.dumps(request).encode()).hexdigest()
+    return await execute_results.run(f"{canonical_address(sender_address)}:{idempotency_key}", fingerprint, execute)
 
 
-def execute_transfer(sender_address: str, recipient_address: str, eth_amount: float, 
-                     signed_message: str, approval_message: str, usd_amount: float = None) -> dict:
-    """Execute transfer after signature verification and security checks."""
+async def initiate_batch_transfer(sender_address: str, transfers: List[Tuple[str, float]], transfer_mode: str) -> dict:
+    """Price every payout at one rate, check the total against the balance once and quote the manifest."""
     try:
-        verify_signature(approval_message, signed_message, sender_address)
+        rate = await get_eth_per_usd() if transfer_mode == 'USD' else None
+        quoted = [
+            {
+                "recipient_address": recipient_address,
+                "eth_amount": round(amount * rate, 6) if rate is not None else round(amount, 6),
+                "usd_amount": amount if rate is not None else None
+            }
+            for recipient_address, amount in transfers
+        ]
+        if any(t["eth_amount"] <= 0 for t in quoted):
+            raise HTTPException(status_code=400, detail="Every transfer must be at least 0.000001 ETH")
         
-        if usd_amount is not None:
-            check_slippage(usd_amount, eth_amount)
+        eth_total = sum(t["eth_amount"] for t in quoted)
+        sender_balance = await get_balance(sender_address)
+        if sender_balance < eth_total:
+            raise HTTPException(status_code=400, detail=f"Insufficient balance. You have {sender_balance:.6f} ETH, need {eth_total:.6f} ETH")
         
-        sender_balance = get_balance(sender_address)
-        if sender_balance < eth_amount:
-            raise HTTPException(status_code=400, detail="Insufficient balance")
+        quote = await create_batch_quote(sender_address, quoted, rate)
+        return {
+            "approval_message": quote["approval_message"],
+            "manifest_digest": quote["manifest_digest"],
+            "eth_total": quote["eth_total"],
+            "usd_total": quote["usd_total"],
+            "transfers": quoted,
+            "quote_id": quote["quote_id"],
+            "expires_at": quote["expires_at"]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error initiating batch transfer: {str(e)}")
+
+
+async def execute_batch_transfer(sender_address: str, signed_message: str, approval_message: str, quote_id: str) -> dict:
+    """Apply every transfer of a signed batch quote in one atomic storage call."""
+    try:
+        await verify_signature(approval_message, signed_message, sender_address)
         
-        update_balance(sender_address, sender_balance - eth_amount)
+        expired = HTTPException(status_code=400, detail="Quote expired or not found. Please prepare the batch again.")
+        quote = await get_quote(quote_id)
+        if quote is None:
+            raise expired
+        if (quote["kind"] != "batch"
+                or quote["sender_address"] != sender_address
+                or quote["approval_message"] != approval_message):
+            raise HTTPException(status_code=400, detail="Batch does not match its quote")
+        if not await consume_quote(quote_id):
+            raise expired
         
+        transfers = [(t["recipient_address"], t["eth_amount"], t["usd_amount"]) for t in quote["transfers"]]
+        result = None
         try:
-            recipient_balance = get_balance(recipient_address)
-            update_balance(recipient_address, recipient_balance + eth_amount)
-        except HTTPException as e:
-            if e.status_code == 404:
-                create_wallet_if_not_exists(recipient_address, eth_amount)
-            else:
-                raise
-        
-        transaction_response = supabase.table("transactions").insert({
-            "sender_address": sender_address,
-            "recipient_address": recipient_address,
-            "amount_eth": eth_amount,
-            "amount_usd": usd_amount
-        }).execute()
+            result = await repository.transfer_batch(sender_address, transfers)
+        except InsufficientBalanceError:
+            balance_cache.invalidate(sender_address)
+            raise HTTPException(status_code=400, detail="Insufficient balance")
+        except WalletNotFoundError:
+            balance_cache.invalidate(sender_address)
+            raise HTTPException(status_code=404, detail="Wallet not found")
+        except InvalidAmountError:
+            raise HTTPException(status_code=400, detail="Transfer amount must be positive")
+        except Exception:
+            balance_cache.invalidate(sender_address)
+            raise
+        finally:
+            version = max(result.get("transaction_ids") or [0]) if result else 0
+            for recipient_address, _, _ in transfers:
+                balance_cache.invalidate(recipient_address, version)
         
-        notify_transfer_complete(sender_address, recipient_address, eth_amount, usd_amount)
+        balance_cache.set(sender_address, result["sender_balance"], version)
+        try:
+            await publish_batch_transfer(sender_address, transfers, result)
+        except Exception:
+            # The batch is committed; live subscribers resync on their next reconnect
+            pass
         
         return {
             "success": True,
-            "message": "Transfer completed successfully",
-            "transaction_id": transaction_response.data[0]["id"] if transaction_response.data else None
+            "message": f"Batch of {len(transfers)} transfers completed successfully",
+            "transaction_ids": result.get("transaction_ids") or []
         }
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error executing transfer: {str(e)}")
-
+        raise HTTPException(status_code=500, detail=f"Error executing batch transfer: {str(e)}")
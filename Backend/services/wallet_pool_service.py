@@ -0,0 +1,98 @@
+"""
+Reserve of pre-generated wallet keys.
+
+A background task keeps up to WALLET_POOL_SIZE freshly generated
+(mnemonic, address, private key) triples in memory, refilling them in
+batches on the key derivation pool. `/wallet/create` takes one from the
+reserve and only has to persist it. The reserve lives in process memory and
+is never written anywhere; entries lost on restart were never handed out.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from utils.config import WALLET_POOL_SIZE, WALLET_POOL_REFILL_BATCH, WALLET_POOL_RETRY_SECONDS
+from utils.key_derivation import DerivationPoolSaturated, generate_wallet_keys, generate_wallet_keys_batch
+
+REFILL_RATE_WINDOW_SECONDS = 60.0
+
+_reserve: Deque[Tuple[str, str, str]] = deque()
+_refill_task: Optional[asyncio.Task] = None
+_low: Optional[asyncio.Event] = None
+_refills: Deque[Tuple[float, int]] = deque()
+_counters = {"claimed": 0, "misses": 0, "generated": 0, "refill_errors": 0}
+
+
+async def take_wallet_keys() -> Tuple[str, str, str]:
+    """Return (mnemonic, address, private key hex), from the reserve when it has one."""
+    if _low is not None:
+        _low.set()
+    if _reserve:
+        _counters["claimed"] += 1
+        return _reserve.popleft()
+    _counters["misses"] += 1
+    return await generate_wallet_keys()
+
+
+async def refill_worker():
+    """Top the reserve up to WALLET_POOL_SIZE, then sleep until a wallet is taken."""
+    while True:
+        _low.clear()
+        while len(_reserve) < WALLET_POOL_SIZE:
+            count = min(WALLET_POOL_REFILL_BATCH, WALLET_POOL_SIZE - len(_reserve))
+            try:
+                accounts = await generate_wallet_keys_batch(count)
+            except asyncio.CancelledError:
+                raise
+            except DerivationPoolSaturated:
+                # Requests have priority on the derivation pool; try again later
+                await asyncio.sleep(WALLET_POOL_RETRY_SECONDS)
+                continue
+            except Exception as e:
+                _counters["refill_errors"] += 1
+                print(f"❌ Wallet pool refill error: {str(e)}")
+                await asyncio.sleep(WALLET_POOL_RETRY_SECONDS)
+                continue
+            _reserve.extend(accounts)
+            _counters["generated"] += len(accounts)
+            _refills.append((time.monotonic(), len(accounts)))
+        await _low.wait()
+
+
+def start_wallet_pool():
+    """Start filling the reserve in the background."""
+    global _refill_task, _low
+    if _refill_task is not None or WALLET_POOL_SIZE <= 0:
+        return
+    _low = asyncio.Event()
+    _refill_task = asyncio.create_task(refill_worker())
+
+
+async def stop_wallet_pool():
+    global _refill_task
+    if _refill_task is None:
+        return
+    _refill_task.cancel()
+    await asyncio.gather(_refill_task, return_exceptions=True)
+    _refill_task = None
+
+
+def get_wallet_pool_stats() -> dict:
+    """Reserve depth, claim/miss counters and the recent refill rate."""
+    horizon = time.monotonic() - REFILL_RATE_WINDOW_SECONDS
+    while _refills and _refills[0][0] < horizon:
+        _refills.popleft()
+    lookups = _counters["claimed"] + _counters["misses"]
+    return {
+        "depth": len(_reserve),
+        "target": WALLET_POOL_SIZE,
+        "refilling": _low is not None and len(_reserve) < WALLET_POOL_SIZE,
+        "refill_rate_per_second": round(sum(count for _, count in _refills) / REFILL_RATE_WINDOW_SECONDS, 3),
+        "generated": _counters["generated"],
+        "claimed": _counters["claimed"],
+        "misses": _counters["misses"],
+        "hit_rate": round(_counters["claimed"] / lookups, 4) if lookups else 0.0,
+        "refill_errors": _counters["refill_errors"]
+    }
@@ -1,13 +1,22 @@
 import random
 import hashlib
-from eth_account import Account
+from typing import List, Optional
 from fastapi import HTTPException
 
-from utils.database import supabase
-from utils.config import MIN_STARTING_BALANCE, MAX_STARTING_BALANCE
-from utils.email_service import send_welcome_email
+from utils.database import repository
+from utils.config import MIN_STARTING_BALANCE, MAX_STARTING_BALANCE, BALANCE_CACHE_SIZE, BALANCE_CACHE_TTL_SECONDS
+from utils.balance_cache import BalanceCache
+from utils.key_derivation import DerivationPoolSaturated, derive_from_mnemonic
+from services.email_notification_service import notify_wallet_created
+from services.wallet_pool_service import take_wallet_keys
 
-Account.enable_unaudited_hdwallet_features()
+balance_cache = BalanceCache(max_size=BALANCE_CACHE_SIZE, ttl=BALANCE_CACHE_TTL_SECONDS)
+
+DERIVATION_BUSY = HTTPException(
+    status_code=503,
+    detail="Key derivation is at capacity. Please retry shortly.",
+    headers={"Retry-After": "1"}
+)
 
 
 def hash_mnemonic(mnemonic: str) -> str:
@@ -15,91 +24,106 @@ def hash_mnemonic(mnemonic: str) -> str:
     return hashlib.sha256(mnemonic.encode()).hexdigest()
 
 
-def create_wallet(email: str = None) -> dict:
-    """Generate new HD wallet with mnemonic phrase."""
+async def create_wallet(email: str = None) -> dict:
+    """Create a wallet from pre-generated keys with a single storage write."""
     try:
-        account, mnemonic = Account.create_with_mnemonic()
-        address = account.address.lower()
+        mnemonic, address, private_key = await take_wallet_keys()
         starting_balance = round(random.uniform(MIN_STARTING_BALANCE, MAX_STARTING_BALANCE), 4)
         
-        supabase.table("wallets").insert({
-            "address": address,
-            "balance": starting_balance,
-            "email": email
-        }).execute()
-        
-        supabase.table("mnemonic_hashes").insert({
-            "wallet_address": address,
-            "mnemonic_hash": hash_mnemonic(mnemonic)
-        }).execute()
+        await repository.create_wallet_with_hash(address, starting_balance, hash_mnemonic(mnemonic), email)
+        balance_cache.set(address, starting_balance)
         
-        if email:
-            send_welcome_email(email, address)
+        await notify_wallet_created(email, address)
         
         return {
             "mnemonic": mnemonic,
-            "private_key": account.key.hex(),
+            "private_key": private_key,
             "address": address,
             "balance": starting_balance
         }
+    except DerivationPoolSaturated:
+        raise DERIVATION_BUSY
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating wallet: {str(e)}")
 
 
-def import_wallet(mnemonic: str, email: str = None) -> dict:
+async def import_wallet(mnemonic: str, email: str = None) -> dict:
     """Import wallet from mnemonic with hash verification."""
     try:
-        account = Account.from_mnemonic(mnemonic)
-        address = account.address.lower()
+        address, private_key = await derive_from_mnemonic(mnemonic)
         
-        response = supabase.table("wallets").select("*").ilike("address", address).execute()
+        wallet = await repository.get_wallet(address)
         
-        if response.data:
-            hash_response = supabase.table("mnemonic_hashes").select("mnemonic_hash").ilike("wallet_address", address).execute()
-            if hash_response.data and hash_response.data[0]["mnemonic_hash"] != hash_mnemonic(mnemonic):
+        if wallet:
+            stored_hash = await repository.get_mnemonic_hash(address)
+            if stored_hash and stored_hash != hash_mnemonic(mnemonic):
                 raise HTTPException(status_code=403, detail="Invalid mnemonic for this wallet")
-            balance = float(response.data[0]["balance"])
+            balance = float(wallet["balance"])
             
-            if email and not response.data[0].get("email"):
-                supabase.table("wallets").update({"email": email}).ilike("address", address).execute()
+            if email and not wallet.get("email"):
+                await repository.update_wallet(address, {"email": email})
         else:
             balance = round(random.uniform(MIN_STARTING_BALANCE, MAX_STARTING_BALANCE), 4)
-            supabase.table("wallets").insert({
-                "address": address,
-                "balance": balance,
-                "email": email
-            }).execute()
-            supabase.table("mnemonic_hashes").insert({
-                "wallet_address": address,
-                "mnemonic_hash": hash_mnemonic(mnemonic)
-            }).execute()
+            await repository.create_wallet_with_hash(address, balance, hash_mnemonic(mnemonic), email)
+            balance_cache.set(address, balance)
         
-        return {"address": address, "private_key": account.key.hex(), "balance": balance}
+        return {"address": address, "private_key": private_key, "balance": balance}
+    except HTTPException:
+        raise
+    except DerivationPoolSaturated:
+        raise DERIVATION_BUSY
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error importing wallet: {str(e)}")
 
 
-def get_balance(address: str) -> float:
-    """Get current balance for wallet address."""
+async def load_balance(address: str) -> Optional[float]:
+    wallet = await repository.get_wallet(address)
+    return float(wallet["balance"]) if wallet else None
+
+
+async def get_balance(address: str) -> float:
+    """Get current balance for wallet address, served from the balance cache when possible."""
     try:
-        response = supabase.table("wallets").select("balance").ilike("address", address.lower()).execute()
-        if not response.data:
+        balance = await balance_cache.get(address, load_balance)
+        if balance is None:
             raise HTTPException(status_code=404, detail="Wallet not found")
-        return float(response.data[0]["balance"])
+        return balance
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching balance: {str(e)}")
 
 
-def update_balance(address: str, new_balance: float):
-    """Update wallet balance."""
-    supabase.table("wallets").update({"balance": new_balance}).ilike("address", address.lower()).execute()
-
+async def get_balances(addresses: List[str]) -> dict:
+    """Look up many balances with one storage query; addresses without a wallet are listed as unknown."""
+    try:
+        addresses = list(dict.fromkeys(addresses))
+        found = {wallet["address"]: float(wallet["balance"]) for wallet in await repository.get_wallets(addresses)}
+        return {
+            "balances": [{"address": address, "balance": found[address]} for address in addresses if address in found],
+            "unknown": [address for address in addresses if address not in found]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching balances: {str(e)}")
 
-def create_wallet_if_not_exists(address: str, initial_balance: float):
-    """Create wallet if it doesn't exist."""
-    response = supabase.table("wallets").select("address").ilike("address", address.lower()).execute()
-    if not response.data:
-        supabase.table("wallets").insert({"address": address.lower(), "balance": initial_balance}).execute()
 
+async def get_wallet_stats(address: str) -> dict:
+    """Get a wallet's running totals, read from wallet_stats by primary key."""
+    try:
+        stats = await repository.get_wallet_stats(address)
+        if stats is None:
+            # No transactions yet: an idle wallet reports zeros, an unknown one 404s
+            if await balance_cache.get(address, load_balance) is None:
+                raise HTTPException(status_code=404, detail="Wallet not found")
+            stats = {"total_sent": 0, "total_received": 0, "tx_count": 0}
+        return {
+            "total_sent": float(stats["total_sent"]),
+            "total_received": float(stats["total_received"]),
+            "tx_count": int(stats["tx_count"]),
+            "last_activity": stats.get("last_activity"),
+            "last_transaction_id": stats.get("last_transaction_id")
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching wallet stats: {str(e)}")
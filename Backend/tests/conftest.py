@@ -0,0 +1,4 @@
+import os
+
+# Importing utils loads the config, which requires Supabase credentials unless SQLite is selected
+os.environ.setdefault("STORAGE_BACKEND", "sqlite")
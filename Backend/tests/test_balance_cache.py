@@ -0,0 +1,64 @@
+import asyncio
+
+from utils.balance_cache import BalanceCache
+
+ADDRESS = "0x" + "ab" * 20
+# Bounds every wait, so a get that joins a stuck load fails instead of hanging
+TIMEOUT = 1.0
+
+
+class SlowLoad:
+    """A load that returns `balance` only once `release` is set."""
+
+    def __init__(self, balance: float):
+        self.balance = balance
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def __call__(self, address: str) -> float:
+        self.calls += 1
+        await self.release.wait()
+        return self.balance
+
+
+def test_get_after_set_does_not_join_a_load_that_started_before_it():
+    async def scenario():
+        cache = BalanceCache(max_size=10, ttl=60)
+        stale = SlowLoad(10.0)
+        first = asyncio.create_task(cache.get(ADDRESS, stale))
+        await asyncio.sleep(0)
+
+        cache.set(ADDRESS, 7.5, version=1)
+        second = await asyncio.wait_for(cache.get(ADDRESS, stale), TIMEOUT)
+
+        stale.release.set()
+        assert await asyncio.wait_for(first, TIMEOUT) == 10.0
+        assert second == 7.5
+        # The pre-write load finished last but must not replace the written balance
+        assert await cache.get(ADDRESS, stale) == 7.5
+        assert stale.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_get_after_invalidate_starts_a_fresh_load():
+    async def scenario():
+        cache = BalanceCache(max_size=10, ttl=60)
+        stale = SlowLoad(10.0)
+        first = asyncio.create_task(cache.get(ADDRESS, stale))
+        await asyncio.sleep(0)
+
+        cache.invalidate(ADDRESS, version=1)
+        fresh = SlowLoad(12.0)
+        second = asyncio.create_task(cache.get(ADDRESS, fresh))
+        await asyncio.sleep(0)
+
+        fresh.release.set()
+        assert await asyncio.wait_for(second, TIMEOUT) == 12.0
+        stale.release.set()
+        assert await asyncio.wait_for(first, TIMEOUT) == 10.0
+        assert fresh.calls == 1
+        # The fresh load is cached; the detached one is not
+        assert await cache.get(ADDRESS, stale) == 12.0
+
+    asyncio.run(scenario())
@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+from repositories.base import InvalidAmountError
+from repositories.sqlite_repository import SQLiteRepository
+
+SENDER = "0x" + "aa" * 20
+RECIPIENT = "0x" + "bb" * 20
+
+
+@pytest.mark.parametrize("amount", [0, -1.5])
+def test_transfer_rejects_non_positive_amounts(tmp_path, amount):
+    async def scenario():
+        repository = SQLiteRepository(str(tmp_path / "wallets.db"))
+        try:
+            await repository.insert_wallet(SENDER, 10.0)
+            await repository.insert_wallet(RECIPIENT, 10.0)
+            with pytest.raises(InvalidAmountError):
+                await repository.transfer(SENDER, RECIPIENT, amount)
+            with pytest.raises(InvalidAmountError):
+                await repository.transfer_batch(SENDER, [(RECIPIENT, 1.0, None), (RECIPIENT, amount, None)])
+
+            wallets = {wallet["address"]: wallet["balance"] for wallet in await repository.get_wallets([SENDER, RECIPIENT])}
+            assert list(wallets.values()) == [10.0, 10.0]
+            assert await repository.get_transactions(SENDER, 10) == []
+        finally:
+            await repository.close()
+
+    asyncio.run(scenario())
@@ -1,5 +1,15 @@
 """Backend utilities module."""
+import importlib
+
 from .config import *
-from .database import supabase, initialize_database
-from .models import *
 
+
+def __getattr__(name):
+    # The storage client and the models load on first access, so importing a
+    # light submodule (e.g. in the key derivation workers) does not pull them in
+    if name in ("repository", "initialize_database"):
+        return getattr(importlib.import_module(".database", __name__), name)
+    models = importlib.import_module(".models", __name__)
+    if hasattr(models, name):
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
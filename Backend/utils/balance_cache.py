@@ -0,0 +1,123 @@
+"""
+Bounded LRU cache of wallet balances with write-through and single-flight loads.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from repositories.base import canonical_address
+
+
+class BalanceCache:
+    """
+    Caches balances by canonical address.
+
+    - Write paths call `set` with the balance they just committed, or
+      `invalidate` when they do not know it. Writes carry a version (the
+      transaction id) so a slower response from an earlier transfer cannot
+      overwrite the balance left by a later one.
+    - Concurrent misses for one address share a single load.
+    - A load that overlaps a write to the same address is returned to the
+      callers already waiting on it but not cached, and readers arriving
+      after the write start a new load, so nobody is handed a balance older
+      than the last write made through the cache.
+    Entries also expire after `ttl` seconds to bound staleness from writes
+    made by other processes.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        # address -> (balance or None once invalidated, stored_at, version)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], float, int]]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.writes = 0
+        self.invalidations = 0
+        self.stale_writes = 0
+        self.evictions = 0
+
+    async def get(self, address: str, load: Callable[[str], Awaitable[Optional[float]]]) -> Optional[float]:
+        """Return the balance for `address`, calling `load` on a miss. None (unknown wallet) is not cached."""
+        key = canonical_address(address)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is not None and time.monotonic() - entry[1] < self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        task = self._loading.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(self._load(key, load))
+            self._loading[key] = task
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, load) -> Optional[float]:
+        task = asyncio.current_task()
+        try:
+            balance = await load(key)
+        finally:
+            # A write detaches the load from _loading; a detached load is not cached
+            detached = self._loading.get(key) is not task
+            if not detached:
+                del self._loading[key]
+        if balance is not None and not detached:
+            self._store(key, balance)
+        return balance
+
+    def _version(self, key: str) -> int:
+        entry = self._entries.get(key)
+        return entry[2] if entry is not None else 0
+
+    def _store(self, key: str, balance: Optional[float], version: int = 0):
+        self._entries[key] = (balance, time.monotonic(), max(version, self._version(key)))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _mark_written(self, key: str):
+        # Detach an in-flight load that may predate the write: its callers still
+        # get its result, but later readers start a fresh load instead of joining it
+        self._loading.pop(key, None)
+
+    def set(self, address: str, balance: float, version: int = 0):
+        """Record a balance committed by the write with the given version."""
+        key = canonical_address(address)
+        self._mark_written(key)
+        if version and version < self._version(key):
+            self.stale_writes += 1
+            return
+        self._store(key, float(balance), version)
+        self.writes += 1
+
+    def invalidate(self, address: str, version: int = 0):
+        """Forget a balance that a write changed to an unknown value, keeping its version."""
+        key = canonical_address(address)
+        self._mark_written(key)
+        if key in self._entries or version:
+            self._store(key, None, version)
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "invalidations": self.invalidations,
+            "stale_writes": self.stale_writes,
+            "evictions": self.evictions
+        }
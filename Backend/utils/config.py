@@ -3,16 +3,62 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "supabase").lower()
+SQLITE_PATH = os.getenv("SQLITE_PATH", "wallet.db")
+
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
 RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
 
-if not SUPABASE_URL or not SUPABASE_ANON_KEY:
+if STORAGE_BACKEND not in ("supabase", "sqlite"):
+    raise ValueError("STORAGE_BACKEND must be either 'supabase' or 'sqlite'")
+
+if STORAGE_BACKEND == "supabase" and (not SUPABASE_URL or not SUPABASE_ANON_KEY):
     raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY must be set in .env file")
 
-SKIP_API_URL = "https://api.skip.build/v2/fungible/msgs_direct"
+SKIP_API_URL = os.getenv("SKIP_API_URL", "https://api.skip.build/v2/fungible/msgs_direct")
+RESEND_API_URL = os.getenv("RESEND_API_URL", "https://api.resend.com")
+HTTP_TIMEOUT_SECONDS = 10.0
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
 MOCK_ETH_PRICE_USD = 3000.0
 MIN_STARTING_BALANCE = 1.0
 MAX_STARTING_BALANCE = 10.0
 SLIPPAGE_TOLERANCE_PERCENT = 1.0
+PRICE_REFERENCE_USD = 1000.0
+PRICE_TTL_SECONDS = float(os.getenv("PRICE_TTL_SECONDS", "15"))
+PRICE_STALE_TTL_SECONDS = float(os.getenv("PRICE_STALE_TTL_SECONDS", "120"))
+QUOTE_TTL_SECONDS = float(os.getenv("QUOTE_TTL_SECONDS", "60"))
+QUOTE_AMOUNT_TOLERANCE = 1e-9
+BATCH_MAX_TRANSFERS = 500
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_STORE_MAX_SIZE = 100_000
+SIGNATURE_VERIFY_THREADS = int(os.getenv("SIGNATURE_VERIFY_THREADS", str(min(4, os.cpu_count() or 1))))
+SIGNATURE_CACHE_SIZE = 10_000
+KEY_DERIVATION_WORKERS = int(os.getenv("KEY_DERIVATION_WORKERS", str(os.cpu_count() or 1)))
+KEY_DERIVATION_MAX_QUEUE = int(os.getenv("KEY_DERIVATION_MAX_QUEUE", "64"))
+WALLET_POOL_SIZE = int(os.getenv("WALLET_POOL_SIZE", "256"))
+WALLET_POOL_REFILL_BATCH = 8
+WALLET_POOL_RETRY_SECONDS = 1.0
+BALANCE_CACHE_SIZE = 100_000
+BALANCE_CACHE_TTL_SECONDS = float(os.getenv("BALANCE_CACHE_TTL_SECONDS", "30"))
+BALANCES_MAX_ADDRESSES = 5000
+EVENT_QUEUE_SIZE = 100
+EVENT_MAX_SUBSCRIBERS = int(os.getenv("EVENT_MAX_SUBSCRIBERS", "10000"))
+EVENT_MAX_ADDRESSES = 100
+EVENT_HEARTBEAT_SECONDS = 15.0
+EVENT_RETRY_MILLISECONDS = 3000
+HISTORY_PAGE_SIZE = 50
+HISTORY_MAX_PAGE_SIZE = 200
+ANALYTICS_CHUNK_ROWS = 50_000
+ANALYTICS_MAX_BUCKETS = 2000
+ANALYTICS_SETTLE_SECONDS = 60.0
+ANALYTICS_CACHE_BUCKETS = 100_000
 
+EMAIL_OUTBOX_WORKERS = int(os.getenv("EMAIL_OUTBOX_WORKERS", "2"))
+EMAIL_BATCH_SIZE = 50
+EMAIL_LEASE_SECONDS = 60
+EMAIL_POLL_INTERVAL_SECONDS = 5.0
+EMAIL_MAX_ATTEMPTS = 8
+EMAIL_RETRY_BASE_SECONDS = 2.0
+EMAIL_RETRY_MAX_SECONDS = 600.0
@@ -1,29 +1,36 @@
-from supabase import create_client, Client
-from utils.config import SUPABASE_URL, SUPABASE_ANON_KEY
+import asyncio
 
+from repositories.base import Repository
+from utils.config import STORAGE_BACKEND, SQLITE_PATH, SUPABASE_URL, SUPABASE_ANON_KEY
+from utils.metrics import instrument_repository
 
-# Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 
+def create_repository() -> Repository:
+    """Create the storage backend selected by STORAGE_BACKEND."""
+    if STORAGE_BACKEND == "sqlite":
+        from repositories.sqlite_repository import SQLiteRepository
+        return SQLiteRepository(SQLITE_PATH)
+    from repositories.supabase_repository import SupabaseRepository
+    return SupabaseRepository(SUPABASE_URL, SUPABASE_ANON_KEY)
 
-def check_table_exists(table_name: str) -> bool:
+
+# Initialize storage backend; every call is timed for /metrics
+repository: Repository = instrument_repository(create_repository(), STORAGE_BACKEND)
+
+
+async def check_table_exists(table_name: str) -> bool:
     """Check if a table exists in the database."""
-    try:
-        supabase.table(table_name).select("*").limit(1).execute()
-        return True
-    except:
-        return False
+    return await repository.check_table(table_name)
 
 
-def initialize_database() -> bool:
+async def initialize_database() -> bool:
     """
     Check if required tables exist and provide setup instructions if not.
     Returns True if all tables exist, False otherwise.
     """
-    tables_exist = {
-        "wallets": check_table_exists("wallets"),
-        "transactions": check_table_exists("transactions")
-    }
+    tables = ("wallets", "transactions")
+    # Checked concurrently: one round trip of startup latency instead of one per table
+    tables_exist = dict(zip(tables, await asyncio.gather(*(check_table_exists(table) for table in tables))))
     
     # Print status
     for table, exists in tables_exist.items():
@@ -0,0 +1,26 @@
+"""
+ETag helpers for conditional GETs.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+
+def make_etag(*parts) -> str:
+    """A strong ETag derived from the values that determine a response body."""
+    return '"' + hashlib.sha256(repr(parts).encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match header, which may list several tags or be *."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
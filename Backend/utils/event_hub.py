@@ -0,0 +1,130 @@
+"""
+In-process fan-out of wallet events to live subscribers.
+"""
+
+import asyncio
+import json
+from typing import Dict, Iterable, List, Optional, Set
+
+from repositories.base import canonical_address
+
+
+def encode_event(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    """Format one server-sent event frame."""
+    frame = f"event: {event}\n"
+    if event_id is not None:
+        frame += f"id: {event_id}\n"
+    return frame + f"data: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+RESYNC_FRAME = encode_event("resync", {"reason": "subscriber fell behind"})
+
+
+class Subscription:
+    """One subscriber's address set and its bounded queue of encoded frames."""
+
+    def __init__(self, addresses: Set[str], queue_size: int):
+        self.addresses = addresses
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self.overflows = 0
+
+    async def next_frame(self, timeout: float) -> Optional[str]:
+        """The next frame, or None if nothing arrived within `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventHub:
+    """
+    Routes events to the subscribers of the addresses they concern.
+
+    - Subscribers are indexed by address, so publishing costs one dict lookup
+      per address plus one queue put per interested subscriber, however many
+      other subscribers are connected.
+    - Each event is encoded once and the same frame is shared by every queue.
+    - Publishing never waits: a subscriber whose queue is full has its backlog
+      dropped and replaced by a single `resync` event, telling it to refetch
+      instead of holding memory for a slow reader.
+    Not shared between processes; events reach only subscribers connected to
+    the process that made the write.
+    """
+
+    def __init__(self, queue_size: int, max_subscribers: int):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._by_address: Dict[str, Set[Subscription]] = {}
+        self._subscriptions: Set[Subscription] = set()
+        self._next_id = 0
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+        self.rejected = 0
+
+    def admit(self) -> bool:
+        """Whether another subscriber fits under `max_subscribers`; a refusal is counted."""
+        if len(self._subscriptions) >= self.max_subscribers:
+            self.rejected += 1
+            return False
+        return True
+
+    def subscribe(self, addresses: Iterable[str]) -> Optional[Subscription]:
+        """Register a subscriber, or return None when `max_subscribers` are already connected."""
+        if not self.admit():
+            return None
+        subscription = Subscription({canonical_address(address) for address in addresses}, self.queue_size)
+        self._subscriptions.add(subscription)
+        for address in subscription.addresses:
+            self._by_address.setdefault(address, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.discard(subscription)
+        for address in subscription.addresses:
+            subscribers = self._by_address.get(address)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._by_address[address]
+
+    def has_subscribers(self, address: str) -> bool:
+        return canonical_address(address) in self._by_address
+
+    def publish(self, event: str, data: dict, addresses: Iterable[str]):
+        """Queue an event for every subscriber of any of `addresses`, each at most once."""
+        targets: Set[Subscription] = set()
+        for address in addresses:
+            targets.update(self._by_address.get(canonical_address(address), ()))
+        if not targets:
+            return
+        self._next_id += 1
+        self.published += 1
+        frame = encode_event(event, data, self._next_id)
+        for subscription in targets:
+            self._put(subscription, frame)
+
+    def _put(self, subscription: Subscription, frame: str):
+        try:
+            subscription.queue.put_nowait(frame)
+            self.delivered += 1
+        except asyncio.QueueFull:
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+            subscription.queue.put_nowait(RESYNC_FRAME)
+            subscription.overflows += 1
+            self.overflows += 1
+
+    def stats(self) -> dict:
+        backlog: List[int] = [subscription.queue.qsize() for subscription in self._subscriptions]
+        return {
+            "subscribers": len(self._subscriptions),
+            "max_subscribers": self.max_subscribers,
+            "addresses": len(self._by_address),
+            "queue_size": self.queue_size,
+            "max_backlog": max(backlog, default=0),
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+            "rejected": self.rejected
+        }
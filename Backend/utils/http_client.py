@@ -0,0 +1,35 @@
+"""
+Shared async HTTP client for upstream APIs (Skip, Resend).
+
+One pooled client per process keeps TLS connections alive between calls
+instead of opening a new connection for every request.
+"""
+
+import httpx
+from typing import Optional
+
+from utils.config import HTTP_TIMEOUT_SECONDS, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,90 @@
+"""
+Results of idempotent requests, keyed by the client's Idempotency-Key.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Tuple
+
+from fastapi import HTTPException
+
+from utils.ttl_store import TTLStore
+
+KEY_REUSED = HTTPException(
+    status_code=422,
+    detail="Idempotency-Key was already used for a different request"
+)
+
+
+class IdempotencyStore:
+    """
+    Runs an operation at most once per key and replays its outcome.
+
+    - The first request with a key runs the operation; a duplicate that
+      arrives while it is still running waits for the same result.
+    - Successes and errors (HTTPException of any status) are kept for `ttl`
+      seconds and replayed to later requests with the same key. Server
+      errors are kept too: the operation may have committed before failing,
+      so running it again is never safe. A client that wants a new attempt
+      after an error must use a new key.
+    - Every key is bound to a fingerprint of its request; reusing a key for
+      a different request is rejected with 422.
+    Results live in process memory and are not shared between instances.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        # key -> (fingerprint, result dict or HTTPException)
+        self._results = TTLStore(ttl=ttl, max_size=max_size)
+        self._running: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self.executed = 0
+        self.replayed = 0
+        self.conflicts = 0
+
+    async def run(self, key: str, fingerprint: str,
+                  operation: Callable[[], Awaitable[dict]]) -> Tuple[dict, bool]:
+        """Return (result, replayed) for `key`, calling `operation` only if it has no outcome yet."""
+        stored = self._results.get(key)
+        if stored is not None:
+            return self._replay(fingerprint, *stored), True
+
+        running = self._running.get(key)
+        if running is not None:
+            if running[0] != fingerprint:
+                self.conflicts += 1
+                raise KEY_REUSED
+            self.replayed += 1
+            return await asyncio.shield(running[1]), True
+
+        task = asyncio.create_task(self._execute(key, fingerprint, operation))
+        self._running[key] = (fingerprint, task)
+        self.executed += 1
+        return await asyncio.shield(task), False
+
+    async def _execute(self, key: str, fingerprint: str, operation) -> dict:
+        try:
+            result = await operation()
+        except HTTPException as e:
+            self._results.set(key, (fingerprint, e))
+            raise
+        else:
+            self._results.set(key, (fingerprint, result))
+            return result
+        finally:
+            self._running.pop(key, None)
+
+    def _replay(self, fingerprint: str, stored_fingerprint: str, outcome) -> dict:
+        if stored_fingerprint != fingerprint:
+            self.conflicts += 1
+            raise KEY_REUSED
+        self.replayed += 1
+        if isinstance(outcome, HTTPException):
+            raise outcome
+        return outcome
+
+    def stats(self) -> dict:
+        return {
+            "stored": len(self._results),
+            "in_flight": len(self._running),
+            "executed": self.executed,
+            "replayed": self.replayed,
+            "conflicts": self.conflicts
+        }
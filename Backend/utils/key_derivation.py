@@ -0,0 +1,176 @@
+"""
+BIP-39 / BIP-32 key derivation on a bounded process pool.
+
+Deriving an account from a mnemonic runs PBKDF2 (2048 rounds) plus HD
+derivation, which would otherwise block the event loop. Derivations run in
+worker processes instead. At most KEY_DERIVATION_WORKERS run at once and at
+most KEY_DERIVATION_MAX_QUEUE more may wait; beyond that callers get
+DerivationPoolSaturated immediately so the API can answer 503.
+
+eth_account (about a second to import) is only imported in the workers, which
+load it when the pool starts, so the API process never pays for it.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from utils.config import KEY_DERIVATION_WORKERS, KEY_DERIVATION_MAX_QUEUE
+
+_executor: Optional[ProcessPoolExecutor] = None
+_in_flight = 0
+_counters = {
+    "completed": 0,
+    "rejected": 0,
+    "errors": 0,
+    "busy_seconds_total": 0.0,
+    "wait_seconds_total": 0.0,
+    "wait_seconds_max": 0.0
+}
+_started_at = time.monotonic()
+
+
+class DerivationPoolSaturated(Exception):
+    """Raised when every worker is busy and the derivation queue is full."""
+
+
+# Worker-side functions; they run in the pool processes and must stay picklable.
+
+def _account_class():
+    from eth_account import Account
+
+    Account.enable_unaudited_hdwallet_features()
+    return Account
+
+
+def derive_account(mnemonic: str) -> Tuple[str, str, float]:
+    """Return (lowercase address, private key hex, seconds spent) for a mnemonic."""
+    start = time.perf_counter()
+    account = _account_class().from_mnemonic(mnemonic)
+    return account.address.lower(), account.key.hex(), time.perf_counter() - start
+
+
+def generate_account() -> Tuple[str, str, str, float]:
+    """Return (mnemonic, lowercase address, private key hex, seconds spent) for a new wallet."""
+    start = time.perf_counter()
+    account, mnemonic = _account_class().create_with_mnemonic()
+    return mnemonic, account.address.lower(), account.key.hex(), time.perf_counter() - start
+
+
+def generate_accounts(count: int) -> Tuple[List[Tuple[str, str, str]], float]:
+    """Return ([(mnemonic, address, private key hex), ...], seconds spent) for `count` new wallets."""
+    start = time.perf_counter()
+    Account = _account_class()
+    accounts = []
+    for _ in range(count):
+        account, mnemonic = Account.create_with_mnemonic()
+        accounts.append((mnemonic, account.address.lower(), account.key.hex()))
+    return accounts, time.perf_counter() - start
+
+
+def derive_addresses(mnemonics: List[str]) -> List[Optional[str]]:
+    """Derive lowercase addresses for many mnemonics; invalid ones yield None instead of failing the batch."""
+    Account = _account_class()
+    addresses = []
+    for mnemonic in mnemonics:
+        try:
+            addresses.append(Account.from_mnemonic(mnemonic).address.lower())
+        except Exception:
+            addresses.append(None)
+    return addresses
+
+
+def _preload() -> None:
+    _account_class()
+
+
+# Event-loop side
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn keeps workers independent of the threads and sockets held by the API process
+        _executor = ProcessPoolExecutor(
+            max_workers=KEY_DERIVATION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+async def _submit(fn, *args):
+    global _in_flight
+    if _in_flight >= KEY_DERIVATION_WORKERS + KEY_DERIVATION_MAX_QUEUE:
+        _counters["rejected"] += 1
+        raise DerivationPoolSaturated()
+
+    _in_flight += 1
+    submitted = time.perf_counter()
+    try:
+        *result, busy = await asyncio.get_running_loop().run_in_executor(_get_executor(), fn, *args)
+    except Exception:
+        _counters["errors"] += 1
+        raise
+    finally:
+        _in_flight -= 1
+
+    wait = max(0.0, time.perf_counter() - submitted - busy)
+    _counters["completed"] += 1
+    _counters["busy_seconds_total"] += busy
+    _counters["wait_seconds_total"] += wait
+    _counters["wait_seconds_max"] = max(_counters["wait_seconds_max"], wait)
+    return tuple(result)
+
+
+async def derive_from_mnemonic(mnemonic: str) -> Tuple[str, str]:
+    """Derive (lowercase address, private key hex) from a mnemonic off the event loop."""
+    return await _submit(derive_account, mnemonic)
+
+
+async def generate_wallet_keys() -> Tuple[str, str, str]:
+    """Generate (mnemonic, lowercase address, private key hex) for a new wallet off the event loop."""
+    return await _submit(generate_account)
+
+
+async def generate_wallet_keys_batch(count: int) -> List[Tuple[str, str, str]]:
+    """Generate `count` (mnemonic, address, private key hex) triples in one worker call."""
+    accounts, = await _submit(generate_accounts, count)
+    return accounts
+
+
+async def start_key_derivation():
+    """
+    Start the worker processes and load eth_account in them up front, so the
+    first requests pay for neither.
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(_get_executor(), _preload) for _ in range(KEY_DERIVATION_WORKERS)))
+
+
+def shutdown_key_derivation():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def get_key_derivation_stats() -> dict:
+    """Pool utilization and admission counters for sizing workers per core."""
+    completed = _counters["completed"]
+    uptime = time.monotonic() - _started_at
+    return {
+        "workers": KEY_DERIVATION_WORKERS,
+        "max_queue": KEY_DERIVATION_MAX_QUEUE,
+        "in_flight": _in_flight,
+        "running": min(_in_flight, KEY_DERIVATION_WORKERS),
+        "queued": max(0, _in_flight - KEY_DERIVATION_WORKERS),
+        "utilization": round(min(_in_flight, KEY_DERIVATION_WORKERS) / KEY_DERIVATION_WORKERS, 4),
+        "busy_fraction": round(_counters["busy_seconds_total"] / (uptime * KEY_DERIVATION_WORKERS), 4) if uptime else 0.0,
+        "completed": completed,
+        "rejected": _counters["rejected"],
+        "errors": _counters["errors"],
+        "derive_ms_avg": round(_counters["busy_seconds_total"] / completed * 1000, 3) if completed else 0.0,
+        "wait_ms_avg": round(_counters["wait_seconds_total"] / completed * 1000, 3) if completed else 0.0,
+        "wait_ms_max": round(_counters["wait_seconds_max"] * 1000, 3)
+    }
@@ -0,0 +1,164 @@
+"""
+In-process request and upstream metrics in the Prometheus text format.
+
+Recording a sample is a dict lookup, a bisect over the bucket bounds and a
+few integer increments, all on the event loop thread, so no locking is
+needed. Metrics are per process; scrape every worker separately.
+"""
+
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+
+from repositories.base import Repository
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._values: Dict[Labels, int] = {}
+
+    def inc(self, labels: Labels, amount: int = 1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        lines.extend(f"{self.name}{format_labels(labels)} {value}" for labels, value in self._values.items())
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        # labels -> [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[Labels, list] = {}
+
+    def observe(self, labels: Labels, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{format_labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {cumulative}")
+        return lines
+
+
+http_requests = Counter("http_requests_total", "HTTP requests by route, method and status code.")
+http_errors = Counter("http_request_errors_total", "HTTP requests that failed with a 5xx status or an unhandled exception.")
+http_latency = Histogram("http_request_duration_seconds", "HTTP request latency by route and method.")
+upstream_latency = Histogram("upstream_request_duration_seconds", "Latency of calls to storage and external APIs.")
+upstream_errors = Counter("upstream_request_errors_total", "Calls to storage and external APIs that raised.")
+
+METRICS = (http_requests, http_errors, http_latency, upstream_latency, upstream_errors)
+
+
+@contextmanager
+def upstream_timer(upstream: str, operation: str):
+    """Time one upstream call, counting it as an error if it raises."""
+    labels = (("upstream", upstream), ("operation", operation))
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        upstream_errors.inc(labels)
+        raise
+    finally:
+        upstream_latency.observe(labels, time.perf_counter() - start)
+
+
+def _timed(upstream: str, operation: str, method: Callable) -> Callable:
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        with upstream_timer(upstream, operation):
+            return await method(*args, **kwargs)
+    return wrapper
+
+
+def instrument_repository(repository: Repository, upstream: str) -> Repository:
+    """Time every storage call the repository makes, labelled with the method name."""
+    for name, _ in inspect.getmembers(Repository, inspect.iscoroutinefunction):
+        if not name.startswith("_") and name != "close":
+            setattr(repository, name, _timed(upstream, name, getattr(repository, name)))
+    return repository
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording count, errors and latency per route template
+    (e.g. /wallet/balance/{address}), so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            labels = (("method", scope["method"]), ("route", route.path if route is not None else "unmatched"))
+            http_latency.observe(labels, time.perf_counter() - start)
+            http_requests.inc(labels + (("status", str(status)),))
+            if status >= 500:
+                http_errors.inc(labels)
+
+
+def render_gauges(prefix: str, stats: dict) -> List[str]:
+    """Render the numeric fields of a /stats payload as gauges named <prefix>_<field>."""
+    lines = []
+    for field, value in stats.items():
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, (int, float)):
+            lines.append(f"# TYPE {prefix}_{field} gauge")
+            lines.append(f"{prefix}_{field} {value}")
+    return lines
+
+
+def render_metrics(component_stats: Dict[str, dict]) -> str:
+    """Render every metric plus the component stats as one Prometheus text exposition."""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    for component, stats in component_stats.items():
+        lines.extend(render_gauges(component, stats))
+    return "\n".join(lines) + "\n"
@@ -6,6 +6,24 @@ from pydantic import BaseModel, EmailStr, field_validator, Field
 from typing import Optional, List
 import re
 
+from utils.config import BATCH_MAX_TRANSFERS, BALANCES_MAX_ADDRESSES
+
+
+def ethereum_address(v: str) -> str:
+    """Validate an Ethereum address and return its canonical lowercase form."""
+    if not re.match(r'^0x[a-fA-F0-9]{40}$', v):
+        raise ValueError('Invalid Ethereum address format')
+    return v.lower()
+
+
+def signature_hex(v: str) -> str:
+    """Validate a 65-byte hex signature, adding the 0x prefix if missing."""
+    if not v.startswith('0x'):
+        v = '0x' + v
+    if not re.match(r'^0x[a-fA-F0-9]{130}$', v):
+        raise ValueError('Invalid signature format')
+    return v
+
 
 class WalletCreateRequest(BaseModel):
     email: EmailStr
@@ -44,6 +62,29 @@ class BalanceResponse(BaseModel):
     balance: float
 
 
+class BalancesRequest(BaseModel):
+    addresses: List[str] = Field(min_length=1, max_length=BALANCES_MAX_ADDRESSES)
+    
+    @field_validator('addresses')
+    @classmethod
+    def validate_ethereum_addresses(cls, v: List[str]) -> List[str]:
+        return [ethereum_address(address) for address in v]
+
+
+class BalancesResponse(BaseModel):
+    balances: List[BalanceResponse]
+    unknown: List[str]
+
+
+class WalletStatsResponse(BaseModel):
+    address: str
+    total_sent: float
+    total_received: float
+    tx_count: int
+    last_activity: Optional[str] = None
+    last_transaction_id: Optional[int] = None
+
+
 # Transfer Models
 class InitiateTransferRequest(BaseModel):
     sender_address: str = Field(min_length=42, max_length=42)
@@ -54,15 +95,15 @@ class InitiateTransferRequest(BaseModel):
     @field_validator('sender_address', 'recipient_address')
     @classmethod
     def validate_ethereum_address(cls, v: str) -> str:
-        if not re.match(r'^0x[a-fA-F0-9]{40}$', v):
-            raise ValueError('Invalid Ethereum address format')
-        return v.lower()
+        return ethereum_address(v)
 
 
 class InitiateTransferResponse(BaseModel):
     approval_message: str
     eth_amount: float
     usd_amount: Optional[float] = None
+    quote_id: str
+    expires_at: str
 
 
 class ExecuteTransferRequest(BaseModel):
@@ -71,23 +112,18 @@ class ExecuteTransferRequest(BaseModel):
     eth_amount: float = Field(gt=0)
     signed_message: str
     approval_message: str = Field(min_length=10, max_length=500)
+    quote_id: str = Field(min_length=1, max_length=64)
     usd_amount: Optional[float] = Field(default=None, gt=0)
     
     @field_validator('sender_address', 'recipient_address')
     @classmethod
     def validate_ethereum_address(cls, v: str) -> str:
-        if not re.match(r'^0x[a-fA-F0-9]{40}$', v):
-            raise ValueError('Invalid Ethereum address format')
-        return v.lower()
+        return ethereum_address(v)
     
     @field_validator('signed_message')
     @classmethod
     def validate_signature(cls, v: str) -> str:
-        if not v.startswith('0x'):
-            v = '0x' + v
-        if not re.match(r'^0x[a-fA-F0-9]{130}$', v):
-            raise ValueError('Invalid signature format')
-        return v
+        return signature_hex(v)
 
 
 class ExecuteTransferResponse(BaseModel):
@@ -96,6 +132,67 @@ class ExecuteTransferResponse(BaseModel):
     transaction_id: Optional[int] = None
 
 
+# Batch Transfer Models
+class BatchTransferItem(BaseModel):
+    recipient_address: str = Field(min_length=42, max_length=42)
+    amount: float = Field(gt=0)
+    
+    @field_validator('recipient_address')
+    @classmethod
+    def validate_ethereum_address(cls, v: str) -> str:
+        return ethereum_address(v)
+
+
+class InitiateBatchTransferRequest(BaseModel):
+    sender_address: str = Field(min_length=42, max_length=42)
+    transfer_mode: str = Field(pattern='^(ETH|USD)$')
+    transfers: List[BatchTransferItem] = Field(min_length=1, max_length=BATCH_MAX_TRANSFERS)
+    
+    @field_validator('sender_address')
+    @classmethod
+    def validate_ethereum_address(cls, v: str) -> str:
+        return ethereum_address(v)
+
+
+class QuotedTransfer(BaseModel):
+    recipient_address: str
+    eth_amount: float
+    usd_amount: Optional[float] = None
+
+
+class InitiateBatchTransferResponse(BaseModel):
+    approval_message: str
+    manifest_digest: str
+    eth_total: float
+    usd_total: Optional[float] = None
+    transfers: List[QuotedTransfer]
+    quote_id: str
+    expires_at: str
+
+
+class ExecuteBatchTransferRequest(BaseModel):
+    sender_address: str = Field(min_length=42, max_length=42)
+    signed_message: str
+    approval_message: str = Field(min_length=10, max_length=500)
+    quote_id: str = Field(min_length=1, max_length=64)
+    
+    @field_validator('sender_address')
+    @classmethod
+    def validate_ethereum_address(cls, v: str) -> str:
+        return ethereum_address(v)
+    
+    @field_validator('signed_message')
+    @classmethod
+    def validate_signature(cls, v: str) -> str:
+        return signature_hex(v)
+
+
+class ExecuteBatchTransferResponse(BaseModel):
+    success: bool
+    message: str
+    transaction_ids: List[int]
+
+
 # Transaction Models
 class Transaction(BaseModel):
     id: int
@@ -108,4 +205,25 @@ class Transaction(BaseModel):
 
 class TransactionHistoryResponse(BaseModel):
     transactions: List[Transaction]
-
+    next_cursor: Optional[str] = None
+
+
+# Analytics Models
+class VolumeBucket(BaseModel):
+    bucket_start: str
+    transfers: int
+    eth_volume: float
+    usd_volume: float
+    unique_senders: int
+    p50_eth: Optional[float] = None
+    p90_eth: Optional[float] = None
+    p99_eth: Optional[float] = None
+
+
+class VolumeResponse(BaseModel):
+    interval: str
+    start: str
+    end: str
+    buckets: List[VolumeBucket]
+    cached_buckets: int
+    scanned_rows: int
@@ -0,0 +1,86 @@
+"""
+Single-value TTL cache with stale-while-revalidate and single-flight refresh.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+
+
+class PriceCache:
+    """
+    Caches one price fetched by an async `fetch` callable.
+
+    - Younger than `ttl`: served from cache.
+    - Between `ttl` and `stale_ttl`: served stale while one background refresh runs.
+    - Older than `stale_ttl` (or empty): callers wait for a refresh, and
+      `get` raises if it fails, so a value older than `stale_ttl` is never served.
+    At most one fetch is in flight at a time; concurrent callers share it.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[float]], ttl: float, stale_ttl: float):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._value: Optional[float] = None
+        self._fetched_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def age(self) -> float:
+        """Seconds since the cached value was fetched (infinite when empty)."""
+        return time.monotonic() - self._fetched_at if self._value is not None else float("inf")
+
+    async def get(self) -> Tuple[float, float]:
+        """Return (value, age_seconds)."""
+        age = self.age()
+
+        if age < self.ttl:
+            self.hits += 1
+            return self._value, age
+
+        if age < self.stale_ttl:
+            self.stale_hits += 1
+            self._start_refresh()
+            return self._value, age
+
+        self.misses += 1
+        await asyncio.shield(self._start_refresh())
+        age = self.age()
+        if age >= self.stale_ttl:
+            raise RuntimeError(f"Price refresh failed and the cached value is {age:.0f}s old")
+        return self._value, age
+
+    def _start_refresh(self) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return self._refresh_task
+
+    async def _refresh(self):
+        try:
+            value = await self._fetch()
+        except Exception:
+            self.refresh_errors += 1
+            if self._value is None:
+                raise
+            return
+        self._value = value
+        self._fetched_at = time.monotonic()
+        self.refreshes += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "value": self._value,
+            "age_seconds": round(self.age(), 3) if self._value is not None else None,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors
+        }
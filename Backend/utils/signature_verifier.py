@@ -0,0 +1,96 @@
+"""
+EIP-191 signature recovery off the event loop.
+
+Recovery uses libsecp256k1 through coincurve when it is installed and falls
+back to eth_keys otherwise. Work runs on a bounded thread pool, and recent
+(message hash, signature) -> address results are kept in an LRU so retried
+requests skip the elliptic-curve math entirely.
+"""
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from eth_hash.auto import keccak
+
+from utils.config import SIGNATURE_VERIFY_THREADS, SIGNATURE_CACHE_SIZE
+
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
+BACKEND = "coincurve" if coincurve is not None else "eth_keys"
+
+_executor = ThreadPoolExecutor(max_workers=SIGNATURE_VERIFY_THREADS, thread_name_prefix="sigverify")
+_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_counters = {"hits": 0, "misses": 0, "errors": 0}
+
+
+def message_hash(message: str) -> bytes:
+    """Keccak-256 of the EIP-191 "personal_sign" encoding of `message`."""
+    data = message.encode("utf-8")
+    return keccak(b"\x19Ethereum Signed Message:\n" + str(len(data)).encode() + data)
+
+
+def signature_bytes(signature: str) -> bytes:
+    """Decode a 65-byte hex signature and normalise v to a 0/1 recovery id."""
+    raw = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
+    if len(raw) != 65:
+        raise ValueError("Signature must be 65 bytes")
+    v = raw[64] - 27 if raw[64] >= 27 else raw[64]
+    if v not in (0, 1):
+        raise ValueError("Invalid signature recovery id")
+    return raw[:64] + bytes([v])
+
+
+def recover_from_hash(msg_hash: bytes, sig: bytes) -> str:
+    """Recover the lowercase signer address for a message hash and normalised signature."""
+    if coincurve is not None:
+        public_key = coincurve.PublicKey.from_signature_and_message(sig, msg_hash, hasher=None)
+        return "0x" + keccak(public_key.format(compressed=False)[1:])[-20:].hex()
+    from eth_keys import keys
+
+    return keys.Signature(sig).recover_public_key_from_msg_hash(msg_hash).to_address().lower()
+
+
+async def recover_address(message: str, signature: str) -> str:
+    """Recover the lowercase signer address of `message`, using the cache when possible."""
+    msg_hash = message_hash(message)
+    sig = signature_bytes(signature)
+    key = (msg_hash, sig)
+
+    address = _cache.get(key)
+    if address is not None:
+        _cache.move_to_end(key)
+        _counters["hits"] += 1
+        return address
+
+    _counters["misses"] += 1
+    try:
+        address = await asyncio.get_running_loop().run_in_executor(_executor, recover_from_hash, msg_hash, sig)
+    except Exception:
+        _counters["errors"] += 1
+        raise
+
+    _cache[key] = address
+    if len(_cache) > SIGNATURE_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return address
+
+
+def shutdown_verifier():
+    _executor.shutdown(wait=False)
+
+
+def get_verifier_stats() -> dict:
+    lookups = _counters["hits"] + _counters["misses"]
+    return {
+        "backend": BACKEND,
+        "threads": SIGNATURE_VERIFY_THREADS,
+        "cache_size": len(_cache),
+        "hits": _counters["hits"],
+        "misses": _counters["misses"],
+        "errors": _counters["errors"],
+        "hit_rate": round(_counters["hits"] / lookups, 4) if lookups else 0.0
+    }
@@ -0,0 +1,58 @@
+"""
+In-process key/value store whose entries expire after a fixed TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TTLStore:
+    """
+    Bounded mapping with per-entry expiry.
+
+    Entries are kept in insertion order, which is also expiry order because
+    every entry gets the same TTL, so expired entries are swept from the
+    front on each write. When `max_size` is reached the oldest entry is dropped.
+    Not shared between processes.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sweep(self, now: float):
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[key]
+
+    def set(self, key: str, value: Any) -> float:
+        """Store `value` under `key` and return its expiry as a time.time() timestamp."""
+        now = time.time()
+        self._sweep(now)
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+        expires_at = now + self.ttl
+        self._entries[key] = (expires_at, value)
+        return expires_at
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the live value for `key`, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    def pop(self, key: str) -> Optional[Any]:
+        """Remove `key` and return its value if it had not expired yet."""
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
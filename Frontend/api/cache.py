@@ -0,0 +1,58 @@
+"""
+Short-lived cache of balance and history responses, scoped per address.
+
+Streamlit reruns the whole page on every interaction, so without a cache each
+click re-downloads the same history page. Successful responses are kept for
+DATA_CACHE_TTL_SECONDS and shared by every session in the process. Completing
+a transfer or pressing Refresh invalidates the addresses involved, so the next
+render fetches fresh data.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+from api.wallet_api import get_balance
+from api.transfer_api import get_transaction_history
+from utils.config import DATA_CACHE_TTL_SECONDS, DATA_CACHE_MAX_ADDRESSES, HISTORY_PAGE_SIZE
+
+# address -> {request key: (expires_at, result)}, least recently used first
+_entries: "OrderedDict[str, dict]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _cached(address: str, key: tuple, fetch: Callable[[], Tuple[bool, object]]) -> Tuple[bool, object]:
+    address = address.lower()
+    with _lock:
+        entry = _entries.get(address, {}).get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            _entries.move_to_end(address)
+            return True, entry[1]
+
+    success, result = fetch()
+    # Errors are not cached, so the next render retries
+    if success:
+        with _lock:
+            _entries.setdefault(address, {})[key] = (time.monotonic() + DATA_CACHE_TTL_SECONDS, result)
+            _entries.move_to_end(address)
+            while len(_entries) > DATA_CACHE_MAX_ADDRESSES:
+                _entries.popitem(last=False)
+    return success, result
+
+
+def cached_balance(address: str):
+    """get_balance, served from the cache while fresh."""
+    return _cached(address, ("balance",), lambda: get_balance(address))
+
+
+def cached_transaction_history(address: str, before: str = None, limit: int = HISTORY_PAGE_SIZE):
+    """get_transaction_history for one page, served from the cache while fresh."""
+    return _cached(address, ("history", before, limit), lambda: get_transaction_history(address, before, limit))
+
+
+def invalidate(*addresses: str):
+    """Drop everything cached for these addresses."""
+    with _lock:
+        for address in addresses:
+            _entries.pop(address.lower(), None)
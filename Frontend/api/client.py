@@ -0,0 +1,91 @@
+"""
+Shared HTTP client for the backend API.
+
+One requests.Session per process keeps connections to the backend alive
+across Streamlit reruns and user sessions instead of opening a new TCP
+connection for every call. Every call has a connect and read timeout, so a
+hung backend surfaces as an error instead of freezing the UI. GETs are
+retried a bounded number of times on connection errors and gateway
+responses; POSTs are only retried when the connection could not be opened,
+since the request never reached the backend. Each call's response time is
+logged, and slow calls are logged as warnings.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.config import (
+    BACKEND_URL,
+    API_CONNECT_TIMEOUT_SECONDS,
+    API_READ_TIMEOUT_SECONDS,
+    API_GET_MAX_RETRIES,
+    API_POOL_SIZE,
+    API_SLOW_REQUEST_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                retry = Retry(
+                    total=API_GET_MAX_RETRIES,
+                    # Read errors and error statuses are only retried for these methods
+                    allowed_methods={"GET"},
+                    status_forcelist={502, 503, 504},
+                    backoff_factor=0.3,
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=API_POOL_SIZE, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def request(method: str, path: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+    """Call the backend at BACKEND_URL + path; `timeout` overrides the read timeout."""
+    start = time.perf_counter()
+    status = "error"
+    try:
+        response = get_session().request(
+            method, f"{BACKEND_URL}{path}",
+            timeout=(API_CONNECT_TIMEOUT_SECONDS, timeout or API_READ_TIMEOUT_SECONDS),
+            **kwargs
+        )
+        status = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        level = logging.WARNING if elapsed >= API_SLOW_REQUEST_SECONDS else logging.INFO
+        logger.log(level, "%s %s -> %s in %.0f ms", method, path, status, elapsed * 1000)
+
+
+def get(path: str, params: dict = None, timeout: Optional[float] = None) -> requests.Response:
+    return request("GET", path, timeout=timeout, params=params)
+
+
+def post(path: str, json: dict = None, headers: dict = None, timeout: Optional[float] = None) -> requests.Response:
+    return request("POST", path, timeout=timeout, json=json, headers=headers)
+
+
+def error_message(response: requests.Response) -> str:
+    """The backend's error detail, or the status code if the body is not JSON."""
+    try:
+        return f"Error: {response.json().get('detail', 'Unknown error')}"
+    except ValueError:
+        return f"Error: HTTP {response.status_code}"
@@ -0,0 +1,94 @@
+"""
+Live balance and transaction updates from the backend's event stream.
+
+For every address a page is showing, one background thread per process
+holds a GET /wallet/events stream open. Each event invalidates the
+address's cached balance and history and bumps its change counter; pages
+poll `watch` and rerun when the counter moves, so incoming transfers show
+up without pressing Refresh. A stream that drops is reopened after
+LIVE_UPDATE_RETRY_SECONDS (changes missed meanwhile are covered by the
+invalidation on reconnect), and a thread exits once no page has watched
+its address for LIVE_UPDATE_IDLE_SECONDS.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict
+
+import requests
+
+from api.cache import invalidate
+from utils.config import (
+    BACKEND_URL,
+    API_CONNECT_TIMEOUT_SECONDS,
+    LIVE_UPDATE_READ_TIMEOUT_SECONDS,
+    LIVE_UPDATE_IDLE_SECONDS,
+    LIVE_UPDATE_RETRY_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+# address -> number of changes seen, and when a page last asked about it
+_changes: Dict[str, int] = {}
+_watched_at: Dict[str, float] = {}
+_listeners: Dict[str, threading.Thread] = {}
+_lock = threading.Lock()
+
+
+def watch(address: str) -> int:
+    """Keep a stream open for `address` and return its change counter."""
+    address = address.lower()
+    with _lock:
+        _watched_at[address] = time.monotonic()
+        listener = _listeners.get(address)
+        if listener is None or not listener.is_alive():
+            listener = threading.Thread(target=_listen, args=(address,), name=f"live-{address[:10]}", daemon=True)
+            _listeners[address] = listener
+            listener.start()
+        return _changes.get(address, 0)
+
+
+def _idle(address: str) -> bool:
+    with _lock:
+        if time.monotonic() - _watched_at.get(address, 0) < LIVE_UPDATE_IDLE_SECONDS:
+            return False
+        _listeners.pop(address, None)
+        _watched_at.pop(address, None)
+        return True
+
+
+def _changed(address: str):
+    invalidate(address)
+    with _lock:
+        _changes[address] = _changes.get(address, 0) + 1
+
+
+def _listen(address: str):
+    connected_before = False
+    while not _idle(address):
+        try:
+            with requests.get(
+                f"{BACKEND_URL}/wallet/events",
+                params={"address": address},
+                stream=True,
+                timeout=(API_CONNECT_TIMEOUT_SECONDS, LIVE_UPDATE_READ_TIMEOUT_SECONDS)
+            ) as response:
+                if response.status_code != 200:
+                    raise requests.HTTPError(f"HTTP {response.status_code}")
+                event = None
+                for line in response.iter_lines(decode_unicode=True):
+                    if line.startswith("event:"):
+                        event = line[len("event:"):].strip()
+                    elif not line and event is not None:
+                        # The snapshot on a reconnect covers whatever happened while disconnected
+                        if event != "snapshot" or connected_before:
+                            _changed(address)
+                        connected_before = True
+                        event = None
+                    # The backend sends a heartbeat at least every 15 seconds, so this also runs on a quiet address
+                    if _idle(address):
+                        return
+        except Exception as e:
+            logger.info("Live updates for %s interrupted: %s", address, e)
+        time.sleep(LIVE_UPDATE_RETRY_SECONDS)
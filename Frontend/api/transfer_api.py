@@ -1,11 +1,16 @@
+import time
 import requests
-from utils.config import BACKEND_URL
+from api import client
+from utils.config import HISTORY_PAGE_SIZE, EXECUTE_TIMEOUT_SECONDS, EXECUTE_MAX_ATTEMPTS
+
+# Gateway errors that a retry with the same Idempotency-Key can safely resolve
+RETRYABLE_STATUS_CODES = {502, 503, 504}
 
 
 def initiate_transfer(sender_address: str, recipient_address: str, amount: float, transfer_mode: str):
     """Initiate transfer via API. Returns: (success: bool, data_or_message: dict/str)"""
     try:
-        response = requests.post(f"{BACKEND_URL}/transfer/initiate", json={
+        response = client.post("/transfer/initiate", json={
             "sender_address": sender_address,
             "recipient_address": recipient_address,
             "amount": amount,
@@ -14,39 +19,62 @@ def initiate_transfer(sender_address: str, recipient_address: str, amount: float
         
         if response.status_code == 200:
             return True, response.json()
-        return False, f"Error: {response.json().get('detail', 'Unknown error')}"
+        return False, client.error_message(response)
     except Exception as e:
         return False, f"Error preparing transfer: {str(e)}"
 
 
 def execute_transfer(sender_address: str, recipient_address: str, eth_amount: float, 
-                     signed_message: str, approval_message: str, usd_amount: float = None):
-    """Execute transfer via API. Returns: (success: bool, data_or_message: dict/str)"""
-    try:
-        response = requests.post(f"{BACKEND_URL}/transfer/execute", json={
-            "sender_address": sender_address,
-            "recipient_address": recipient_address,
-            "eth_amount": eth_amount,
-            "signed_message": signed_message,
-            "approval_message": approval_message,
-            "usd_amount": usd_amount
-        })
+                     signed_message: str, approval_message: str, quote_id: str, usd_amount: float = None,
+                     idempotency_key: str = None):
+    """
+    Execute transfer via API. Returns: (success: bool, data_or_message: dict/str)
+    With an idempotency key, timeouts and gateway errors are retried with the
+    same key, so the backend applies the transfer at most once.
+    """
+    payload = {
+        "sender_address": sender_address,
+        "recipient_address": recipient_address,
+        "eth_amount": eth_amount,
+        "signed_message": signed_message,
+        "approval_message": approval_message,
+        "quote_id": quote_id,
+        "usd_amount": usd_amount
+    }
+    headers = {"Idempotency-Key": idempotency_key} if idempotency_key else {}
+    attempts = EXECUTE_MAX_ATTEMPTS if idempotency_key else 1
+    
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(min(0.5 * 2 ** (attempt - 1), 4))
+        try:
+            response = client.post("/transfer/execute", json=payload, headers=headers,
+                                   timeout=EXECUTE_TIMEOUT_SECONDS)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if attempt + 1 < attempts:
+                continue
+            return False, f"Error executing transfer: {str(e)}"
+        except Exception as e:
+            return False, f"Error executing transfer: {str(e)}"
         
+        if response.status_code in RETRYABLE_STATUS_CODES and attempt + 1 < attempts:
+            continue
         if response.status_code == 200:
             return True, response.json()
-        return False, f"Error: {response.json().get('detail', 'Unknown error')}"
-    except Exception as e:
-        return False, f"Error executing transfer: {str(e)}"
+        return False, client.error_message(response)
 
 
-def get_transaction_history(address: str):
-    """Get transaction history via API. Returns: (success: bool, transactions_or_message: list/str)"""
+def get_transaction_history(address: str, before: str = None, limit: int = HISTORY_PAGE_SIZE):
+    """Get one page of transaction history via API. Returns: (success: bool, page_or_message: dict/str)"""
     try:
-        response = requests.get(f"{BACKEND_URL}/transaction/history/{address}")
+        params = {"limit": limit}
+        if before:
+            params["before"] = before
+        response = client.get(f"/transaction/history/{address}", params=params)
         
         if response.status_code == 200:
-            return True, response.json()["transactions"]
-        return False, f"Error: {response.json().get('detail', 'Unknown error')}"
+            return True, response.json()
+        return False, client.error_message(response)
     except Exception as e:
         return False, f"Error fetching transaction history: {str(e)}"
 
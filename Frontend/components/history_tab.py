@@ -1,25 +1,48 @@
 import streamlit as st
-from api.transfer_api import get_transaction_history
+from api.cache import cached_transaction_history, invalidate
 
 
 def render_history_tab():
     st.markdown("### Transaction History")
     
+    # Cursors of the pages before the current one, for the "Newer" button
+    if "history_cursors" not in st.session_state:
+        st.session_state.history_cursors = [None]
+    
     if st.button("🔄 Refresh History"):
+        st.session_state.history_cursors = [None]
+        invalidate(st.session_state.address)
         st.rerun()
     
-    success, result = get_transaction_history(st.session_state.address)
+    success, result = cached_transaction_history(st.session_state.address, before=st.session_state.history_cursors[-1])
     
     if success:
-        if len(result) == 0:
+        transactions = result["transactions"]
+        if len(transactions) == 0:
             st.info("No transactions yet")
         else:
-            for tx in result:
+            for tx in transactions:
                 render_transaction(tx)
+        render_pagination(result.get("next_cursor"))
     else:
         st.error(result)
 
 
+def render_pagination(next_cursor: str):
+    cursors = st.session_state.history_cursors
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if len(cursors) > 1 and st.button("⬅️ Newer", use_container_width=True):
+            cursors.pop()
+            st.rerun()
+    
+    with col2:
+        if next_cursor and st.button("Older ➡️", use_container_width=True):
+            cursors.append(next_cursor)
+            st.rerun()
+
+
 def render_transaction(tx: dict):
     is_outgoing = tx["sender_address"].lower() == st.session_state.address.lower()
     usd_part = f" (${tx['amount_usd']:.2f} USD)" if tx['amount_usd'] else ""
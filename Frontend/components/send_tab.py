@@ -2,9 +2,10 @@
 Send transaction tab component.
 """
 
+import uuid
 import streamlit as st
 from api.transfer_api import initiate_transfer, execute_transfer
-from api.wallet_api import get_balance
+from api.cache import cached_balance, invalidate
 from utils.session_manager import (
     set_pending_transfer, 
     clear_pending_transfer, 
@@ -66,7 +67,10 @@ def render_send_tab():
                         "recipient": recipient,
                         "eth_amount": result["eth_amount"],
                         "usd_amount": result.get("usd_amount"),
-                        "approval_message": result["approval_message"]
+                        "approval_message": result["approval_message"],
+                        "quote_id": result["quote_id"],
+                        # Reused if Confirm is pressed again, so a retry cannot send twice
+                        "idempotency_key": str(uuid.uuid4())
                     }
                     set_pending_transfer(transfer_data)
                     st.info(f"📋 **Approval Message:**\n\n{result['approval_message']}")
@@ -133,15 +137,18 @@ def render_pending_transfer():
                     pending["eth_amount"],
                     signature,
                     pending["approval_message"],
-                    pending.get("usd_amount")
+                    pending["quote_id"],
+                    pending.get("usd_amount"),
+                    pending.get("idempotency_key")
                 )
                 
                 if success:
                     st.success(f"✅ {result['message']}")
                     clear_pending_transfer()
                     
-                    # Refresh balance
-                    success_balance, new_balance = get_balance(st.session_state.address)
+                    # Both sides' balances and histories changed
+                    invalidate(st.session_state.address, pending["recipient"])
+                    success_balance, new_balance = cached_balance(st.session_state.address)
                     if success_balance:
                         update_balance(new_balance)
                     
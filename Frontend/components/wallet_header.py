@@ -1,6 +1,8 @@
 import streamlit as st
 from datetime import datetime, timedelta
-from api.wallet_api import get_balance
+from api.cache import cached_balance, invalidate
+from api.live_updates import watch
+from utils.config import LIVE_UPDATE_CHECK_SECONDS
 from utils.session_manager import clear_wallet_data, update_balance, check_session_expiry
 
 
@@ -14,7 +16,7 @@ def render_wallet_header():
     
     with col1:
         st.markdown(f"**Address:** `{st.session_state.address}`")
-        st.markdown(f"**Balance:** {st.session_state.balance:.6f} ETH")
+        render_balance()
     
     with col2:
         if st.session_state.session_start:
@@ -29,7 +31,8 @@ def render_wallet_header():
     
     with col3:
         if st.button("🔄 Refresh", use_container_width=True):
-            success, result = get_balance(st.session_state.address)
+            invalidate(st.session_state.address)
+            success, result = cached_balance(st.session_state.address)
             if success:
                 update_balance(result)
                 st.success("Balance refreshed!")
@@ -48,3 +51,20 @@ def render_wallet_header():
         st.code(st.session_state.mnemonic, language=None)
         st.warning("⚠️ Never share your mnemonic phrase with anyone!")
 
+
+@st.fragment(run_every=LIVE_UPDATE_CHECK_SECONDS)
+def render_balance():
+    """Show the balance, rerunning the page when the live stream reports a change to this wallet."""
+    address = st.session_state.address
+    if not address:
+        return
+    changes = watch(address)
+    seen = st.session_state.get("live_changes")
+    st.session_state.live_changes = (address, changes)
+    if seen is not None and seen != (address, changes):
+        success, result = cached_balance(address)
+        if success:
+            update_balance(result)
+        st.rerun()
+    
+    st.markdown(f"**Balance:** {st.session_state.balance:.6f} ETH")
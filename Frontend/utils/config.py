@@ -11,6 +11,30 @@ load_dotenv()
 # Backend API URL
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+# Backend HTTP client: pooled keep-alive connections, per-call timeouts, bounded GET retries
+API_CONNECT_TIMEOUT_SECONDS = 3.05
+API_READ_TIMEOUT_SECONDS = float(os.getenv("API_READ_TIMEOUT_SECONDS", "15"))
+API_GET_MAX_RETRIES = 2
+API_POOL_SIZE = 10
+API_SLOW_REQUEST_SECONDS = 1.0
+
+# Transfer execution: per-attempt timeout and attempts, retried under one Idempotency-Key
+EXECUTE_TIMEOUT_SECONDS = 10
+EXECUTE_MAX_ATTEMPTS = 4
+
+# Transactions shown per history page
+HISTORY_PAGE_SIZE = 20
+
+# Balance and history responses are reused across reruns for this long, per address
+DATA_CACHE_TTL_SECONDS = float(os.getenv("DATA_CACHE_TTL_SECONDS", "30"))
+DATA_CACHE_MAX_ADDRESSES = 1000
+
+# Live updates: one event stream per watched address; pages check for changes this often
+LIVE_UPDATE_CHECK_SECONDS = 2.0
+LIVE_UPDATE_READ_TIMEOUT_SECONDS = 45.0
+LIVE_UPDATE_IDLE_SECONDS = 60.0
+LIVE_UPDATE_RETRY_SECONDS = 3.0
+
 # Page Configuration
 PAGE_TITLE = "Mock Web3 Wallet"
 PAGE_ICON = "💰"
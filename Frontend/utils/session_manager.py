@@ -76,6 +76,9 @@ def clear_wallet_data():
     st.session_state.jwt_token = None
     st.session_state.session_start = None
     
+    if hasattr(st.session_state, "history_cursors"):
+        del st.session_state.history_cursors
+    
     try:
         set_cookie("wallet_token", "", max_age=0)
     except: